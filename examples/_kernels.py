@@ -0,0 +1,62 @@
+"""
+Numeric kernels for the market scanner
+
+Compiled with Numba when it is installed; otherwise the NumPy fallbacks
+below are bound to the same names, so callers never need to check which
+variant they got. cache=True persists the compiled code on disk so only
+the very first run pays the compile cost.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # keep the dependency optional
+    njit = None
+
+
+def _score_momentum_py(volume, change_pct, min_mom):
+    """Vectorized fallback matching the jitted kernel's signature"""
+    abs_change = np.abs(change_pct)
+    mask = abs_change >= min_mom
+    score = np.minimum(volume / 1e6, 10.0) + abs_change / 10.0
+    return mask, score
+
+
+def _rsi_approx_py(change_pct):
+    """Vectorized fallback matching the jitted kernel's signature"""
+    return np.clip(50.0 + change_pct * 2.0, 0.0, 100.0)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def score_momentum(volume, change_pct, min_mom):
+        """Momentum mask and score for each ticker in one fused loop"""
+        n = volume.shape[0]
+        mask = np.empty(n, dtype=np.bool_)
+        score = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            c = abs(change_pct[i])
+            mask[i] = c >= min_mom
+            vs = volume[i] / 1e6
+            if vs > 10.0:
+                vs = 10.0
+            score[i] = vs + c / 10.0
+        return mask, score
+
+    @njit(cache=True, fastmath=True)
+    def rsi_approx(change_pct):
+        """Rough RSI approximation from 24hr change, clipped to [0, 100]"""
+        n = change_pct.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            r = 50.0 + change_pct[i] * 2.0
+            if r < 0.0:
+                r = 0.0
+            elif r > 100.0:
+                r = 100.0
+            out[i] = r
+        return out
+else:
+    score_momentum = _score_momentum_py
+    rsi_approx = _rsi_approx_py
@@ -1,448 +1,734 @@
-"""
-Aster SDK - Advanced Position Management System
-Professional position tracking with P&L calculation and risk management
-"""
-
-import sys
-import os
-import time
-import json
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from aster_auth import AsterAuthenticatedClient
-from aster_example_utils import format_price, save_data_to_file
-
-
-@dataclass
-class Position:
-    """Position representation"""
-    symbol: str
-    size: float  # Position size (positive for long, negative for short)
-    entry_price: float
-    mark_price: float
-    unrealized_pnl: float
-    realized_pnl: float
-    margin: float
-    leverage: float
-    liquidation_price: float
-    timestamp: datetime
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert position to dictionary"""
-        return {
-            'symbol': self.symbol,
-            'size': self.size,
-            'entry_price': self.entry_price,
-            'mark_price': self.mark_price,
-            'unrealized_pnl': self.unrealized_pnl,
-            'realized_pnl': self.realized_pnl,
-            'margin': self.margin,
-            'leverage': self.leverage,
-            'liquidation_price': self.liquidation_price,
-            'timestamp': self.timestamp.isoformat()
-        }
-
-
-@dataclass
-class PositionMetrics:
-    """Position metrics and statistics"""
-    total_unrealized_pnl: float
-    total_realized_pnl: float
-    total_margin: float
-    total_exposure: float
-    portfolio_value: float
-    margin_ratio: float
-    risk_score: float
-    largest_position: Optional[Position]
-    most_profitable: Optional[Position]
-    most_losing: Optional[Position]
-
-
-class PositionManager:
-    """Advanced position management system"""
-    
-    def __init__(self, api_key: str, secret_key: str):
-        """
-        Initialize position manager
-        
-        Args:
-            api_key: Aster API key
-            secret_key: Aster secret key
-        """
-        self.client = AsterAuthenticatedClient(api_key, secret_key)
-        self.positions: Dict[str, Position] = {}
-        self.position_history: List[Position] = []
-        self.pnl_history: List[Dict[str, Any]] = []
-    
-    def fetch_positions(self) -> List[Position]:
-        """
-        Fetch current positions from API
-        
-        Returns:
-            List of current positions
-        """
-        try:
-            response = self.client.get_positions()
-            
-            if response.get('status') == 'ok':
-                positions_data = response.get('data', [])
-                positions = []
-                
-                for pos_data in positions_data:
-                    position = Position(
-                        symbol=pos_data.get('symbol', ''),
-                        size=float(pos_data.get('positionAmt', 0)),
-                        entry_price=float(pos_data.get('entryPrice', 0)),
-                        mark_price=float(pos_data.get('markPrice', 0)),
-                        unrealized_pnl=float(pos_data.get('unrealizedPnl', 0)),
-                        realized_pnl=float(pos_data.get('realizedPnl', 0)),
-                        margin=float(pos_data.get('isolatedMargin', 0)),
-                        leverage=float(pos_data.get('leverage', 1)),
-                        liquidation_price=float(pos_data.get('liquidationPrice', 0)),
-                        timestamp=datetime.now()
-                    )
-                    
-                    # Only include positions with non-zero size
-                    if position.size != 0:
-                        positions.append(position)
-                        self.positions[position.symbol] = position
-                
-                return positions
-            else:
-                print(f"Error fetching positions: {response}")
-                return []
-                
-        except Exception as e:
-            print(f"Error fetching positions: {e}")
-            return []
-    
-    def calculate_position_metrics(self) -> PositionMetrics:
-        """
-        Calculate position metrics and statistics
-        
-        Returns:
-            Position metrics
-        """
-        if not self.positions:
-            return PositionMetrics(
-                total_unrealized_pnl=0.0,
-                total_realized_pnl=0.0,
-                total_margin=0.0,
-                total_exposure=0.0,
-                portfolio_value=0.0,
-                margin_ratio=0.0,
-                risk_score=0.0,
-                largest_position=None,
-                most_profitable=None,
-                most_losing=None
-            )
-        
-        total_unrealized_pnl = sum(pos.unrealized_pnl for pos in self.positions.values())
-        total_realized_pnl = sum(pos.realized_pnl for pos in self.positions.values())
-        total_margin = sum(pos.margin for pos in self.positions.values())
-        total_exposure = sum(abs(pos.size * pos.mark_price) for pos in self.positions.values())
-        
-        # Calculate portfolio value (simplified)
-        portfolio_value = total_margin + total_unrealized_pnl
-        
-        # Calculate margin ratio
-        margin_ratio = (total_margin / total_exposure * 100) if total_exposure > 0 else 0
-        
-        # Calculate risk score (simplified)
-        risk_score = min(100, (total_exposure / portfolio_value * 100)) if portfolio_value > 0 else 0
-        
-        # Find extreme positions
-        largest_position = max(self.positions.values(), key=lambda p: abs(p.size * p.mark_price)) if self.positions else None
-        most_profitable = max(self.positions.values(), key=lambda p: p.unrealized_pnl) if self.positions else None
-        most_losing = min(self.positions.values(), key=lambda p: p.unrealized_pnl) if self.positions else None
-        
-        return PositionMetrics(
-            total_unrealized_pnl=total_unrealized_pnl,
-            total_realized_pnl=total_realized_pnl,
-            total_margin=total_margin,
-            total_exposure=total_exposure,
-            portfolio_value=portfolio_value,
-            margin_ratio=margin_ratio,
-            risk_score=risk_score,
-            largest_position=largest_position,
-            most_profitable=most_profitable,
-            most_losing=most_losing
-        )
-    
-    def display_positions(self):
-        """Display current positions"""
-        print("\nCURRENT POSITIONS")
-        print("=" * 100)
-        
-        if not self.positions:
-            print("No open positions")
-            return
-        
-        print(f"{'Symbol':<12} {'Size':<15} {'Entry':<12} {'Mark':<12} {'Unrealized P&L':<15} {'Margin':<12} {'Leverage':<10}")
-        print("-" * 100)
-        
-        for position in self.positions.values():
-            pnl_str = f"{position.unrealized_pnl:+.2f}"
-            if position.unrealized_pnl > 0:
-                pnl_str = f"+{position.unrealized_pnl:.2f}"
-            elif position.unrealized_pnl < 0:
-                pnl_str = f"{position.unrealized_pnl:.2f}"
-            else:
-                pnl_str = "0.00"
-            
-            print(f"{position.symbol:<12} {position.size:<15.6f} {format_price(position.entry_price):<12} "
-                  f"{format_price(position.mark_price):<12} {pnl_str:<15} {format_price(position.margin):<12} "
-                  f"{position.leverage:<10.1f}x")
-    
-    def display_position_metrics(self):
-        """Display position metrics and statistics"""
-        metrics = self.calculate_position_metrics()
-        
-        print("\nPOSITION METRICS")
-        print("=" * 50)
-        print(f"Total Unrealized P&L: {format_price(metrics.total_unrealized_pnl)}")
-        print(f"Total Realized P&L: {format_price(metrics.total_realized_pnl)}")
-        print(f"Total Margin: {format_price(metrics.total_margin)}")
-        print(f"Total Exposure: {format_price(metrics.total_exposure)}")
-        print(f"Portfolio Value: {format_price(metrics.portfolio_value)}")
-        print(f"Margin Ratio: {metrics.margin_ratio:.2f}%")
-        print(f"Risk Score: {metrics.risk_score:.2f}%")
-        
-        if metrics.largest_position:
-            print(f"\nLargest Position: {metrics.largest_position.symbol} "
-                  f"({format_price(abs(metrics.largest_position.size * metrics.largest_position.mark_price))})")
-        
-        if metrics.most_profitable:
-            print(f"Most Profitable: {metrics.most_profitable.symbol} "
-                  f"({format_price(metrics.most_profitable.unrealized_pnl)})")
-        
-        if metrics.most_losing:
-            print(f"Most Losing: {metrics.most_losing.symbol} "
-                  f"({format_price(metrics.most_losing.unrealized_pnl)})")
-    
-    def analyze_position_risk(self, symbol: str) -> Dict[str, Any]:
-        """
-        Analyze risk for a specific position
-        
-        Args:
-            symbol: Trading symbol
-            
-        Returns:
-            Risk analysis
-        """
-        if symbol not in self.positions:
-            return {'error': 'Position not found'}
-        
-        position = self.positions[symbol]
-        
-        # Calculate risk metrics
-        exposure = abs(position.size * position.mark_price)
-        margin_ratio = (position.margin / exposure * 100) if exposure > 0 else 0
-        
-        # Calculate distance to liquidation
-        if position.liquidation_price > 0:
-            if position.size > 0:  # Long position
-                liquidation_distance = ((position.mark_price - position.liquidation_price) / position.mark_price * 100)
-            else:  # Short position
-                liquidation_distance = ((position.liquidation_price - position.mark_price) / position.mark_price * 100)
-        else:
-            liquidation_distance = 0
-        
-        # Risk assessment
-        risk_level = "LOW"
-        if margin_ratio < 20 or liquidation_distance < 10:
-            risk_level = "HIGH"
-        elif margin_ratio < 40 or liquidation_distance < 20:
-            risk_level = "MEDIUM"
-        
-        return {
-            'symbol': symbol,
-            'exposure': exposure,
-            'margin_ratio': margin_ratio,
-            'liquidation_distance': liquidation_distance,
-            'risk_level': risk_level,
-            'recommendation': self._get_risk_recommendation(risk_level, margin_ratio, liquidation_distance)
-        }
-    
-    def _get_risk_recommendation(self, risk_level: str, margin_ratio: float, liquidation_distance: float) -> str:
-        """Get risk management recommendation"""
-        if risk_level == "HIGH":
-            if margin_ratio < 20:
-                return "Consider reducing position size or adding margin"
-            elif liquidation_distance < 10:
-                return "URGENT: Position at high liquidation risk"
-            else:
-                return "Monitor position closely"
-        elif risk_level == "MEDIUM":
-            return "Consider risk management strategies"
-        else:
-            return "Position risk is acceptable"
-    
-    def get_portfolio_summary(self) -> Dict[str, Any]:
-        """
-        Get comprehensive portfolio summary
-        
-        Returns:
-            Portfolio summary
-        """
-        metrics = self.calculate_position_metrics()
-        
-        # Get account info
-        try:
-            account_info = self.client.get_account_info()
-            account_data = account_info.get('data', {}) if account_info.get('status') == 'ok' else {}
-        except:
-            account_data = {}
-        
-        summary = {
-            'timestamp': datetime.now().isoformat(),
-            'total_positions': len(self.positions),
-            'metrics': {
-                'total_unrealized_pnl': metrics.total_unrealized_pnl,
-                'total_realized_pnl': metrics.total_realized_pnl,
-                'total_margin': metrics.total_margin,
-                'total_exposure': metrics.total_exposure,
-                'portfolio_value': metrics.portfolio_value,
-                'margin_ratio': metrics.margin_ratio,
-                'risk_score': metrics.risk_score
-            },
-            'positions': [pos.to_dict() for pos in self.positions.values()],
-            'account_info': account_data
-        }
-        
-        return summary
-    
-    def export_positions(self, filename: Optional[str] = None):
-        """Export positions to JSON"""
-        if filename is None:
-            filename = f"aster_positions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        summary = self.get_portfolio_summary()
-        save_data_to_file(summary, filename)
-        print(f"Positions exported to {filename}")
-    
-    def monitor_positions(self, interval: int = 30):
-        """
-        Monitor positions in real-time
-        
-        Args:
-            interval: Monitoring interval in seconds
-        """
-        print(f"Starting position monitoring (interval: {interval}s)")
-        print("Press Ctrl+C to stop")
-        
-        try:
-            while True:
-                # Clear screen
-                os.system('cls' if os.name == 'nt' else 'clear')
-                
-                print("ASTER POSITION MONITOR")
-                print("=" * 50)
-                print(f"Last Update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Fetch and display positions
-                self.fetch_positions()
-                self.display_positions()
-                self.display_position_metrics()
-                
-                print(f"\nNext update in {interval} seconds...")
-                time.sleep(interval)
-                
-        except KeyboardInterrupt:
-            print("\nPosition monitoring stopped")
-
-
-def main():
-    """Main function for position management demo"""
-    print("ASTER SDK - ADVANCED POSITION MANAGEMENT")
-    print("=" * 50)
-    
-    # You would need to provide actual API credentials
-    api_key = "your_api_key_here"
-    secret_key = "your_secret_key_here"
-    
-    if api_key == "your_api_key_here":
-        print("Please set your actual API credentials to use position management")
-        print("You can edit the main() function with your credentials")
-        return
-    
-    try:
-        # Initialize position manager
-        position_manager = PositionManager(api_key, secret_key)
-        
-        while True:
-            print("\nPosition Management Options:")
-            print("1. View current positions")
-            print("2. View position metrics")
-            print("3. Analyze position risk")
-            print("4. Get portfolio summary")
-            print("5. Export positions")
-            print("6. Monitor positions (real-time)")
-            print("0. Exit")
-            
-            choice = input("\nEnter your choice (0-6): ").strip()
-            
-            if choice == "0":
-                print("Goodbye!")
-                break
-            elif choice == "1":
-                # View positions
-                position_manager.fetch_positions()
-                position_manager.display_positions()
-                
-            elif choice == "2":
-                # View metrics
-                position_manager.fetch_positions()
-                position_manager.display_position_metrics()
-                
-            elif choice == "3":
-                # Analyze risk
-                symbol = input("Enter symbol to analyze: ").strip().upper()
-                position_manager.fetch_positions()
-                risk_analysis = position_manager.analyze_position_risk(symbol)
-                
-                if 'error' in risk_analysis:
-                    print(f"Error: {risk_analysis['error']}")
-                else:
-                    print(f"\nRisk Analysis for {symbol}:")
-                    print(f"Exposure: {format_price(risk_analysis['exposure'])}")
-                    print(f"Margin Ratio: {risk_analysis['margin_ratio']:.2f}%")
-                    print(f"Liquidation Distance: {risk_analysis['liquidation_distance']:.2f}%")
-                    print(f"Risk Level: {risk_analysis['risk_level']}")
-                    print(f"Recommendation: {risk_analysis['recommendation']}")
-                    
-            elif choice == "4":
-                # Portfolio summary
-                position_manager.fetch_positions()
-                summary = position_manager.get_portfolio_summary()
-                print(f"\nPortfolio Summary:")
-                print(f"Total Positions: {summary['total_positions']}")
-                print(f"Portfolio Value: {format_price(summary['metrics']['portfolio_value'])}")
-                print(f"Total P&L: {format_price(summary['metrics']['total_unrealized_pnl'])}")
-                print(f"Risk Score: {summary['metrics']['risk_score']:.2f}%")
-                
-            elif choice == "5":
-                # Export positions
-                position_manager.fetch_positions()
-                position_manager.export_positions()
-                
-            elif choice == "6":
-                # Monitor positions
-                interval = input("Enter monitoring interval in seconds (default 30): ").strip()
-                interval = int(interval) if interval.isdigit() else 30
-                position_manager.monitor_positions(interval)
-                
-            else:
-                print("Invalid choice. Please try again.")
-    
-    except Exception as e:
-        print(f"Error in position management: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    main()
+"""
+Aster SDK - Advanced Position Management System
+Professional position tracking with P&L calculation and risk management
+"""
+
+import sys
+import os
+import time
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+
+import numpy as np
+import orjson
+import websocket
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aster_auth import AsterAuthenticatedClient
+from aster_example_utils import format_price
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _reduce_positions(size, mark, upnl, rpnl, margin):
+        """Fused single-pass reduction over the SoA position columns"""
+        tu = tr = tm = te = 0.0
+        largest = -1.0
+        i_largest = i_prof = i_lose = 0
+        for i in range(size.shape[0]):
+            notional = abs(size[i] * mark[i])
+            tu += upnl[i]
+            tr += rpnl[i]
+            tm += margin[i]
+            te += notional
+            if notional > largest:
+                largest = notional
+                i_largest = i
+            if upnl[i] > upnl[i_prof]:
+                i_prof = i
+            if upnl[i] < upnl[i_lose]:
+                i_lose = i
+        return tu, tr, tm, te, i_largest, i_prof, i_lose
+else:
+    _reduce_positions = None
+
+
+def _parse_position(pos_data: Dict[str, Any], now: datetime) -> 'Position':
+    """
+    Parse one positionRisk row into a Position
+
+    The response schema is fixed, so the fast path subscripts every field
+    directly — no per-field default-dict machinery; rows missing fields
+    fall back to the defensive .get() path.
+    """
+    try:
+        size = float(pos_data['positionAmt'])
+        mark_price = float(pos_data['markPrice'])
+        return Position(
+            symbol=pos_data['symbol'],
+            size=size,
+            entry_price=float(pos_data['entryPrice']),
+            mark_price=mark_price,
+            unrealized_pnl=float(pos_data['unrealizedPnl']),
+            realized_pnl=float(pos_data['realizedPnl']),
+            margin=float(pos_data['isolatedMargin']),
+            leverage=float(pos_data['leverage']),
+            liquidation_price=float(pos_data['liquidationPrice']),
+            timestamp=now,
+            exposure=abs(size * mark_price)
+        )
+    except KeyError:
+        size = float(pos_data.get('positionAmt', 0))
+        mark_price = float(pos_data.get('markPrice', 0))
+        return Position(
+            symbol=pos_data.get('symbol', ''),
+            size=size,
+            entry_price=float(pos_data.get('entryPrice', 0)),
+            mark_price=mark_price,
+            unrealized_pnl=float(pos_data.get('unrealizedPnl', 0)),
+            realized_pnl=float(pos_data.get('realizedPnl', 0)),
+            margin=float(pos_data.get('isolatedMargin', 0)),
+            leverage=float(pos_data.get('leverage', 1)),
+            liquidation_price=float(pos_data.get('liquidationPrice', 0)),
+            timestamp=now,
+            exposure=abs(size * mark_price)
+        )
+
+
+@dataclass(frozen=True)
+class Position:
+    """Position representation"""
+    # Slots: smaller instances and direct-offset attribute access on the
+    # reduction/display hot paths (tuple form keeps 3.8 compatibility)
+    __slots__ = ('symbol', 'size', 'entry_price', 'mark_price', 'unrealized_pnl',
+                 'realized_pnl', 'margin', 'leverage', 'liquidation_price', 'timestamp',
+                 'exposure')
+
+    symbol: str
+    size: float  # Position size (positive for long, negative for short)
+    entry_price: float
+    mark_price: float
+    unrealized_pnl: float
+    realized_pnl: float
+    margin: float
+    leverage: float
+    liquidation_price: float
+    timestamp: datetime
+    # Derived once at parse time so consumers read it instead of
+    # recomputing abs(size * mark_price)
+    exposure: float
+    
+
+@dataclass
+class PositionMetrics:
+    """Position metrics and statistics"""
+    __slots__ = ('total_unrealized_pnl', 'total_realized_pnl', 'total_margin',
+                 'total_exposure', 'portfolio_value', 'margin_ratio', 'risk_score',
+                 'largest_position', 'most_profitable', 'most_losing')
+
+    total_unrealized_pnl: float
+    total_realized_pnl: float
+    total_margin: float
+    total_exposure: float
+    portfolio_value: float
+    margin_ratio: float
+    risk_score: float
+    largest_position: Optional[Position]
+    most_profitable: Optional[Position]
+    most_losing: Optional[Position]
+
+
+class PositionManager:
+    """Advanced position management system"""
+
+    # Binance-compatible futures user-data stream endpoint
+    USER_STREAM_URL = "wss://fstream.asterdex.com/ws/"
+    # Listen keys expire after 60 minutes without a keepalive
+    KEEPALIVE_INTERVAL = 30 * 60
+    
+    def __init__(self, api_key: str, secret_key: str):
+        """
+        Initialize position manager
+        
+        Args:
+            api_key: Aster API key
+            secret_key: Aster secret key
+        """
+        self.client = AsterAuthenticatedClient(api_key, secret_key)
+        self.positions: Dict[str, Position] = {}
+        self.position_history: List[Position] = []
+        self.pnl_history: List[Dict[str, Any]] = []
+        # SoA mirror of self.positions for vectorized reductions
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+        self._column_symbols: List[str] = []
+        self._last_fetch = 0.0
+
+    def _rebuild_columns(self):
+        """Rebuild the NumPy column arrays mirroring self.positions"""
+        positions = list(self.positions.values())
+        self._column_symbols = [p.symbol for p in positions]
+        self._columns = {
+            'size': np.array([p.size for p in positions]),
+            'mark': np.array([p.mark_price for p in positions]),
+            'upnl': np.array([p.unrealized_pnl for p in positions]),
+            'rpnl': np.array([p.realized_pnl for p in positions]),
+            'margin': np.array([p.margin for p in positions]),
+            'liq': np.array([p.liquidation_price for p in positions]),
+        }
+    
+    def fetch_positions(self, max_age: float = 2.0) -> List[Position]:
+        """
+        Fetch current positions from API
+        
+        Args:
+            max_age: Serve the cached positions if they are younger than
+                this many seconds (pass 0 to force a refresh)
+        
+        Returns:
+            List of current positions
+        """
+        # Debounce: menu bounces and back-to-back calls reuse the last
+        # snapshot instead of triggering a fresh HTTPS round trip
+        if max_age > 0 and time.monotonic() - self._last_fetch < max_age:
+            return list(self.positions.values())
+        
+        try:
+            response = self.client.get_positions()
+            
+            if response.get('status') == 'ok':
+                positions_data = response.get('data', [])
+                positions = []
+                now = datetime.now()
+                
+                for pos_data in positions_data:
+                    position = _parse_position(pos_data, now)
+                    
+                    # Only include positions with non-zero size
+                    if position.size != 0:
+                        positions.append(position)
+                        self.positions[position.symbol] = position
+                
+                self._rebuild_columns()
+                self._last_fetch = time.monotonic()
+                return positions
+            else:
+                print(f"Error fetching positions: {response}")
+                return []
+                
+        except Exception as e:
+            print(f"Error fetching positions: {e}")
+            return []
+    
+    def calculate_position_metrics(self) -> PositionMetrics:
+        """
+        Calculate position metrics and statistics
+        
+        Returns:
+            Position metrics
+        """
+        if not self.positions:
+            return PositionMetrics(
+                total_unrealized_pnl=0.0,
+                total_realized_pnl=0.0,
+                total_margin=0.0,
+                total_exposure=0.0,
+                portfolio_value=0.0,
+                margin_ratio=0.0,
+                risk_score=0.0,
+                largest_position=None,
+                most_profitable=None,
+                most_losing=None
+            )
+        
+        cols = self._columns
+        if cols is not None and len(self._column_symbols) == len(self.positions):
+            if _reduce_positions is not None:
+                # JIT-compiled fused loop: all sums and argmax indices in
+                # one pass over contiguous memory
+                (total_unrealized_pnl, total_realized_pnl, total_margin,
+                 total_exposure, i_largest, i_prof, i_lose) = _reduce_positions(
+                    cols['size'], cols['mark'], cols['upnl'], cols['rpnl'], cols['margin'])
+                largest_position = self.positions[self._column_symbols[i_largest]]
+                most_profitable = self.positions[self._column_symbols[i_prof]]
+                most_losing = self.positions[self._column_symbols[i_lose]]
+            else:
+                # Vectorized reduction over the SoA columns: one C pass
+                # instead of per-object Python attribute dispatch
+                notionals = np.abs(cols['size'] * cols['mark'])
+                total_unrealized_pnl = float(cols['upnl'].sum())
+                total_realized_pnl = float(cols['rpnl'].sum())
+                total_margin = float(cols['margin'].sum())
+                total_exposure = float(notionals.sum())
+                largest_position = self.positions[self._column_symbols[int(np.argmax(notionals))]]
+                most_profitable = self.positions[self._column_symbols[int(np.argmax(cols['upnl']))]]
+                most_losing = self.positions[self._column_symbols[int(np.argmin(cols['upnl']))]]
+        else:
+            # Fallback single-pass reduction when the columns are stale
+            total_unrealized_pnl = 0.0
+            total_realized_pnl = 0.0
+            total_margin = 0.0
+            total_exposure = 0.0
+            largest_position = None
+            largest_notional = -1.0
+            most_profitable = None
+            most_losing = None
+
+            for pos in self.positions.values():
+                notional = pos.exposure
+                total_unrealized_pnl += pos.unrealized_pnl
+                total_realized_pnl += pos.realized_pnl
+                total_margin += pos.margin
+                total_exposure += notional
+
+                if notional > largest_notional:
+                    largest_notional = notional
+                    largest_position = pos
+                if most_profitable is None or pos.unrealized_pnl > most_profitable.unrealized_pnl:
+                    most_profitable = pos
+                if most_losing is None or pos.unrealized_pnl < most_losing.unrealized_pnl:
+                    most_losing = pos
+
+        # Calculate portfolio value (simplified)
+        portfolio_value = total_margin + total_unrealized_pnl
+
+        # Calculate margin ratio
+        margin_ratio = (total_margin / total_exposure * 100) if total_exposure > 0 else 0
+
+        # Calculate risk score (simplified)
+        risk_score = min(100, (total_exposure / portfolio_value * 100)) if portfolio_value > 0 else 0
+        
+        return PositionMetrics(
+            total_unrealized_pnl=total_unrealized_pnl,
+            total_realized_pnl=total_realized_pnl,
+            total_margin=total_margin,
+            total_exposure=total_exposure,
+            portfolio_value=portfolio_value,
+            margin_ratio=margin_ratio,
+            risk_score=risk_score,
+            largest_position=largest_position,
+            most_profitable=most_profitable,
+            most_losing=most_losing
+        )
+    
+    # Precompiled row template shared by every redraw
+    _ROW_FMT = "{sym:<12} {size:<15.6f} {entry:<12} {mark:<12} {pnl:<15} {margin:<12} {lev:<10.1f}x\n"
+
+    def display_positions(self):
+        """Display current positions"""
+        print("\nCURRENT POSITIONS")
+        print("=" * 100)
+
+        if not self.positions:
+            print("No open positions")
+            return
+
+        print(f"{'Symbol':<12} {'Size':<15} {'Entry':<12} {'Mark':<12} {'Unrealized P&L':<15} {'Margin':<12} {'Leverage':<10}")
+        print("-" * 100)
+
+        # Build every row up front and flush with a single write: one
+        # syscall per redraw instead of one print per position
+        row_fmt = self._ROW_FMT
+        rows = [
+            row_fmt.format(
+                sym=p.symbol,
+                size=p.size,
+                entry=format_price(p.entry_price),
+                mark=format_price(p.mark_price),
+                pnl=f"{p.unrealized_pnl:+.2f}",
+                margin=format_price(p.margin),
+                lev=p.leverage
+            )
+            for p in self.positions.values()
+        ]
+        sys.stdout.write(''.join(rows))
+    
+    def display_position_metrics(self):
+        """Display position metrics and statistics"""
+        metrics = self.calculate_position_metrics()
+        
+        print("\nPOSITION METRICS")
+        print("=" * 50)
+        print(f"Total Unrealized P&L: {format_price(metrics.total_unrealized_pnl)}")
+        print(f"Total Realized P&L: {format_price(metrics.total_realized_pnl)}")
+        print(f"Total Margin: {format_price(metrics.total_margin)}")
+        print(f"Total Exposure: {format_price(metrics.total_exposure)}")
+        print(f"Portfolio Value: {format_price(metrics.portfolio_value)}")
+        print(f"Margin Ratio: {metrics.margin_ratio:.2f}%")
+        print(f"Risk Score: {metrics.risk_score:.2f}%")
+        
+        if metrics.largest_position:
+            print(f"\nLargest Position: {metrics.largest_position.symbol} "
+                  f"({format_price(metrics.largest_position.exposure)})")
+        
+        if metrics.most_profitable:
+            print(f"Most Profitable: {metrics.most_profitable.symbol} "
+                  f"({format_price(metrics.most_profitable.unrealized_pnl)})")
+        
+        if metrics.most_losing:
+            print(f"Most Losing: {metrics.most_losing.symbol} "
+                  f"({format_price(metrics.most_losing.unrealized_pnl)})")
+    
+    def analyze_position_risk(self, symbol: str) -> Dict[str, Any]:
+        """
+        Analyze risk for a specific position
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            Risk analysis
+        """
+        if symbol not in self.positions:
+            return {'error': 'Position not found'}
+        
+        position = self.positions[symbol]
+        
+        # Calculate risk metrics
+        exposure = position.exposure
+        margin_ratio = (position.margin / exposure * 100) if exposure > 0 else 0
+        
+        # Calculate distance to liquidation
+        if position.liquidation_price > 0:
+            if position.size > 0:  # Long position
+                liquidation_distance = ((position.mark_price - position.liquidation_price) / position.mark_price * 100)
+            else:  # Short position
+                liquidation_distance = ((position.liquidation_price - position.mark_price) / position.mark_price * 100)
+        else:
+            liquidation_distance = 0
+        
+        # Risk assessment
+        risk_level = "LOW"
+        if margin_ratio < 20 or liquidation_distance < 10:
+            risk_level = "HIGH"
+        elif margin_ratio < 40 or liquidation_distance < 20:
+            risk_level = "MEDIUM"
+        
+        return {
+            'symbol': symbol,
+            'exposure': exposure,
+            'margin_ratio': margin_ratio,
+            'liquidation_distance': liquidation_distance,
+            'risk_level': risk_level,
+            'recommendation': self._get_risk_recommendation(risk_level, margin_ratio, liquidation_distance)
+        }
+    
+    def analyze_all_risk(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze risk for every open position in one vectorized pass
+        
+        Returns:
+            Mapping of symbol to its risk analysis
+        """
+        cols = self._columns
+        if cols is None or not len(self._column_symbols):
+            return {}
+        
+        size, mark, liq = cols['size'], cols['mark'], cols['liq']
+        notional = np.abs(size * mark)
+        
+        # Same branches as analyze_position_risk, as boolean masks over
+        # the whole portfolio instead of N Python calls
+        with np.errstate(divide='ignore', invalid='ignore'):
+            margin_ratio = np.where(notional > 0, cols['margin'] / notional * 100, 0.0)
+            liq_dist = np.where(
+                liq > 0,
+                np.where(size > 0, (mark - liq) / mark * 100, (liq - mark) / mark * 100),
+                0.0
+            )
+        
+        high = (margin_ratio < 20) | (liq_dist < 10)
+        medium = ~high & ((margin_ratio < 40) | (liq_dist < 20))
+        
+        results = {}
+        for i, symbol in enumerate(self._column_symbols):
+            risk_level = "HIGH" if high[i] else ("MEDIUM" if medium[i] else "LOW")
+            results[symbol] = {
+                'symbol': symbol,
+                'exposure': float(notional[i]),
+                'margin_ratio': float(margin_ratio[i]),
+                'liquidation_distance': float(liq_dist[i]),
+                'risk_level': risk_level,
+                'recommendation': self._get_risk_recommendation(
+                    risk_level, float(margin_ratio[i]), float(liq_dist[i]))
+            }
+        
+        return results
+    
+    def _get_risk_recommendation(self, risk_level: str, margin_ratio: float, liquidation_distance: float) -> str:
+        """Get risk management recommendation"""
+        if risk_level == "HIGH":
+            if margin_ratio < 20:
+                return "Consider reducing position size or adding margin"
+            elif liquidation_distance < 10:
+                return "URGENT: Position at high liquidation risk"
+            else:
+                return "Monitor position closely"
+        elif risk_level == "MEDIUM":
+            return "Consider risk management strategies"
+        else:
+            return "Position risk is acceptable"
+    
+    def get_portfolio_summary(self) -> Dict[str, Any]:
+        """
+        Get comprehensive portfolio summary
+        
+        Returns:
+            Portfolio summary
+        """
+        # Positions and account info are independent requests; fetch them
+        # in parallel so total latency is one round trip, not two
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            positions_future = executor.submit(self.fetch_positions)
+            account_future = executor.submit(self.client.get_account_info)
+
+            positions_future.result()
+            try:
+                account_info = account_future.result()
+                account_data = account_info.get('data', {}) if account_info.get('status') == 'ok' else {}
+            except:
+                account_data = {}
+
+        metrics = self.calculate_position_metrics()
+
+        summary = {
+            'timestamp': datetime.now().isoformat(),
+            'total_positions': len(self.positions),
+            'metrics': {
+                'total_unrealized_pnl': metrics.total_unrealized_pnl,
+                'total_realized_pnl': metrics.total_realized_pnl,
+                'total_margin': metrics.total_margin,
+                'total_exposure': metrics.total_exposure,
+                'portfolio_value': metrics.portfolio_value,
+                'margin_ratio': metrics.margin_ratio,
+                'risk_score': metrics.risk_score
+            },
+            'positions': list(self.positions.values()),
+            'account_info': account_data
+        }
+        
+        return summary
+    
+    def export_positions(self, filename: Optional[str] = None):
+        """Export positions to JSON"""
+        if filename is None:
+            filename = f"aster_positions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        
+        summary = self.get_portfolio_summary()
+        
+        try:
+            # orjson serializes the Position dataclasses (and their
+            # datetimes) directly — no intermediate to_dict copies
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC))
+            print(f"Positions exported to {filename}")
+        except Exception as e:
+            print(f"Error exporting positions: {e}")
+    
+    def monitor_positions(self, interval: int = 30):
+        """
+        Monitor positions in real-time
+        
+        Prefers the event-driven user-data stream, patching positions
+        incrementally from ACCOUNT_UPDATE events so steady-state network
+        traffic is near zero; falls back to REST polling at the given
+        interval if the stream cannot be started.
+        
+        Args:
+            interval: Polling interval in seconds (fallback mode only)
+        """
+        try:
+            listen_key = self.client.start_user_stream().get('listenKey')
+        except Exception as e:
+            print(f"Could not start user-data stream: {e}")
+            listen_key = None
+        
+        if not listen_key:
+            print("Falling back to REST polling")
+            self._poll_positions(interval)
+            return
+        
+        print("Starting position monitoring (user-data stream)")
+        print("Press Ctrl+C to stop")
+        
+        # Seed state with one full snapshot, then apply deltas
+        self.fetch_positions()
+        self._redraw()
+        
+        ws = websocket.WebSocketApp(
+            self.USER_STREAM_URL + listen_key,
+            on_message=self._on_user_message
+        )
+        ws_thread = threading.Thread(target=ws.run_forever)
+        ws_thread.daemon = True
+        ws_thread.start()
+        
+        try:
+            while True:
+                time.sleep(self.KEEPALIVE_INTERVAL)
+                self.client.keepalive_user_stream()
+        except KeyboardInterrupt:
+            ws.close()
+            print("\nPosition monitoring stopped")
+    
+    def _on_user_message(self, ws, message: str):
+        """Handle a user-data stream event"""
+        try:
+            data = json.loads(message)
+        except json.JSONDecodeError:
+            return
+        
+        if data.get('e') != 'ACCOUNT_UPDATE':
+            return
+        
+        self._apply_account_update(data)
+        self._redraw()
+    
+    def _apply_account_update(self, event: Dict[str, Any]):
+        """Patch self.positions from an ACCOUNT_UPDATE event"""
+        now = datetime.now()
+        
+        for pos_data in event.get('a', {}).get('P', []):
+            symbol = pos_data.get('s', '')
+            size = float(pos_data.get('pa', 0))
+            
+            if size == 0:
+                self.positions.pop(symbol, None)
+                continue
+            
+            # Fields the event does not carry are kept from the last snapshot
+            existing = self.positions.get(symbol)
+            mark_price = existing.mark_price if existing else 0.0
+            self.positions[symbol] = Position(
+                symbol=symbol,
+                size=size,
+                entry_price=float(pos_data.get('ep', 0)),
+                mark_price=mark_price,
+                unrealized_pnl=float(pos_data.get('up', 0)),
+                realized_pnl=float(pos_data.get('cr', 0)),
+                margin=float(pos_data.get('iw', 0)),
+                leverage=existing.leverage if existing else 1.0,
+                liquidation_price=existing.liquidation_price if existing else 0.0,
+                timestamp=now,
+                exposure=abs(size * mark_price)
+            )
+        
+        self._rebuild_columns()
+    
+    def _redraw(self):
+        """Clear the screen and render positions and metrics"""
+        # ANSI home+clear: no fork/exec of a subprocess per tick, and it
+        # works inside pipes and notebooks where `clear` is unavailable
+        sys.stdout.write('\x1b[H\x1b[J')
+        sys.stdout.flush()
+
+        print("ASTER POSITION MONITOR")
+        print("=" * 50)
+        print(f"Last Update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        self.display_positions()
+        self.display_position_metrics()
+    
+    def _poll_positions(self, interval: int):
+        """Legacy polling monitor used when the stream is unavailable"""
+        print(f"Starting position monitoring (interval: {interval}s)")
+        print("Press Ctrl+C to stop")
+        
+        try:
+            while True:
+                self.fetch_positions()
+                self._redraw()
+                
+                print(f"\nNext update in {interval} seconds...")
+                time.sleep(interval)
+                
+        except KeyboardInterrupt:
+            print("\nPosition monitoring stopped")
+
+
+def main():
+    """Main function for position management demo"""
+    print("ASTER SDK - ADVANCED POSITION MANAGEMENT")
+    print("=" * 50)
+    
+    # You would need to provide actual API credentials
+    api_key = "your_api_key_here"
+    secret_key = "your_secret_key_here"
+    
+    if api_key == "your_api_key_here":
+        print("Please set your actual API credentials to use position management")
+        print("You can edit the main() function with your credentials")
+        return
+    
+    try:
+        # Initialize position manager
+        position_manager = PositionManager(api_key, secret_key)
+        
+        while True:
+            print("\nPosition Management Options:")
+            print("1. View current positions")
+            print("2. View position metrics")
+            print("3. Analyze position risk")
+            print("4. Get portfolio summary")
+            print("5. Export positions")
+            print("6. Monitor positions (real-time)")
+            print("0. Exit")
+            
+            choice = input("\nEnter your choice (0-6): ").strip()
+            
+            if choice == "0":
+                print("Goodbye!")
+                break
+            elif choice == "1":
+                # View positions
+                position_manager.fetch_positions()
+                position_manager.display_positions()
+                
+            elif choice == "2":
+                # View metrics
+                position_manager.fetch_positions()
+                position_manager.display_position_metrics()
+                
+            elif choice == "3":
+                # Analyze risk
+                symbol = input("Enter symbol to analyze: ").strip().upper()
+                position_manager.fetch_positions()
+                risk_analysis = position_manager.analyze_position_risk(symbol)
+                
+                if 'error' in risk_analysis:
+                    print(f"Error: {risk_analysis['error']}")
+                else:
+                    print(f"\nRisk Analysis for {symbol}:")
+                    print(f"Exposure: {format_price(risk_analysis['exposure'])}")
+                    print(f"Margin Ratio: {risk_analysis['margin_ratio']:.2f}%")
+                    print(f"Liquidation Distance: {risk_analysis['liquidation_distance']:.2f}%")
+                    print(f"Risk Level: {risk_analysis['risk_level']}")
+                    print(f"Recommendation: {risk_analysis['recommendation']}")
+                    
+            elif choice == "4":
+                # Portfolio summary (fetches positions itself, in parallel)
+                summary = position_manager.get_portfolio_summary()
+                print(f"\nPortfolio Summary:")
+                print(f"Total Positions: {summary['total_positions']}")
+                print(f"Portfolio Value: {format_price(summary['metrics']['portfolio_value'])}")
+                print(f"Total P&L: {format_price(summary['metrics']['total_unrealized_pnl'])}")
+                print(f"Risk Score: {summary['metrics']['risk_score']:.2f}%")
+                
+            elif choice == "5":
+                # Export positions (fetches positions itself, in parallel)
+                position_manager.export_positions()
+                
+            elif choice == "6":
+                # Monitor positions
+                interval = input("Enter monitoring interval in seconds (default 30): ").strip()
+                interval = int(interval) if interval.isdigit() else 30
+                position_manager.monitor_positions(interval)
+                
+            else:
+                print("Invalid choice. Please try again.")
+    
+    except Exception as e:
+        print(f"Error in position management: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
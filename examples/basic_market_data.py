@@ -7,150 +7,182 @@ import sys
 import os
 import time
 import json
+import re
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
+
+import numpy as np
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from aster_example_utils import setup_info_client, save_data_to_file, format_price, format_volume, format_percentage
 
 
-def analyze_top_movers(info):
-    """Analyze and display top gainers and losers"""
+def _prefloat_stats(stats_24hr):
+    """Cache float conversions of the hot ticker fields on each row
+    
+    The analyzers read the same numeric strings several times per row;
+    one preprocessing pass parses each field exactly once.
+    """
+    for t in stats_24hr:
+        t['_vol'] = float(t.get('volume', 0) or 0)
+        t['_chg'] = float(t.get('priceChangePercent', 0) or 0)
+        t['_last'] = float(t.get('lastPrice', 0) or 0)
+        t['_hi'] = float(t.get('highPrice', 0) or 0)
+        t['_lo'] = float(t.get('lowPrice', 0) or 0)
+    return stats_24hr
+
+
+# Precompiled header/row templates: built once at import instead of
+# re-evaluating the same f-strings inside the display loops
+_MOVERS_HDR = f"{'Symbol':<12} {'Price':<12} {'Change':<10} {'Volume':<15}"
+_MOVERS_ROW = '{:<12} {:<12} {:<10} {:<15}'.format
+_VOLUME_HDR = f"{'Symbol':<12} {'Price':<12} {'Volume':<15} {'Change':<10}"
+_VOLUME_ROW = '{:<12} {:<12} {:<15} {:<10}'.format
+_RANGE_HDR = f"{'Symbol':<12} {'Current':<12} {'High':<12} {'Low':<12} {'Range %':<10}"
+_RANGE_ROW = '{:<12} {:<12} {:<12} {:<12} {:<9.2f}%'.format
+
+
+def analyze_top_movers(stats_24hr):
+    """Analyze and display top gainers and losers
+    
+    Args:
+        stats_24hr: Pre-floated ticker rows (see _prefloat_stats)
+    """
     print("\n📈 TOP MOVERS ANALYSIS")
     print("=" * 50)
     
     try:
-        stats_24hr = info.ticker_24hr()
+        # Top-N selection is O(N log 10) via a heap — no full sort
+        gainers = heapq.nlargest(10, stats_24hr, key=itemgetter('_chg'))
         
-        # Sort by price change percentage
-        gainers = sorted(stats_24hr, 
-                        key=lambda x: float(x.get('priceChangePercent', 0)), 
-                        reverse=True)[:10]
+        losers = heapq.nsmallest(10, stats_24hr, key=itemgetter('_chg'))
         
-        losers = sorted(stats_24hr, 
-                       key=lambda x: float(x.get('priceChangePercent', 0)))[:10]
+        # Local binds avoid repeated global lookups in the row loops
+        fmt_price, fmt_vol, fmt_pct = format_price, format_volume, format_percentage
         
         print("TOP 10 GAINERS:")
-        print(f"{'Symbol':<12} {'Price':<12} {'Change':<10} {'Volume':<15}")
+        print(_MOVERS_HDR)
         print("-" * 50)
         
         for ticker in gainers:
-            symbol = ticker.get('symbol', 'N/A')
-            price = float(ticker.get('lastPrice', 0))
-            change = ticker.get('priceChangePercent', '0')
-            volume = float(ticker.get('volume', 0))
-            
-            print(f"{symbol:<12} {format_price(price):<12} {format_percentage(change):<10} {format_volume(volume):<15}")
+            print(_MOVERS_ROW(ticker.get('symbol', 'N/A'),
+                              fmt_price(ticker['_last']),
+                              fmt_pct(ticker.get('priceChangePercent', '0')),
+                              fmt_vol(ticker['_vol'])))
         
         print("\nTOP 10 LOSERS:")
-        print(f"{'Symbol':<12} {'Price':<12} {'Change':<10} {'Volume':<15}")
+        print(_MOVERS_HDR)
         print("-" * 50)
         
         for ticker in losers:
-            symbol = ticker.get('symbol', 'N/A')
-            price = float(ticker.get('lastPrice', 0))
-            change = ticker.get('priceChangePercent', '0')
-            volume = float(ticker.get('volume', 0))
-            
-            print(f"{symbol:<12} {format_price(price):<12} {format_percentage(change):<10} {format_volume(volume):<15}")
+            print(_MOVERS_ROW(ticker.get('symbol', 'N/A'),
+                              fmt_price(ticker['_last']),
+                              fmt_pct(ticker.get('priceChangePercent', '0')),
+                              fmt_vol(ticker['_vol'])))
         
     except Exception as e:
         print(f"Error analyzing top movers: {e}")
 
 
-def analyze_volume_leaders(info):
-    """Analyze and display volume leaders"""
+def analyze_volume_leaders(stats_24hr):
+    """Analyze and display volume leaders
+    
+    Args:
+        stats_24hr: Pre-floated ticker rows (see _prefloat_stats)
+    """
     print("\n📊 VOLUME LEADERS")
     print("=" * 50)
     
     try:
-        stats_24hr = info.ticker_24hr()
+        # Top-N selection via a heap — no full sort
+        volume_leaders = heapq.nlargest(15, stats_24hr, key=itemgetter('_vol'))
         
-        # Sort by volume
-        volume_leaders = sorted(stats_24hr, 
-                              key=lambda x: float(x.get('volume', 0)), 
-                              reverse=True)[:15]
+        fmt_price, fmt_vol, fmt_pct = format_price, format_volume, format_percentage
         
-        print(f"{'Symbol':<12} {'Price':<12} {'Volume':<15} {'Change':<10}")
+        print(_VOLUME_HDR)
         print("-" * 50)
         
         for ticker in volume_leaders:
-            symbol = ticker.get('symbol', 'N/A')
-            price = float(ticker.get('lastPrice', 0))
-            volume = float(ticker.get('volume', 0))
-            change = ticker.get('priceChangePercent', '0')
-            
-            print(f"{symbol:<12} {format_price(price):<12} {format_volume(volume):<15} {format_percentage(change):<10}")
+            print(_VOLUME_ROW(ticker.get('symbol', 'N/A'),
+                              fmt_price(ticker['_last']),
+                              fmt_vol(ticker['_vol']),
+                              fmt_pct(ticker.get('priceChangePercent', '0'))))
         
     except Exception as e:
         print(f"Error analyzing volume leaders: {e}")
 
 
-def analyze_price_ranges(info):
-    """Analyze price ranges and volatility"""
+def analyze_price_ranges(stats_24hr):
+    """Analyze price ranges and volatility
+    
+    Args:
+        stats_24hr: Pre-floated ticker rows (see _prefloat_stats)
+    """
     print("\n📏 PRICE RANGE ANALYSIS")
     print("=" * 50)
     
     try:
-        stats_24hr = info.ticker_24hr()
-        
-        # Calculate price ranges
-        ranges = []
-        for ticker in stats_24hr:
-            symbol = ticker.get('symbol', 'N/A')
-            high = float(ticker.get('highPrice', 0))
-            low = float(ticker.get('lowPrice', 0))
-            current = float(ticker.get('lastPrice', 0))
-            
-            if high > 0 and low > 0:
-                range_pct = ((high - low) / low) * 100
-                ranges.append({
-                    'symbol': symbol,
-                    'high': high,
-                    'low': low,
-                    'current': current,
-                    'range_pct': range_pct
-                })
+        # One C-level pass over contiguous float64 columns instead of a
+        # per-row Python loop building intermediate dicts
+        symbols = [t.get('symbol', 'N/A') for t in stats_24hr]
+        arr = np.array([(t['_hi'], t['_lo'], t['_last']) for t in stats_24hr],
+                       dtype=np.float64).reshape(-1, 3)
+        mask = (arr[:, 0] > 0) & (arr[:, 1] > 0)
+        valid_idx = np.nonzero(mask)[0]
+        rng = (arr[valid_idx, 0] - arr[valid_idx, 1]) / arr[valid_idx, 1] * 100.0
         
-        # Sort by range percentage
-        ranges.sort(key=lambda x: x['range_pct'], reverse=True)
+        # argpartition picks the top 10 in O(N); only those get sorted
+        top_n = min(10, rng.size)
+        top = np.argpartition(-rng, top_n - 1)[:top_n] if top_n else np.array([], dtype=int)
+        top = top[np.argsort(-rng[top])]
         
         print("TOP 10 MOST VOLATILE (24hr range):")
-        print(f"{'Symbol':<12} {'Current':<12} {'High':<12} {'Low':<12} {'Range %':<10}")
+        print(_RANGE_HDR)
         print("-" * 60)
         
-        for item in ranges[:10]:
-            symbol = item['symbol']
-            current = item['current']
-            high = item['high']
-            low = item['low']
-            range_pct = item['range_pct']
-            
-            print(f"{symbol:<12} {format_price(current):<12} {format_price(high):<12} {format_price(low):<12} {range_pct:<9.2f}%")
+        fmt_price = format_price
+        for i in top:
+            row = valid_idx[i]
+            high, low, current = arr[row]
+            print(_RANGE_ROW(symbols[row], fmt_price(current),
+                             fmt_price(high), fmt_price(low), rng[i]))
         
     except Exception as e:
         print(f"Error analyzing price ranges: {e}")
 
 
-def search_symbols(info, query):
-    """Search for symbols containing the query"""
-    print(f"\n🔍 SEARCH RESULTS for '{query}'")
+def search_symbols(prices, stats_24hr, queries):
+    """Search for symbols matching any of the given queries
+    
+    Args:
+        prices: Ticker price rows
+        stats_24hr: Pre-floated ticker rows (see _prefloat_stats)
+        queries: Query string or list of query strings
+    """
+    if isinstance(queries, str):
+        queries = [queries]
+    
+    print(f"\n🔍 SEARCH RESULTS for '{', '.join(queries)}'")
     print("=" * 50)
     
     try:
-        prices = info.ticker_price()
-        stats_24hr = info.ticker_24hr()
-        
         # Create a lookup for 24hr stats
-        stats_lookup = {s.get('symbol'): s for s in stats_24hr}
+        stats_lookup = {s['symbol']: s for s in stats_24hr}
+        
+        # One compiled alternation scans every symbol once for all
+        # queries instead of one linear pass (and fetch) per query
+        pattern = re.compile('|'.join(re.escape(q.upper()) for q in queries))
         
         matches = []
         for price_data in prices:
             symbol = price_data.get('symbol', '')
-            if query.upper() in symbol.upper():
+            if pattern.search(symbol.upper()):
                 price = float(price_data.get('price', 0))
                 stat_data = stats_lookup.get(symbol, {})
                 change = stat_data.get('priceChangePercent', '0')
-                volume = float(stat_data.get('volume', 0))
+                volume = stat_data.get('_vol', 0.0)
                 
                 matches.append({
                     'symbol': symbol,
@@ -184,16 +216,21 @@ def export_market_data(info):
     print("=" * 30)
     
     try:
-        # Collect all market data
-        market_data = {
-            'timestamp': datetime.now().isoformat(),
-            'server_time': info.server_time(),
-            'exchange_info': info.exchange_info(),
-            'prices': info.ticker_price(),
-            'stats_24hr': info.ticker_24hr(),
-            'best_prices': info.ticker_book_ticker(),
-            'funding_rates': info.funding_rate()
-        }
+        # The six endpoint calls are independent; fan them out so the
+        # wall-clock cost is the slowest round-trip, not the sum
+        endpoints = [
+            ('server_time', info.server_time),
+            ('exchange_info', info.exchange_info),
+            ('prices', info.ticker_price),
+            ('stats_24hr', info.ticker_24hr),
+            ('best_prices', info.ticker_book_ticker),
+            ('funding_rates', info.funding_rate),
+        ]
+        market_data = {'timestamp': datetime.now().isoformat()}
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            futures = {key: executor.submit(fetch) for key, fetch in endpoints}
+            for key, future in futures.items():
+                market_data[key] = future.result()
         
         # Save to file
         filename = f"aster_market_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -215,14 +252,17 @@ def main():
         # Set up the Info client
         info = setup_info_client()
         
+        # Fetch and parse each payload once; the analyzers share it
+        stats_24hr = _prefloat_stats(info.ticker_24hr())
+        prices = info.ticker_price()
+        
         # Run various analyses
-        analyze_top_movers(info)
-        analyze_volume_leaders(info)
-        analyze_price_ranges(info)
+        analyze_top_movers(stats_24hr)
+        analyze_volume_leaders(stats_24hr)
+        analyze_price_ranges(stats_24hr)
         
-        # Search for specific symbols
-        search_symbols(info, "BTC")
-        search_symbols(info, "ETH")
+        # Search for specific symbols (one pass covers both queries)
+        search_symbols(prices, stats_24hr, ["BTC", "ETH"])
         
         # Export data
         export_market_data(info)
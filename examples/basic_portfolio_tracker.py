@@ -1,328 +1,491 @@
-"""
-Aster SDK - Basic Portfolio Tracker Example
-Demonstrates how to track a portfolio using Aster market data
-"""
-
-import sys
-import os
-import json
-from datetime import datetime
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from aster_example_utils import setup_info_client, format_price, format_volume, save_data_to_file
-
-
-class AsterPortfolioTracker:
-    """Portfolio tracker for Aster exchange"""
-    
-    def __init__(self, portfolio_file="portfolio.json"):
-        """
-        Initialize portfolio tracker
-        
-        Args:
-            portfolio_file: Path to portfolio configuration file
-        """
-        self.info = setup_info_client()
-        self.portfolio_file = portfolio_file
-        self.portfolio = self._load_portfolio()
-        
-    def _load_portfolio(self):
-        """Load portfolio from file or create default"""
-        if os.path.exists(self.portfolio_file):
-            try:
-                with open(self.portfolio_file, 'r') as f:
-                    portfolio = json.load(f)
-                print(f"✅ Loaded portfolio from {self.portfolio_file}")
-                return portfolio
-            except Exception as e:
-                print(f"❌ Error loading portfolio: {e}")
-        
-        # Create default portfolio
-        default_portfolio = {
-            "holdings": {
-                "BTCUSDT": 0.1,
-                "ETHUSDT": 1.0,
-                "BNBUSDT": 5.0,
-                "SOLUSDT": 10.0,
-                "ASTERUSDT": 1000.0
-            },
-            "last_updated": datetime.now().isoformat(),
-            "description": "Default portfolio - edit portfolio.json to customize"
-        }
-        
-        self._save_portfolio(default_portfolio)
-        print(f"✅ Created default portfolio in {self.portfolio_file}")
-        return default_portfolio
-    
-    def _save_portfolio(self, portfolio):
-        """Save portfolio to file"""
-        try:
-            with open(self.portfolio_file, 'w') as f:
-                json.dump(portfolio, f, indent=2)
-        except Exception as e:
-            print(f"❌ Error saving portfolio: {e}")
-    
-    def update_portfolio(self, symbol, amount):
-        """
-        Update portfolio holdings
-        
-        Args:
-            symbol: Trading symbol (e.g., 'BTCUSDT')
-            amount: Amount to hold
-        """
-        self.portfolio['holdings'][symbol] = amount
-        self.portfolio['last_updated'] = datetime.now().isoformat()
-        self._save_portfolio(self.portfolio)
-        print(f"✅ Updated {symbol} to {amount}")
-    
-    def add_holding(self, symbol, amount):
-        """
-        Add to existing holding
-        
-        Args:
-            symbol: Trading symbol
-            amount: Amount to add
-        """
-        current = self.portfolio['holdings'].get(symbol, 0)
-        new_amount = current + amount
-        self.update_portfolio(symbol, new_amount)
-    
-    def remove_holding(self, symbol, amount):
-        """
-        Remove from existing holding
-        
-        Args:
-            symbol: Trading symbol
-            amount: Amount to remove
-        """
-        current = self.portfolio['holdings'].get(symbol, 0)
-        new_amount = max(0, current - amount)
-        self.update_portfolio(symbol, new_amount)
-    
-    def get_portfolio_value(self):
-        """Calculate current portfolio value"""
-        try:
-            prices = self.info.ticker_price()
-            price_lookup = {p.get('symbol'): float(p.get('price', 0)) for p in prices}
-            
-            total_value = 0
-            holdings_value = {}
-            
-            for symbol, amount in self.portfolio['holdings'].items():
-                if amount > 0:
-                    price = price_lookup.get(symbol, 0)
-                    value = amount * price
-                    holdings_value[symbol] = {
-                        'amount': amount,
-                        'price': price,
-                        'value': value
-                    }
-                    total_value += value
-            
-            return {
-                'total_value': total_value,
-                'holdings': holdings_value,
-                'last_updated': datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            print(f"❌ Error calculating portfolio value: {e}")
-            return None
-    
-    def display_portfolio(self):
-        """Display current portfolio"""
-        print("\n💼 PORTFOLIO OVERVIEW")
-        print("=" * 60)
-        
-        portfolio_value = self.get_portfolio_value()
-        if not portfolio_value:
-            print("❌ Could not calculate portfolio value")
-            return
-        
-        total_value = portfolio_value['total_value']
-        holdings = portfolio_value['holdings']
-        
-        print(f"Total Portfolio Value: {format_price(total_value)}")
-        print(f"Last Updated: {portfolio_value['last_updated']}")
-        print()
-        
-        if not holdings:
-            print("No holdings in portfolio")
-            return
-        
-        print(f"{'Symbol':<12} {'Amount':<15} {'Price':<15} {'Value':<15} {'%':<8}")
-        print("-" * 70)
-        
-        for symbol, data in holdings.items():
-            amount = data['amount']
-            price = data['price']
-            value = data['value']
-            percentage = (value / total_value) * 100 if total_value > 0 else 0
-            
-            print(f"{symbol:<12} {amount:<15.6f} {format_price(price):<15} "
-                  f"{format_price(value):<15} {percentage:<7.2f}%")
-    
-    def get_portfolio_performance(self):
-        """Get portfolio performance metrics"""
-        try:
-            stats_24hr = self.info.ticker_24hr()
-            stats_lookup = {s.get('symbol'): s for s in stats_24hr}
-            
-            portfolio_value = self.get_portfolio_value()
-            if not portfolio_value:
-                return None
-            
-            total_change_24h = 0
-            holdings_performance = {}
-            
-            for symbol, data in portfolio_value['holdings'].items():
-                amount = data['amount']
-                current_price = data['price']
-                stat_data = stats_lookup.get(symbol, {})
-                
-                # Calculate 24h change
-                change_pct = float(stat_data.get('priceChangePercent', 0))
-                change_value = (current_price * change_pct / 100) * amount
-                
-                holdings_performance[symbol] = {
-                    'change_24h_pct': change_pct,
-                    'change_24h_value': change_value
-                }
-                
-                total_change_24h += change_value
-            
-            total_value = portfolio_value['total_value']
-            total_change_pct = (total_change_24h / total_value) * 100 if total_value > 0 else 0
-            
-            return {
-                'total_change_24h_value': total_change_24h,
-                'total_change_24h_pct': total_change_pct,
-                'holdings_performance': holdings_performance
-            }
-            
-        except Exception as e:
-            print(f"❌ Error calculating portfolio performance: {e}")
-            return None
-    
-    def display_performance(self):
-        """Display portfolio performance"""
-        print("\n📈 PORTFOLIO PERFORMANCE (24h)")
-        print("=" * 50)
-        
-        performance = self.get_portfolio_performance()
-        if not performance:
-            print("❌ Could not calculate performance")
-            return
-        
-        total_change_value = performance['total_change_24h_value']
-        total_change_pct = performance['total_change_24h_pct']
-        
-        # Format change with color coding
-        if total_change_value > 0:
-            change_str = f"+{format_price(total_change_value)} (+{total_change_pct:.2f}%)"
-        elif total_change_value < 0:
-            change_str = f"{format_price(total_change_value)} ({total_change_pct:.2f}%)"
-        else:
-            change_str = f"{format_price(total_change_value)} (0.00%)"
-        
-        print(f"24h Change: {change_str}")
-        print()
-        
-        print(f"{'Symbol':<12} {'24h Change %':<12} {'24h Change $':<15}")
-        print("-" * 40)
-        
-        for symbol, perf in performance['holdings_performance'].items():
-            change_pct = perf['change_24h_pct']
-            change_value = perf['change_24h_value']
-            
-            if change_pct > 0:
-                change_pct_str = f"+{change_pct:.2f}%"
-            else:
-                change_pct_str = f"{change_pct:.2f}%"
-            
-            print(f"{symbol:<12} {change_pct_str:<12} {format_price(change_value):<15}")
-    
-    def export_portfolio_report(self):
-        """Export comprehensive portfolio report"""
-        print("\n💾 EXPORTING PORTFOLIO REPORT")
-        print("=" * 35)
-        
-        try:
-            portfolio_value = self.get_portfolio_value()
-            performance = self.get_portfolio_performance()
-            
-            if not portfolio_value or not performance:
-                print("❌ Could not generate report")
-                return
-            
-            report = {
-                'timestamp': datetime.now().isoformat(),
-                'portfolio': self.portfolio,
-                'current_value': portfolio_value,
-                'performance': performance
-            }
-            
-            filename = f"portfolio_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            save_data_to_file(report, filename)
-            
-            print(f"✅ Portfolio report exported to {filename}")
-            
-        except Exception as e:
-            print(f"❌ Error exporting portfolio report: {e}")
-
-
-def main():
-    """Main function for portfolio tracking"""
-    print("🚀 ASTER SDK - PORTFOLIO TRACKER")
-    print("=" * 40)
-    
-    tracker = AsterPortfolioTracker()
-    
-    while True:
-        print("\nPortfolio Tracker Options:")
-        print("1. View portfolio")
-        print("2. View performance")
-        print("3. Update holding")
-        print("4. Add to holding")
-        print("5. Remove from holding")
-        print("6. Export report")
-        print("0. Exit")
-        
-        choice = input("\nEnter your choice (0-6): ").strip()
-        
-        if choice == "0":
-            print("Goodbye!")
-            break
-        elif choice == "1":
-            tracker.display_portfolio()
-        elif choice == "2":
-            tracker.display_performance()
-        elif choice == "3":
-            symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-            try:
-                amount = float(input("Enter amount: "))
-                tracker.update_portfolio(symbol, amount)
-            except ValueError:
-                print("❌ Invalid amount")
-        elif choice == "4":
-            symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-            try:
-                amount = float(input("Enter amount to add: "))
-                tracker.add_holding(symbol, amount)
-            except ValueError:
-                print("❌ Invalid amount")
-        elif choice == "5":
-            symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
-            try:
-                amount = float(input("Enter amount to remove: "))
-                tracker.remove_holding(symbol, amount)
-            except ValueError:
-                print("❌ Invalid amount")
-        elif choice == "6":
-            tracker.export_portfolio_report()
-        else:
-            print("Invalid choice. Please try again.")
-
-
-if __name__ == "__main__":
-    main()
+"""
+Aster SDK - Basic Portfolio Tracker Example
+Demonstrates how to track a portfolio using Aster market data
+"""
+
+import sys
+import os
+import json
+import time
+import atexit
+from datetime import datetime
+
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aster_example_utils import setup_info_client, format_price, format_volume
+
+try:
+    import orjson
+    
+    def _dumps(obj):
+        # NUMPY/NAIVE_UTC let report payloads carry ndarray slices and
+        # datetimes without manual conversion
+        return orjson.dumps(obj, option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                                         orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC))
+    
+    _loads = orjson.loads
+except ImportError:  # keep the dependency optional
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+    
+    _loads = json.loads
+
+
+def _make_price_formatter(reference_price):
+    """Build a price formatter specialized for one magnitude
+    
+    The decimals branch runs once here; the returned callable is a bound
+    str.format with the precision baked in.
+    """
+    if reference_price >= 1000:
+        decimals = 2
+    elif reference_price >= 1:
+        decimals = 4
+    else:
+        decimals = 8
+    return ('${:,.%df}' % decimals).format
+
+
+class AsterPortfolioTracker:
+    """Portfolio tracker for Aster exchange"""
+    
+    def __init__(self, portfolio_file="portfolio.json"):
+        """
+        Initialize portfolio tracker
+        
+        Args:
+            portfolio_file: Path to portfolio configuration file
+        """
+        self.info = setup_info_client()
+        self.portfolio_file = portfolio_file
+        self.portfolio = self._load_portfolio()
+        self._rebuild_holdings_arrays()
+        # Debounced persistence: mutations mark the portfolio dirty and
+        # writes coalesce; atexit guarantees the final state lands
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
+        # Short-TTL ticker cache: one report touches value + performance,
+        # which share the same payloads within a couple of seconds
+        self.cache_ttl = 2.0
+        self._ticker_cache = {}
+        # Per-symbol display formatters specialized to each price's
+        # magnitude; rebuilt only when a price moves more than 10x
+        self._price_formatters = {}
+        
+    def _price_formatter(self, symbol, price):
+        """Return the symbol's specialized formatter, refreshing it when
+        the price magnitude drifts beyond 10x of the reference"""
+        entry = self._price_formatters.get(symbol)
+        if entry is not None:
+            reference, fmt = entry
+            if reference > 0 and 0.1 <= price / reference <= 10:
+                return fmt
+        
+        fmt = _make_price_formatter(price)
+        self._price_formatters[symbol] = (price, fmt)
+        return fmt
+    
+    def _cached_ticker(self, name, fetch):
+        """
+        Return a recently fetched ticker payload, refetching after the TTL
+        
+        Args:
+            name: Cache key for the endpoint
+            fetch: Zero-argument callable performing the request
+        """
+        entry = self._ticker_cache.get(name)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self.cache_ttl:
+            return entry[1]
+        
+        payload = fetch()
+        self._ticker_cache[name] = (now, payload)
+        return payload
+        
+    def _load_portfolio(self):
+        """Load portfolio from file or create default"""
+        if os.path.exists(self.portfolio_file):
+            try:
+                # Binary read + C-level parse skips the text-decode step
+                with open(self.portfolio_file, 'rb') as f:
+                    portfolio = _loads(f.read())
+                print(f"✅ Loaded portfolio from {self.portfolio_file}")
+                return portfolio
+            except Exception as e:
+                print(f"❌ Error loading portfolio: {e}")
+        
+        # Create default portfolio
+        default_portfolio = {
+            "holdings": {
+                "BTCUSDT": 0.1,
+                "ETHUSDT": 1.0,
+                "BNBUSDT": 5.0,
+                "SOLUSDT": 10.0,
+                "ASTERUSDT": 1000.0
+            },
+            "last_updated": datetime.now().isoformat(),
+            "description": "Default portfolio - edit portfolio.json to customize"
+        }
+        
+        self._save_portfolio(default_portfolio)
+        print(f"✅ Created default portfolio in {self.portfolio_file}")
+        return default_portfolio
+    
+    def _rebuild_holdings_arrays(self):
+        """Mirror positive holdings into parallel SoA arrays
+        
+        Valuation and performance then run as vector products over
+        contiguous float64 instead of per-holding Python arithmetic.
+        """
+        holdings = self.portfolio['holdings']
+        # Sorted order keeps the mirrors deterministic across runs and
+        # the valuation scan contiguous, independent of dict history
+        self._holding_symbols = sorted(s for s, a in holdings.items() if a > 0)
+        self._amounts = np.array([holdings[s] for s in self._holding_symbols])
+    
+    def _save_portfolio(self, portfolio):
+        """Save portfolio to file"""
+        try:
+            # Write-then-rename keeps the file whole even if the process
+            # dies mid-write
+            tmp_file = self.portfolio_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(portfolio))
+            os.replace(tmp_file, self.portfolio_file)
+        except Exception as e:
+            print(f"❌ Error saving portfolio: {e}")
+    
+    def _mark_dirty(self):
+        """Record an unsaved change, flushing once the debounce expires"""
+        self._dirty = True
+        if time.monotonic() - self._last_flush > 1.0:
+            self.flush()
+    
+    def flush(self):
+        """Persist pending portfolio changes to disk"""
+        if self._dirty:
+            self._save_portfolio(self.portfolio)
+            self._dirty = False
+            self._last_flush = time.monotonic()
+    
+    def update_portfolio(self, symbol, amount):
+        """
+        Update portfolio holdings
+        
+        Args:
+            symbol: Trading symbol (e.g., 'BTCUSDT')
+            amount: Amount to hold
+        """
+        self.portfolio['holdings'][symbol] = amount
+        self.portfolio['last_updated'] = datetime.now().isoformat()
+        self._rebuild_holdings_arrays()
+        self._mark_dirty()
+        print(f"✅ Updated {symbol} to {amount}")
+    
+    def bulk_update(self, holdings):
+        """
+        Update many holdings with one timestamp and one save
+        
+        Args:
+            holdings: Mapping of symbol to new amount
+        """
+        self.portfolio['holdings'].update(holdings)
+        self.portfolio['last_updated'] = datetime.now().isoformat()
+        self._rebuild_holdings_arrays()
+        self._mark_dirty()
+        print(f"✅ Updated {len(holdings)} holdings")
+    
+    def add_holding(self, symbol, amount):
+        """
+        Add to existing holding
+        
+        Args:
+            symbol: Trading symbol
+            amount: Amount to add
+        """
+        current = self.portfolio['holdings'].get(symbol, 0)
+        new_amount = current + amount
+        self.update_portfolio(symbol, new_amount)
+    
+    def remove_holding(self, symbol, amount):
+        """
+        Remove from existing holding
+        
+        Args:
+            symbol: Trading symbol
+            amount: Amount to remove
+        """
+        current = self.portfolio['holdings'].get(symbol, 0)
+        new_amount = max(0, current - amount)
+        self.update_portfolio(symbol, new_amount)
+    
+    def _snapshot(self):
+        """Compute valuation and 24h performance in one fused pass
+        
+        Both payloads are fetched once and every per-holding figure comes
+        out of a single set of vector expressions, so value-only callers
+        and full reports share the same work.
+        
+        Returns:
+            Dict with total_value, holdings, last_updated,
+            total_change_24h_value, total_change_24h_pct and
+            holdings_performance, or None on failure
+        """
+        try:
+            prices = self._cached_ticker('ticker_price', self.info.ticker_price)
+            stats_24hr = self._cached_ticker('ticker_24hr', self.info.ticker_24hr)
+            price_lookup = {p.get('symbol'): float(p.get('price', 0)) for p in prices}
+            stats_lookup = {s.get('symbol'): s for s in stats_24hr}
+            
+            # One vector pass over the SoA mirrors; dicts only at the
+            # display boundary
+            symbols = self._holding_symbols
+            n = len(symbols)
+            price_vec = np.fromiter((price_lookup.get(s, 0.0) for s in symbols),
+                                    dtype=np.float64, count=n)
+            change_pct_vec = np.fromiter(
+                (float(stats_lookup.get(s, {}).get('priceChangePercent', 0)) for s in symbols),
+                dtype=np.float64, count=n)
+            values = self._amounts * price_vec
+            change_values = price_vec * change_pct_vec * 0.01 * self._amounts
+            
+            holdings_value = {}
+            holdings_performance = {}
+            for symbol, amount, price, value, change_pct, change_value in zip(
+                    symbols, self._amounts.tolist(), price_vec.tolist(),
+                    values.tolist(), change_pct_vec.tolist(), change_values.tolist()):
+                holdings_value[symbol] = {'amount': amount, 'price': price, 'value': value}
+                holdings_performance[symbol] = {
+                    'change_24h_pct': change_pct,
+                    'change_24h_value': change_value
+                }
+            
+            total_value = float(values.sum())
+            total_change_24h = float(change_values.sum())
+            total_change_pct = (total_change_24h / total_value) * 100 if total_value > 0 else 0
+            
+            return {
+                'total_value': total_value,
+                'holdings': holdings_value,
+                'last_updated': datetime.now().isoformat(),
+                'total_change_24h_value': total_change_24h,
+                'total_change_24h_pct': total_change_pct,
+                'holdings_performance': holdings_performance
+            }
+            
+        except Exception as e:
+            print(f"❌ Error computing portfolio snapshot: {e}")
+            return None
+    
+    def get_portfolio_value(self):
+        """Calculate current portfolio value"""
+        snapshot = self._snapshot()
+        if not snapshot:
+            return None
+        return {key: snapshot[key] for key in ('total_value', 'holdings', 'last_updated')}
+    
+    def display_portfolio(self):
+        """Display current portfolio"""
+        print("\n💼 PORTFOLIO OVERVIEW")
+        print("=" * 60)
+        
+        portfolio_value = self.get_portfolio_value()
+        if not portfolio_value:
+            print("❌ Could not calculate portfolio value")
+            return
+        
+        total_value = portfolio_value['total_value']
+        holdings = portfolio_value['holdings']
+        
+        print(f"Total Portfolio Value: {format_price(total_value)}")
+        print(f"Last Updated: {portfolio_value['last_updated']}")
+        print()
+        
+        if not holdings:
+            print("No holdings in portfolio")
+            return
+        
+        print(f"{'Symbol':<12} {'Amount':<15} {'Price':<15} {'Value':<15} {'%':<8}")
+        print("-" * 70)
+        
+        for symbol, data in holdings.items():
+            amount = data['amount']
+            price = data['price']
+            value = data['value']
+            percentage = (value / total_value) * 100 if total_value > 0 else 0
+            
+            price_str = self._price_formatter(symbol, price)(price)
+            print(f"{symbol:<12} {amount:<15.6f} {price_str:<15} "
+                  f"{format_price(value):<15} {percentage:<7.2f}%")
+    
+    def get_portfolio_performance(self, portfolio_value=None):
+        """
+        Get portfolio performance metrics
+        
+        Args:
+            portfolio_value: Unused, kept for backward compatibility —
+                the fused snapshot already computes value and change
+                together
+        """
+        snapshot = self._snapshot()
+        if not snapshot:
+            return None
+        return {key: snapshot[key] for key in ('total_change_24h_value',
+                                               'total_change_24h_pct',
+                                               'holdings_performance')}
+    
+    def display_performance(self):
+        """Display portfolio performance"""
+        print("\n📈 PORTFOLIO PERFORMANCE (24h)")
+        print("=" * 50)
+        
+        performance = self.get_portfolio_performance()
+        if not performance:
+            print("❌ Could not calculate performance")
+            return
+        
+        total_change_value = performance['total_change_24h_value']
+        total_change_pct = performance['total_change_24h_pct']
+        
+        # Format change with color coding
+        if total_change_value > 0:
+            change_str = f"+{format_price(total_change_value)} (+{total_change_pct:.2f}%)"
+        elif total_change_value < 0:
+            change_str = f"{format_price(total_change_value)} ({total_change_pct:.2f}%)"
+        else:
+            change_str = f"{format_price(total_change_value)} (0.00%)"
+        
+        print(f"24h Change: {change_str}")
+        print()
+        
+        print(f"{'Symbol':<12} {'24h Change %':<12} {'24h Change $':<15}")
+        print("-" * 40)
+        
+        for symbol, perf in performance['holdings_performance'].items():
+            change_pct = perf['change_24h_pct']
+            change_value = perf['change_24h_value']
+            
+            if change_pct > 0:
+                change_pct_str = f"+{change_pct:.2f}%"
+            else:
+                change_pct_str = f"{change_pct:.2f}%"
+            
+            print(f"{symbol:<12} {change_pct_str:<12} {format_price(change_value):<15}")
+    
+    def export_portfolio_report(self):
+        """Export comprehensive portfolio report"""
+        print("\n💾 EXPORTING PORTFOLIO REPORT")
+        print("=" * 35)
+        
+        try:
+            snapshot = self._snapshot()
+            
+            if not snapshot:
+                print("❌ Could not generate report")
+                return
+            
+            # One clock read covers both the report stamp and the filename
+            now = datetime.now()
+            report = {
+                'timestamp': now.isoformat(),
+                'portfolio': self.portfolio,
+                'current_value': {key: snapshot[key] for key in
+                                  ('total_value', 'holdings', 'last_updated')},
+                'performance': {key: snapshot[key] for key in
+                                ('total_change_24h_value', 'total_change_24h_pct',
+                                 'holdings_performance')}
+            }
+            
+            filename = f"portfolio_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
+            # Encode once to bytes and write in a single call — the
+            # report never round-trips through the stdlib encoder
+            with open(filename, 'wb') as f:
+                f.write(_dumps(report))
+            
+            print(f"✅ Portfolio report exported to {filename}")
+            
+        except Exception as e:
+            print(f"❌ Error exporting portfolio report: {e}")
+
+
+def _prompt_symbol_amount(prompt):
+    """Read a symbol and amount from the console
+    
+    Args:
+        prompt: Prompt shown for the amount field
+        
+    Returns:
+        (symbol, amount) tuple, or None on an invalid amount
+    """
+    symbol = input("Enter symbol (e.g., BTCUSDT): ").strip().upper()
+    try:
+        amount = float(input(prompt))
+    except ValueError:
+        print("❌ Invalid amount")
+        return None
+    return symbol, amount
+
+
+def _update_holding(tracker):
+    parsed = _prompt_symbol_amount("Enter amount: ")
+    if parsed:
+        tracker.update_portfolio(*parsed)
+
+
+def _add_holding(tracker):
+    parsed = _prompt_symbol_amount("Enter amount to add: ")
+    if parsed:
+        tracker.add_holding(*parsed)
+
+
+def _remove_holding(tracker):
+    parsed = _prompt_symbol_amount("Enter amount to remove: ")
+    if parsed:
+        tracker.remove_holding(*parsed)
+
+
+# Menu choice → handler; adding a command means adding a row here
+_HANDLERS = {
+    "1": AsterPortfolioTracker.display_portfolio,
+    "2": AsterPortfolioTracker.display_performance,
+    "3": _update_holding,
+    "4": _add_holding,
+    "5": _remove_holding,
+    "6": AsterPortfolioTracker.export_portfolio_report,
+}
+
+
+def main():
+    """Main function for portfolio tracking"""
+    print("🚀 ASTER SDK - PORTFOLIO TRACKER")
+    print("=" * 40)
+    
+    tracker = AsterPortfolioTracker()
+    
+    while True:
+        print("\nPortfolio Tracker Options:")
+        print("1. View portfolio")
+        print("2. View performance")
+        print("3. Update holding")
+        print("4. Add to holding")
+        print("5. Remove from holding")
+        print("6. Export report")
+        print("0. Exit")
+        
+        choice = input("\nEnter your choice (0-6): ").strip()
+        
+        if choice == "0":
+            print("Goodbye!")
+            break
+        
+        handler = _HANDLERS.get(choice)
+        if handler is not None:
+            handler(tracker)
+        else:
+            print("Invalid choice. Please try again.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,546 +1,854 @@
-"""
-Aster SDK - Market Scanner
-Advanced market scanning for trading opportunities
-"""
-
-import sys
-import os
-import time
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from aster_sdk_fixed.info import Info
-from aster_sdk.utils.constants import MAINNET_API_URL
-from aster_example_utils import format_price, format_volume, format_percentage, save_data_to_file
-
-
-class MarketScanner:
-    """Advanced market scanner for trading opportunities"""
-    
-    def __init__(self):
-        """Initialize market scanner"""
-        self.info = Info(MAINNET_API_URL)
-        self.scan_results = []
-        self.alert_history = []
-    
-    def scan_volume_spikes(self, min_volume_increase: float = 2.0, min_volume: float = 1000000) -> List[Dict[str, Any]]:
-        """
-        Scan for volume spikes
-        
-        Args:
-            min_volume_increase: Minimum volume increase multiplier
-            min_volume: Minimum volume threshold
-            
-        Returns:
-            List of symbols with volume spikes
-        """
-        try:
-            print("Scanning for volume spikes...")
-            
-            # Get 24hr statistics
-            stats_24hr = self.info.ticker_24hr()
-            
-            volume_spikes = []
-            for ticker in stats_24hr:
-                symbol = ticker.get('symbol', '')
-                volume = float(ticker.get('volume', 0))
-                price = float(ticker.get('lastPrice', 0))
-                change_pct = float(ticker.get('priceChangePercent', 0))
-                
-                # Calculate volume value
-                volume_value = volume * price
-                
-                if volume_value >= min_volume:
-                    # For now, we'll use a simple heuristic for volume spikes
-                    # In a real implementation, you'd compare with historical averages
-                    if abs(change_pct) > 5:  # Significant price movement
-                        volume_spikes.append({
-                            'symbol': symbol,
-                            'volume': volume,
-                            'volume_value': volume_value,
-                            'price': price,
-                            'change_pct': change_pct,
-                            'type': 'VOLUME_SPIKE',
-                            'timestamp': datetime.now().isoformat()
-                        })
-            
-            # Sort by volume value
-            volume_spikes.sort(key=lambda x: x['volume_value'], reverse=True)
-            
-            return volume_spikes[:20]  # Top 20
-            
-        except Exception as e:
-            print(f"Error scanning volume spikes: {e}")
-            return []
-    
-    def scan_price_breakouts(self, min_change: float = 10.0) -> List[Dict[str, Any]]:
-        """
-        Scan for price breakouts
-        
-        Args:
-            min_change: Minimum price change percentage
-            
-        Returns:
-            List of symbols with price breakouts
-        """
-        try:
-            print("Scanning for price breakouts...")
-            
-            stats_24hr = self.info.ticker_24hr()
-            
-            breakouts = []
-            for ticker in stats_24hr:
-                symbol = ticker.get('symbol', '')
-                change_pct = float(ticker.get('priceChangePercent', 0))
-                price = float(ticker.get('lastPrice', 0))
-                volume = float(ticker.get('volume', 0))
-                high = float(ticker.get('highPrice', 0))
-                low = float(ticker.get('lowPrice', 0))
-                
-                if abs(change_pct) >= min_change:
-                    # Calculate volatility
-                    volatility = ((high - low) / low * 100) if low > 0 else 0
-                    
-                    breakouts.append({
-                        'symbol': symbol,
-                        'price': price,
-                        'change_pct': change_pct,
-                        'volume': volume,
-                        'volatility': volatility,
-                        'high': high,
-                        'low': low,
-                        'type': 'PRICE_BREAKOUT',
-                        'direction': 'UP' if change_pct > 0 else 'DOWN',
-                        'timestamp': datetime.now().isoformat()
-                    })
-            
-            # Sort by absolute change
-            breakouts.sort(key=lambda x: abs(x['change_pct']), reverse=True)
-            
-            return breakouts[:20]  # Top 20
-            
-        except Exception as e:
-            print(f"Error scanning price breakouts: {e}")
-            return []
-    
-    def scan_oversold_overbought(self, rsi_threshold: float = 30.0, overbought_threshold: float = 70.0) -> List[Dict[str, Any]]:
-        """
-        Scan for oversold/overbought conditions
-        
-        Args:
-            rsi_threshold: RSI threshold for oversold
-            overbought_threshold: RSI threshold for overbought
-            
-        Returns:
-            List of symbols with oversold/overbought conditions
-        """
-        try:
-            print("Scanning for oversold/overbought conditions...")
-            
-            stats_24hr = self.info.ticker_24hr()
-            
-            conditions = []
-            for ticker in stats_24hr:
-                symbol = ticker.get('symbol', '')
-                change_pct = float(ticker.get('priceChangePercent', 0))
-                price = float(ticker.get('lastPrice', 0))
-                volume = float(ticker.get('volume', 0))
-                
-                # Simple RSI approximation using price change
-                # In a real implementation, you'd calculate actual RSI
-                rsi_approx = 50 + (change_pct * 2)  # Rough approximation
-                rsi_approx = max(0, min(100, rsi_approx))
-                
-                if rsi_approx <= rsi_threshold:
-                    conditions.append({
-                        'symbol': symbol,
-                        'price': price,
-                        'change_pct': change_pct,
-                        'volume': volume,
-                        'rsi_approx': rsi_approx,
-                        'type': 'OVERSOLD',
-                        'timestamp': datetime.now().isoformat()
-                    })
-                elif rsi_approx >= overbought_threshold:
-                    conditions.append({
-                        'symbol': symbol,
-                        'price': price,
-                        'change_pct': change_pct,
-                        'volume': volume,
-                        'rsi_approx': rsi_approx,
-                        'type': 'OVERBOUGHT',
-                        'timestamp': datetime.now().isoformat()
-                    })
-            
-            # Sort by RSI value
-            conditions.sort(key=lambda x: abs(x['rsi_approx'] - 50), reverse=True)
-            
-            return conditions[:20]  # Top 20
-            
-        except Exception as e:
-            print(f"Error scanning oversold/overbought: {e}")
-            return []
-    
-    def scan_momentum(self, min_momentum: float = 5.0) -> List[Dict[str, Any]]:
-        """
-        Scan for momentum opportunities
-        
-        Args:
-            min_momentum: Minimum momentum threshold
-            
-        Returns:
-            List of symbols with momentum
-        """
-        try:
-            print("Scanning for momentum opportunities...")
-            
-            stats_24hr = self.info.ticker_24hr()
-            
-            momentum_list = []
-            for ticker in stats_24hr:
-                symbol = ticker.get('symbol', '')
-                change_pct = float(ticker.get('priceChangePercent', 0))
-                price = float(ticker.get('lastPrice', 0))
-                volume = float(ticker.get('volume', 0))
-                
-                if abs(change_pct) >= min_momentum:
-                    # Calculate momentum score
-                    volume_score = min(10, volume / 1000000)  # Volume score
-                    price_score = abs(change_pct) / 10  # Price change score
-                    momentum_score = volume_score + price_score
-                    
-                    momentum_list.append({
-                        'symbol': symbol,
-                        'price': price,
-                        'change_pct': change_pct,
-                        'volume': volume,
-                        'momentum_score': momentum_score,
-                        'type': 'MOMENTUM',
-                        'direction': 'UP' if change_pct > 0 else 'DOWN',
-                        'timestamp': datetime.now().isoformat()
-                    })
-            
-            # Sort by momentum score
-            momentum_list.sort(key=lambda x: x['momentum_score'], reverse=True)
-            
-            return momentum_list[:20]  # Top 20
-            
-        except Exception as e:
-            print(f"Error scanning momentum: {e}")
-            return []
-    
-    def scan_arbitrage_opportunities(self, min_spread: float = 0.5) -> List[Dict[str, Any]]:
-        """
-        Scan for arbitrage opportunities
-        
-        Args:
-            min_spread: Minimum spread percentage
-            
-        Returns:
-            List of arbitrage opportunities
-        """
-        try:
-            print("Scanning for arbitrage opportunities...")
-            
-            # Get best bid/ask prices
-            best_prices = self.info.ticker_book_ticker()
-            
-            arbitrage_ops = []
-            for price_data in best_prices:
-                symbol = price_data.get('symbol', '')
-                bid_price = float(price_data.get('bidPrice', 0))
-                ask_price = float(price_data.get('askPrice', 0))
-                bid_qty = float(price_data.get('bidQty', 0))
-                ask_qty = float(price_data.get('askQty', 0))
-                
-                if bid_price > 0 and ask_price > 0:
-                    spread = ((ask_price - bid_price) / bid_price) * 100
-                    
-                    if spread >= min_spread:
-                        arbitrage_ops.append({
-                            'symbol': symbol,
-                            'bid_price': bid_price,
-                            'ask_price': ask_price,
-                            'bid_qty': bid_qty,
-                            'ask_qty': ask_qty,
-                            'spread_pct': spread,
-                            'type': 'ARBITRAGE',
-                            'timestamp': datetime.now().isoformat()
-                        })
-            
-            # Sort by spread
-            arbitrage_ops.sort(key=lambda x: x['spread_pct'], reverse=True)
-            
-            return arbitrage_ops[:10]  # Top 10
-            
-        except Exception as e:
-            print(f"Error scanning arbitrage opportunities: {e}")
-            return []
-    
-    def comprehensive_scan(self) -> Dict[str, List[Dict[str, Any]]]:
-        """
-        Perform comprehensive market scan
-        
-        Returns:
-            Dictionary with all scan results
-        """
-        print("Performing comprehensive market scan...")
-        
-        results = {
-            'volume_spikes': self.scan_volume_spikes(),
-            'price_breakouts': self.scan_price_breakouts(),
-            'oversold_overbought': self.scan_oversold_overbought(),
-            'momentum': self.scan_momentum(),
-            'arbitrage': self.scan_arbitrage_opportunities(),
-            'scan_time': datetime.now().isoformat()
-        }
-        
-        self.scan_results = results
-        return results
-    
-    def display_scan_results(self, results: Dict[str, List[Dict[str, Any]]]):
-        """Display scan results in formatted output"""
-        print("\nMARKET SCAN RESULTS")
-        print("=" * 80)
-        print(f"Scan Time: {results['scan_time']}")
-        
-        # Volume Spikes
-        if results['volume_spikes']:
-            print(f"\nVOLUME SPIKES (Top {len(results['volume_spikes'])})")
-            print("-" * 60)
-            print(f"{'Symbol':<12} {'Price':<12} {'Volume':<15} {'Change %':<10}")
-            for item in results['volume_spikes'][:10]:
-                print(f"{item['symbol']:<12} {format_price(item['price']):<12} "
-                      f"{format_volume(item['volume_value']):<15} {format_percentage(str(item['change_pct'])):<10}")
-        
-        # Price Breakouts
-        if results['price_breakouts']:
-            print(f"\nPRICE BREAKOUTS (Top {len(results['price_breakouts'])})")
-            print("-" * 60)
-            print(f"{'Symbol':<12} {'Price':<12} {'Change %':<10} {'Direction':<10} {'Volatility':<12}")
-            for item in results['price_breakouts'][:10]:
-                print(f"{item['symbol']:<12} {format_price(item['price']):<12} "
-                      f"{format_percentage(str(item['change_pct'])):<10} {item['direction']:<10} {item['volatility']:<11.2f}%")
-        
-        # Oversold/Overbought
-        if results['oversold_overbought']:
-            print(f"\nOVERSOLD/OVERBOUGHT (Top {len(results['oversold_overbought'])})")
-            print("-" * 60)
-            print(f"{'Symbol':<12} {'Price':<12} {'RSI':<8} {'Type':<12} {'Change %':<10}")
-            for item in results['oversold_overbought'][:10]:
-                print(f"{item['symbol']:<12} {format_price(item['price']):<12} "
-                      f"{item['rsi_approx']:<7.1f} {item['type']:<12} {format_percentage(str(item['change_pct'])):<10}")
-        
-        # Momentum
-        if results['momentum']:
-            print(f"\nMOMENTUM OPPORTUNITIES (Top {len(results['momentum'])})")
-            print("-" * 60)
-            print(f"{'Symbol':<12} {'Price':<12} {'Momentum':<10} {'Direction':<10} {'Change %':<10}")
-            for item in results['momentum'][:10]:
-                print(f"{item['symbol']:<12} {format_price(item['price']):<12} "
-                      f"{item['momentum_score']:<9.2f} {item['direction']:<10} {format_percentage(str(item['change_pct'])):<10}")
-        
-        # Arbitrage
-        if results['arbitrage']:
-            print(f"\nARBITRAGE OPPORTUNITIES (Top {len(results['arbitrage'])})")
-            print("-" * 60)
-            print(f"{'Symbol':<12} {'Bid':<12} {'Ask':<12} {'Spread %':<10}")
-            for item in results['arbitrage'][:10]:
-                print(f"{item['symbol']:<12} {format_price(item['bid_price']):<12} "
-                      f"{format_price(item['ask_price']):<12} {item['spread_pct']:<9.2f}%")
-    
-    def create_alerts(self, results: Dict[str, List[Dict[str, Any]]], alert_thresholds: Dict[str, float]):
-        """
-        Create alerts based on scan results
-        
-        Args:
-            results: Scan results
-            alert_thresholds: Alert thresholds
-        """
-        alerts = []
-        
-        # Volume spike alerts
-        for item in results.get('volume_spikes', []):
-            if item['change_pct'] >= alert_thresholds.get('volume_spike_change', 10):
-                alerts.append({
-                    'type': 'VOLUME_SPIKE',
-                    'symbol': item['symbol'],
-                    'message': f"Volume spike detected: {item['symbol']} +{item['change_pct']:.1f}%",
-                    'priority': 'HIGH' if item['change_pct'] > 20 else 'MEDIUM',
-                    'timestamp': datetime.now().isoformat()
-                })
-        
-        # Price breakout alerts
-        for item in results.get('price_breakouts', []):
-            if abs(item['change_pct']) >= alert_thresholds.get('breakout_change', 15):
-                alerts.append({
-                    'type': 'PRICE_BREAKOUT',
-                    'symbol': item['symbol'],
-                    'message': f"Price breakout: {item['symbol']} {item['change_pct']:+.1f}%",
-                    'priority': 'HIGH' if abs(item['change_pct']) > 25 else 'MEDIUM',
-                    'timestamp': datetime.now().isoformat()
-                })
-        
-        # Oversold/Overbought alerts
-        for item in results.get('oversold_overbought', []):
-            if item['type'] == 'OVERSOLD' and item['rsi_approx'] <= alert_thresholds.get('oversold_rsi', 25):
-                alerts.append({
-                    'type': 'OVERSOLD',
-                    'symbol': item['symbol'],
-                    'message': f"Oversold condition: {item['symbol']} RSI {item['rsi_approx']:.1f}",
-                    'priority': 'MEDIUM',
-                    'timestamp': datetime.now().isoformat()
-                })
-            elif item['type'] == 'OVERBOUGHT' and item['rsi_approx'] >= alert_thresholds.get('overbought_rsi', 75):
-                alerts.append({
-                    'type': 'OVERBOUGHT',
-                    'symbol': item['symbol'],
-                    'message': f"Overbought condition: {item['symbol']} RSI {item['rsi_approx']:.1f}",
-                    'priority': 'MEDIUM',
-                    'timestamp': datetime.now().isoformat()
-                })
-        
-        self.alert_history.extend(alerts)
-        return alerts
-    
-    def export_scan_results(self, results: Dict[str, List[Dict[str, Any]]], filename: Optional[str] = None):
-        """Export scan results to JSON"""
-        if filename is None:
-            filename = f"aster_scan_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        save_data_to_file(results, filename)
-        print(f"Scan results exported to {filename}")
-    
-    def monitor_market(self, interval: int = 300, alert_thresholds: Optional[Dict[str, float]] = None):
-        """
-        Monitor market continuously
-        
-        Args:
-            interval: Monitoring interval in seconds
-            alert_thresholds: Alert thresholds
-        """
-        if alert_thresholds is None:
-            alert_thresholds = {
-                'volume_spike_change': 10,
-                'breakout_change': 15,
-                'oversold_rsi': 25,
-                'overbought_rsi': 75
-            }
-        
-        print(f"Starting market monitoring (interval: {interval}s)")
-        print("Press Ctrl+C to stop")
-        
-        try:
-            while True:
-                # Clear screen
-                os.system('cls' if os.name == 'nt' else 'clear')
-                
-                print("ASTER MARKET MONITOR")
-                print("=" * 50)
-                print(f"Last Update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Perform scan
-                results = self.comprehensive_scan()
-                
-                # Create alerts
-                alerts = self.create_alerts(results, alert_thresholds)
-                
-                # Display results
-                self.display_scan_results(results)
-                
-                # Display alerts
-                if alerts:
-                    print(f"\nALERTS ({len(alerts)})")
-                    print("-" * 40)
-                    for alert in alerts[-5:]:  # Show last 5 alerts
-                        priority_icon = "🔴" if alert['priority'] == 'HIGH' else "🟡"
-                        print(f"{priority_icon} {alert['message']}")
-                
-                print(f"\nNext scan in {interval} seconds...")
-                time.sleep(interval)
-                
-        except KeyboardInterrupt:
-            print("\nMarket monitoring stopped")
-
-
-def main():
-    """Main function for market scanner demo"""
-    print("ASTER SDK - MARKET SCANNER")
-    print("=" * 40)
-    
-    try:
-        scanner = MarketScanner()
-        
-        while True:
-            print("\nMarket Scanner Options:")
-            print("1. Scan volume spikes")
-            print("2. Scan price breakouts")
-            print("3. Scan oversold/overbought")
-            print("4. Scan momentum")
-            print("5. Scan arbitrage opportunities")
-            print("6. Comprehensive scan")
-            print("7. Monitor market (continuous)")
-            print("8. Export last scan results")
-            print("0. Exit")
-            
-            choice = input("\nEnter your choice (0-8): ").strip()
-            
-            if choice == "0":
-                print("Goodbye!")
-                break
-            elif choice == "1":
-                # Volume spikes
-                results = scanner.scan_volume_spikes()
-                scanner.display_scan_results({'volume_spikes': results, 'scan_time': datetime.now().isoformat()})
-                
-            elif choice == "2":
-                # Price breakouts
-                results = scanner.scan_price_breakouts()
-                scanner.display_scan_results({'price_breakouts': results, 'scan_time': datetime.now().isoformat()})
-                
-            elif choice == "3":
-                # Oversold/overbought
-                results = scanner.scan_oversold_overbought()
-                scanner.display_scan_results({'oversold_overbought': results, 'scan_time': datetime.now().isoformat()})
-                
-            elif choice == "4":
-                # Momentum
-                results = scanner.scan_momentum()
-                scanner.display_scan_results({'momentum': results, 'scan_time': datetime.now().isoformat()})
-                
-            elif choice == "5":
-                # Arbitrage
-                results = scanner.scan_arbitrage_opportunities()
-                scanner.display_scan_results({'arbitrage': results, 'scan_time': datetime.now().isoformat()})
-                
-            elif choice == "6":
-                # Comprehensive scan
-                results = scanner.comprehensive_scan()
-                scanner.display_scan_results(results)
-                
-            elif choice == "7":
-                # Monitor market
-                interval = input("Enter monitoring interval in seconds (default 300): ").strip()
-                interval = int(interval) if interval.isdigit() else 300
-                scanner.monitor_market(interval)
-                
-            elif choice == "8":
-                # Export results
-                if scanner.scan_results:
-                    scanner.export_scan_results(scanner.scan_results)
-                else:
-                    print("No scan results to export. Run a scan first.")
-                    
-            else:
-                print("Invalid choice. Please try again.")
-    
-    except Exception as e:
-        print(f"Error in market scanner: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    main()
+"""
+Aster SDK - Market Scanner
+Advanced market scanning for trading opportunities
+"""
+
+import sys
+import os
+import time
+import json
+import heapq
+import math
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple
+from operator import attrgetter, itemgetter
+
+import numpy as np
+import requests
+
+try:
+    import httpx
+except ImportError:  # async monitoring falls back to the sync loop
+    httpx = None
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aster_sdk_fixed.info import Info
+from aster_sdk_fixed.api import _loads
+from aster_sdk.utils.constants import MAINNET_API_URL
+from aster_example_utils import format_price, format_volume, format_percentage, save_data_to_file
+from _kernels import score_momentum, rsi_approx
+
+
+# One C-level fetch of all six hot ticker fields per row, instead of
+# six separate dict.get calls
+_PULL_TICKER = itemgetter('symbol', 'lastPrice', 'volume',
+                          'priceChangePercent', 'highPrice', 'lowPrice')
+
+
+class _ArbRow(NamedTuple):
+    """Lightweight candidate row for the arbitrage scan
+    
+    A NamedTuple costs a fraction of a dict per row and lets the top-K
+    selection compare attributes instead of hashing keys; only the
+    surviving rows are expanded into dicts for the public result.
+    """
+    symbol: str
+    bid_price: float
+    ask_price: float
+    bid_qty: float
+    ask_qty: float
+    spread_pct: float
+
+
+class MarketScanner:
+    """Advanced market scanner for trading opportunities"""
+    
+    def __init__(self):
+        """Initialize market scanner"""
+        # Info's session already keeps connections alive with a sized
+        # HTTPAdapter pool, so repeated monitor passes reuse TCP+TLS;
+        # the explicit timeout keeps a stalled endpoint from wedging
+        # the monitor loop
+        self.info = Info(MAINNET_API_URL, timeout=10)
+        self.scan_results = []
+        self.alert_history = []
+        # TTL memo for the 24hr ticker payload shared by the scans,
+        # revalidated with If-None-Match once the TTL lapses
+        self.ticker_ttl = 5.0
+        self._ticker_24hr_cache = None
+        self._ticker_24hr_etag = None
+    
+    def _cached_ticker_24hr(self):
+        """Fetch the 24hr ticker payload, reusing a recent one
+        
+        Within ticker_ttl seconds the cached list is returned as-is;
+        after that a conditional GET revalidates it, so an unchanged
+        snapshot costs a body-less 304 instead of a full payload parse.
+        
+        Returns:
+            The parsed ticker list
+        """
+        cached = self._ticker_24hr_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.ticker_ttl:
+            return cached[1]
+        
+        headers = {}
+        if cached is not None and self._ticker_24hr_etag:
+            headers['If-None-Match'] = self._ticker_24hr_etag
+        
+        try:
+            response = self.info.session.get(self.info.base_url + "/fapi/v1/ticker/24hr",
+                                             headers=headers, timeout=self.info.timeout)
+        except requests.exceptions.RequestException:
+            # Fall back to the standard path (and its error handling)
+            payload = self.info.ticker_24hr()
+            self._ticker_24hr_cache = (now, payload)
+            return payload
+        
+        if response.status_code == 304 and cached is not None:
+            self._ticker_24hr_cache = (now, cached[1])
+            return cached[1]
+        
+        self.info._handle_exception(response)
+        payload = _loads(response.content)
+        self._ticker_24hr_etag = response.headers.get('ETag')
+        self._ticker_24hr_cache = (now, payload)
+        return payload
+    
+    @staticmethod
+    def _normalize_stats(stats_24hr: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert raw ticker rows into structure-of-arrays columns
+        
+        Each field is parsed exactly once into a contiguous float64
+        column; every scan then reads the columns instead of repeating
+        dict.get and float() per ticker.
+        
+        Args:
+            stats_24hr: 24hr ticker payload
+            
+        Returns:
+            Dict with a 'symbol' list and float64 columns for price,
+            volume, change_pct, high and low
+        """
+        n = len(stats_24hr)
+        symbols = []
+        price = np.empty(n, dtype=np.float64)
+        volume = np.empty(n, dtype=np.float64)
+        change = np.empty(n, dtype=np.float64)
+        high = np.empty(n, dtype=np.float64)
+        low = np.empty(n, dtype=np.float64)
+        
+        pull = _PULL_TICKER
+        append = symbols.append
+        _float = float
+        for i, t in enumerate(stats_24hr):
+            try:
+                sym, p, v, c, hi, lo = pull(t)
+            except KeyError:
+                # Rare sparse row: fall back to defaulted lookups
+                sym = t.get('symbol', '')
+                p, v, c = t.get('lastPrice', 0), t.get('volume', 0), t.get('priceChangePercent', 0)
+                hi, lo = t.get('highPrice', 0), t.get('lowPrice', 0)
+            append(sym)
+            price[i] = _float(p)
+            volume[i] = _float(v)
+            change[i] = _float(c)
+            high[i] = _float(hi)
+            low[i] = _float(lo)
+        
+        return {
+            'symbol': symbols,
+            'price': price,
+            'volume': volume,
+            'change_pct': change,
+            'high': high,
+            'low': low,
+        }
+    
+    def _scan_all_from_stats(self, stats_24hr,
+                             min_volume: float = 1000000,
+                             min_change: float = 10.0,
+                             rsi_threshold: float = 30.0,
+                             overbought_threshold: float = 70.0,
+                             min_momentum: float = 5.0,
+                             alert_thresholds: Optional[Dict[str, float]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Evaluate every stats-based scan in a single pass
+        
+        Each ticker's fields are parsed once and run through all four
+        predicates, instead of four loops re-parsing the same strings.
+        
+        Args:
+            stats_24hr: 24hr ticker payload, raw or already normalized
+                via _normalize_stats
+            min_volume: Volume-spike quote-volume threshold
+            min_change: Breakout change threshold (percent)
+            rsi_threshold: Oversold RSI threshold
+            overbought_threshold: Overbought RSI threshold
+            min_momentum: Momentum change threshold (percent)
+            alert_thresholds: When given, alert dicts are produced in the
+                same pass under an extra 'alerts' key
+            
+        Returns:
+            Dict of unsorted result lists keyed by category
+        """
+        now_iso = datetime.now().isoformat()
+        volume_spikes = []
+        breakouts = []
+        conditions = []
+        momentum_list = []
+        alerts = []
+        
+        # Accept either raw rows or pre-normalized columns, so callers
+        # holding several scans can pay the parse cost once
+        cols = stats_24hr if isinstance(stats_24hr, dict) else self._normalize_stats(stats_24hr)
+        symbols = cols['symbol']
+        if not symbols:
+            empty = {
+                'volume_spikes': volume_spikes,
+                'price_breakouts': breakouts,
+                'oversold_overbought': conditions,
+                'momentum': momentum_list
+            }
+            if alert_thresholds is not None:
+                empty['alerts'] = alerts
+            return empty
+        price = cols['price']
+        volume = cols['volume']
+        change = cols['change_pct']
+        high = cols['high']
+        low = cols['low']
+        
+        abs_change = np.abs(change)
+        volume_value = volume * price
+        rsi = rsi_approx(change)
+        
+        # Volume spikes: heavy quote volume plus significant movement
+        spike_alert_chg = (alert_thresholds.get('volume_spike_change', 10)
+                           if alert_thresholds is not None else None)
+        for i in np.flatnonzero((volume_value >= min_volume) & (abs_change > 5)):
+            volume_spikes.append({
+                'symbol': symbols[i],
+                'volume': volume[i],
+                'volume_value': volume_value[i],
+                'price': price[i],
+                'change_pct': change[i],
+                'type': 'VOLUME_SPIKE',
+                'timestamp': now_iso
+            })
+            if spike_alert_chg is not None and change[i] >= spike_alert_chg:
+                alerts.append({
+                    'type': 'VOLUME_SPIKE',
+                    'symbol': symbols[i],
+                    'message': f"Volume spike detected: {symbols[i]} +{change[i]:.1f}%",
+                    'priority': 'HIGH' if change[i] > 20 else 'MEDIUM',
+                    'timestamp': now_iso
+                })
+        
+        # Price breakouts; volatility is only computed for the rows that
+        # pass the change filter instead of across the whole universe
+        breakout_alert_chg = (alert_thresholds.get('breakout_change', 15)
+                              if alert_thresholds is not None else None)
+        for i in np.flatnonzero(abs_change >= min_change):
+            lo = low[i]
+            breakouts.append({
+                'symbol': symbols[i],
+                'price': price[i],
+                'change_pct': change[i],
+                'volume': volume[i],
+                'volatility': (high[i] - lo) / lo * 100.0 if lo > 0 else 0.0,
+                'high': high[i],
+                'low': low[i],
+                'type': 'PRICE_BREAKOUT',
+                'direction': 'UP' if change[i] > 0 else 'DOWN',
+                'timestamp': now_iso
+            })
+            if breakout_alert_chg is not None and abs_change[i] >= breakout_alert_chg:
+                alerts.append({
+                    'type': 'PRICE_BREAKOUT',
+                    'symbol': symbols[i],
+                    'message': f"Price breakout: {symbols[i]} {change[i]:+.1f}%",
+                    'priority': 'HIGH' if abs_change[i] > 25 else 'MEDIUM',
+                    'timestamp': now_iso
+                })
+        
+        # Oversold/overbought via the rough RSI approximation
+        oversold = rsi <= rsi_threshold
+        if alert_thresholds is not None:
+            oversold_rsi = alert_thresholds.get('oversold_rsi', 25)
+            overbought_rsi = alert_thresholds.get('overbought_rsi', 75)
+        for i in np.flatnonzero(oversold | (rsi >= overbought_threshold)):
+            conditions.append({
+                'symbol': symbols[i],
+                'price': price[i],
+                'change_pct': change[i],
+                'volume': volume[i],
+                'rsi_approx': rsi[i],
+                'type': 'OVERSOLD' if oversold[i] else 'OVERBOUGHT',
+                'timestamp': now_iso
+            })
+            if alert_thresholds is not None and (
+                    rsi[i] <= oversold_rsi if oversold[i] else rsi[i] >= overbought_rsi):
+                kind = 'OVERSOLD' if oversold[i] else 'OVERBOUGHT'
+                alerts.append({
+                    'type': kind,
+                    'symbol': symbols[i],
+                    'message': f"{kind.capitalize()} condition: {symbols[i]} RSI {rsi[i]:.1f}",
+                    'priority': 'MEDIUM',
+                    'timestamp': now_iso
+                })
+        
+        # Momentum: the jitted kernel fuses mask and score in one loop
+        mom_mask, mom_score = score_momentum(volume, change, min_momentum)
+        for i in np.flatnonzero(mom_mask):
+            momentum_list.append({
+                'symbol': symbols[i],
+                'price': price[i],
+                'change_pct': change[i],
+                'volume': volume[i],
+                'momentum_score': mom_score[i],
+                'type': 'MOMENTUM',
+                'direction': 'UP' if change[i] > 0 else 'DOWN',
+                'timestamp': now_iso
+            })
+        
+        fused = {
+            'volume_spikes': volume_spikes,
+            'price_breakouts': breakouts,
+            'oversold_overbought': conditions,
+            'momentum': momentum_list
+        }
+        if alert_thresholds is not None:
+            fused['alerts'] = alerts
+        return fused
+    
+    def scan_volume_spikes(self, min_volume_increase: float = 2.0, min_volume: float = 1000000,
+                           stats_24hr: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Scan for volume spikes
+        
+        Args:
+            min_volume_increase: Minimum volume increase multiplier
+            min_volume: Minimum volume threshold
+            stats_24hr: Optional prefetched 24hr ticker payload
+            
+        Returns:
+            List of symbols with volume spikes
+        """
+        try:
+            print("Scanning for volume spikes...")
+            
+            if stats_24hr is None:
+                stats_24hr = self._cached_ticker_24hr()
+            
+            volume_spikes = self._scan_all_from_stats(stats_24hr, min_volume=min_volume)['volume_spikes']
+            
+            # Top 20 by volume value: heap selection, no full sort
+            return heapq.nlargest(20, volume_spikes, key=lambda x: x['volume_value'])
+            
+        except Exception as e:
+            print(f"Error scanning volume spikes: {e}")
+            return []
+    
+    def scan_price_breakouts(self, min_change: float = 10.0,
+                             stats_24hr: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Scan for price breakouts
+        
+        Args:
+            min_change: Minimum price change percentage
+            stats_24hr: Optional prefetched 24hr ticker payload
+            
+        Returns:
+            List of symbols with price breakouts
+        """
+        try:
+            print("Scanning for price breakouts...")
+            
+            if stats_24hr is None:
+                stats_24hr = self._cached_ticker_24hr()
+            
+            breakouts = self._scan_all_from_stats(stats_24hr, min_change=min_change)['price_breakouts']
+            
+            # Top 20 by absolute change: heap selection, no full sort
+            return heapq.nlargest(20, breakouts, key=lambda x: math.fabs(x['change_pct']))
+            
+        except Exception as e:
+            print(f"Error scanning price breakouts: {e}")
+            return []
+    
+    def scan_oversold_overbought(self, rsi_threshold: float = 30.0, overbought_threshold: float = 70.0,
+                                 stats_24hr: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Scan for oversold/overbought conditions
+        
+        Args:
+            rsi_threshold: RSI threshold for oversold
+            overbought_threshold: RSI threshold for overbought
+            stats_24hr: Optional prefetched 24hr ticker payload
+            
+        Returns:
+            List of symbols with oversold/overbought conditions
+        """
+        try:
+            print("Scanning for oversold/overbought conditions...")
+            
+            if stats_24hr is None:
+                stats_24hr = self._cached_ticker_24hr()
+            
+            conditions = self._scan_all_from_stats(
+                stats_24hr, rsi_threshold=rsi_threshold,
+                overbought_threshold=overbought_threshold)['oversold_overbought']
+            
+            # Top 20 by RSI extremity: heap selection, no full sort
+            return heapq.nlargest(20, conditions, key=lambda x: math.fabs(x['rsi_approx'] - 50))
+            
+        except Exception as e:
+            print(f"Error scanning oversold/overbought: {e}")
+            return []
+    
+    def scan_momentum(self, min_momentum: float = 5.0,
+                      stats_24hr: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Scan for momentum opportunities
+        
+        Args:
+            min_momentum: Minimum momentum threshold
+            stats_24hr: Optional prefetched 24hr ticker payload
+            
+        Returns:
+            List of symbols with momentum
+        """
+        try:
+            print("Scanning for momentum opportunities...")
+            
+            if stats_24hr is None:
+                stats_24hr = self._cached_ticker_24hr()
+            
+            momentum_list = self._scan_all_from_stats(stats_24hr, min_momentum=min_momentum)['momentum']
+            
+            # Top 20 by momentum score: heap selection, no full sort
+            return heapq.nlargest(20, momentum_list, key=lambda x: x['momentum_score'])
+            
+        except Exception as e:
+            print(f"Error scanning momentum: {e}")
+            return []
+    
+    def scan_arbitrage_opportunities(self, min_spread: float = 0.5,
+                                     best_prices: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Scan for arbitrage opportunities
+        
+        Args:
+            min_spread: Minimum spread percentage
+            best_prices: Optional prefetched book-ticker payload
+            
+        Returns:
+            List of arbitrage opportunities
+        """
+        try:
+            print("Scanning for arbitrage opportunities...")
+            
+            # Get best bid/ask prices
+            if best_prices is None:
+                best_prices = self.info.ticker_book_ticker()
+            
+            arbitrage_ops = []
+            now_iso = datetime.now().isoformat()
+            # Local binds keep the hot loop off global name lookups
+            _float = float
+            _row = _ArbRow
+            for price_data in best_prices:
+                bid_price = _float(price_data.get('bidPrice', 0))
+                ask_price = _float(price_data.get('askPrice', 0))
+                
+                if bid_price > 0 and ask_price > 0:
+                    spread = ((ask_price - bid_price) / bid_price) * 100
+                    
+                    if spread >= min_spread:
+                        arbitrage_ops.append(_row(
+                            price_data.get('symbol', ''),
+                            bid_price,
+                            ask_price,
+                            _float(price_data.get('bidQty', 0)),
+                            _float(price_data.get('askQty', 0)),
+                            spread,
+                        ))
+            
+            # Top 10 by spread: heap selection over the tuple rows; only
+            # the winners are expanded into result dicts
+            top = heapq.nlargest(10, arbitrage_ops, key=attrgetter('spread_pct'))
+            return [dict(row._asdict(), type='ARBITRAGE', timestamp=now_iso)
+                    for row in top]
+            
+        except Exception as e:
+            print(f"Error scanning arbitrage opportunities: {e}")
+            return []
+    
+    def comprehensive_scan(self, stats_24hr: Optional[List[Dict[str, Any]]] = None,
+                           best_prices: Optional[List[Dict[str, Any]]] = None,
+                           alert_thresholds: Optional[Dict[str, float]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Perform comprehensive market scan
+        
+        Args:
+            stats_24hr: Optional prefetched 24hr ticker payload
+            best_prices: Optional prefetched book-ticker payload
+            alert_thresholds: When given, alerts are generated during the
+                fused pass and returned under an 'alerts' key
+        
+        Returns:
+            Dictionary with all scan results
+        """
+        print("Performing comprehensive market scan...")
+        
+        if stats_24hr is None or best_prices is None:
+            # The two endpoints are independent — fetch them concurrently
+            # so the wall clock pays for the slower round-trip, not both
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                stats_future = (executor.submit(self._cached_ticker_24hr)
+                                if stats_24hr is None else None)
+                book_future = (executor.submit(self.info.ticker_book_ticker)
+                               if best_prices is None else None)
+                
+                if stats_future is not None:
+                    try:
+                        stats_24hr = stats_future.result(timeout=30)
+                    except Exception as e:
+                        print(f"Error fetching 24hr tickers: {e}")
+                        stats_24hr = []
+                if book_future is not None:
+                    try:
+                        best_prices = book_future.result(timeout=30)
+                    except Exception as e:
+                        print(f"Error fetching book tickers: {e}")
+                        best_prices = []
+        
+        # Normalize once, then one fused pass covers every stats-based
+        # category; each top-20 cut is heap-selected, not fully sorted
+        fused = self._scan_all_from_stats(self._normalize_stats(stats_24hr),
+                                          alert_thresholds=alert_thresholds)
+        
+        results = {
+            'volume_spikes': heapq.nlargest(20, fused['volume_spikes'],
+                                            key=lambda x: x['volume_value']),
+            'price_breakouts': heapq.nlargest(20, fused['price_breakouts'],
+                                              key=lambda x: math.fabs(x['change_pct'])),
+            'oversold_overbought': heapq.nlargest(20, fused['oversold_overbought'],
+                                                  key=lambda x: math.fabs(x['rsi_approx'] - 50)),
+            'momentum': heapq.nlargest(20, fused['momentum'],
+                                       key=lambda x: x['momentum_score']),
+            'arbitrage': self.scan_arbitrage_opportunities(best_prices=best_prices),
+            'scan_time': datetime.now().isoformat()
+        }
+        if alert_thresholds is not None:
+            results['alerts'] = fused['alerts']
+        
+        self.scan_results = results
+        return results
+    
+    def display_scan_results(self, results: Dict[str, List[Dict[str, Any]]]):
+        """Display scan results in formatted output
+        
+        The frame is assembled into one buffer and flushed with a single
+        write, so a refresh is one syscall instead of ~50 locked prints.
+        """
+        # Local binds skip repeated global lookups in the row loops
+        fmt_price, fmt_vol, fmt_pct = format_price, format_volume, format_percentage
+        
+        lines = ["\nMARKET SCAN RESULTS", "=" * 80,
+                 f"Scan Time: {results.get('scan_time', 'N/A')}"]
+        
+        # Volume Spikes
+        volume_spikes = results.get('volume_spikes', [])
+        if volume_spikes:
+            lines.append(f"\nVOLUME SPIKES (Top {len(volume_spikes)})")
+            lines.append("-" * 60)
+            lines.append(f"{'Symbol':<12} {'Price':<12} {'Volume':<15} {'Change %':<10}")
+            lines.extend(f"{item['symbol']:<12} {fmt_price(item['price']):<12} "
+                         f"{fmt_vol(item['volume_value']):<15} {fmt_pct(item['change_pct']):<10}"
+                         for item in volume_spikes[:10])
+        
+        # Price Breakouts
+        breakouts = results.get('price_breakouts', [])
+        if breakouts:
+            lines.append(f"\nPRICE BREAKOUTS (Top {len(breakouts)})")
+            lines.append("-" * 60)
+            lines.append(f"{'Symbol':<12} {'Price':<12} {'Change %':<10} {'Direction':<10} {'Volatility':<12}")
+            lines.extend(f"{item['symbol']:<12} {fmt_price(item['price']):<12} "
+                         f"{fmt_pct(item['change_pct']):<10} {item['direction']:<10} {item['volatility']:<11.2f}%"
+                         for item in breakouts[:10])
+        
+        # Oversold/Overbought
+        conditions = results.get('oversold_overbought', [])
+        if conditions:
+            lines.append(f"\nOVERSOLD/OVERBOUGHT (Top {len(conditions)})")
+            lines.append("-" * 60)
+            lines.append(f"{'Symbol':<12} {'Price':<12} {'RSI':<8} {'Type':<12} {'Change %':<10}")
+            lines.extend(f"{item['symbol']:<12} {fmt_price(item['price']):<12} "
+                         f"{item['rsi_approx']:<7.1f} {item['type']:<12} {fmt_pct(item['change_pct']):<10}"
+                         for item in conditions[:10])
+        
+        # Momentum
+        momentum = results.get('momentum', [])
+        if momentum:
+            lines.append(f"\nMOMENTUM OPPORTUNITIES (Top {len(momentum)})")
+            lines.append("-" * 60)
+            lines.append(f"{'Symbol':<12} {'Price':<12} {'Momentum':<10} {'Direction':<10} {'Change %':<10}")
+            lines.extend(f"{item['symbol']:<12} {fmt_price(item['price']):<12} "
+                         f"{item['momentum_score']:<9.2f} {item['direction']:<10} {fmt_pct(item['change_pct']):<10}"
+                         for item in momentum[:10])
+        
+        # Arbitrage
+        arbitrage = results.get('arbitrage', [])
+        if arbitrage:
+            lines.append(f"\nARBITRAGE OPPORTUNITIES (Top {len(arbitrage)})")
+            lines.append("-" * 60)
+            lines.append(f"{'Symbol':<12} {'Bid':<12} {'Ask':<12} {'Spread %':<10}")
+            lines.extend(f"{item['symbol']:<12} {fmt_price(item['bid_price']):<12} "
+                         f"{fmt_price(item['ask_price']):<12} {item['spread_pct']:<9.2f}%"
+                         for item in arbitrage[:10])
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def create_alerts(self, results: Dict[str, List[Dict[str, Any]]], alert_thresholds: Dict[str, float]):
+        """
+        Create alerts based on scan results
+        
+        The threshold checks run as vectorized masks over the result
+        columns; alert dicts are built only for the indices that fire.
+        
+        Args:
+            results: Scan results
+            alert_thresholds: Alert thresholds
+        """
+        alerts = []
+        now_iso = datetime.now().isoformat()
+        
+        # Volume spike alerts
+        spikes = results.get('volume_spikes', [])
+        if spikes:
+            chg = np.fromiter((item['change_pct'] for item in spikes),
+                              dtype=np.float64, count=len(spikes))
+            for i in np.flatnonzero(chg >= alert_thresholds.get('volume_spike_change', 10)):
+                item = spikes[i]
+                alerts.append({
+                    'type': 'VOLUME_SPIKE',
+                    'symbol': item['symbol'],
+                    'message': f"Volume spike detected: {item['symbol']} +{item['change_pct']:.1f}%",
+                    'priority': 'HIGH' if chg[i] > 20 else 'MEDIUM',
+                    'timestamp': now_iso
+                })
+        
+        # Price breakout alerts
+        breakouts = results.get('price_breakouts', [])
+        if breakouts:
+            abs_chg = np.fromiter((abs(item['change_pct']) for item in breakouts),
+                                  dtype=np.float64, count=len(breakouts))
+            for i in np.flatnonzero(abs_chg >= alert_thresholds.get('breakout_change', 15)):
+                item = breakouts[i]
+                alerts.append({
+                    'type': 'PRICE_BREAKOUT',
+                    'symbol': item['symbol'],
+                    'message': f"Price breakout: {item['symbol']} {item['change_pct']:+.1f}%",
+                    'priority': 'HIGH' if abs_chg[i] > 25 else 'MEDIUM',
+                    'timestamp': now_iso
+                })
+        
+        # Oversold/Overbought alerts
+        conditions = results.get('oversold_overbought', [])
+        if conditions:
+            n = len(conditions)
+            rsi = np.fromiter((item['rsi_approx'] for item in conditions),
+                              dtype=np.float64, count=n)
+            is_oversold = np.fromiter((item['type'] == 'OVERSOLD' for item in conditions),
+                                      dtype=np.bool_, count=n)
+            fired = np.where(is_oversold,
+                             rsi <= alert_thresholds.get('oversold_rsi', 25),
+                             rsi >= alert_thresholds.get('overbought_rsi', 75))
+            for i in np.flatnonzero(fired):
+                item = conditions[i]
+                kind = 'Oversold' if is_oversold[i] else 'Overbought'
+                alerts.append({
+                    'type': item['type'],
+                    'symbol': item['symbol'],
+                    'message': f"{kind} condition: {item['symbol']} RSI {item['rsi_approx']:.1f}",
+                    'priority': 'MEDIUM',
+                    'timestamp': now_iso
+                })
+        
+        self.alert_history.extend(alerts)
+        return alerts
+    
+    def export_scan_results(self, results: Dict[str, List[Dict[str, Any]]], filename: Optional[str] = None):
+        """Export scan results to JSON"""
+        if filename is None:
+            filename = f"aster_scan_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        
+        save_data_to_file(results, filename)
+        print(f"Scan results exported to {filename}")
+    
+    def monitor_market(self, interval: int = 300, alert_thresholds: Optional[Dict[str, float]] = None):
+        """
+        Monitor market continuously
+        
+        Args:
+            interval: Monitoring interval in seconds
+            alert_thresholds: Alert thresholds
+        """
+        if alert_thresholds is None:
+            alert_thresholds = {
+                'volume_spike_change': 10,
+                'breakout_change': 15,
+                'oversold_rsi': 25,
+                'overbought_rsi': 75
+            }
+        
+        print(f"Starting market monitoring (interval: {interval}s)")
+        print("Press Ctrl+C to stop")
+        
+        try:
+            if httpx is not None:
+                # Async path: the two endpoint fetches overlap without
+                # threads and the sleep yields instead of blocking
+                asyncio.run(self._amonitor(interval, alert_thresholds))
+            else:
+                while True:
+                    self._monitor_tick(interval, alert_thresholds)
+                    time.sleep(interval)
+                
+        except KeyboardInterrupt:
+            print("\nMarket monitoring stopped")
+    
+    def _monitor_tick(self, interval: int, alert_thresholds: Dict[str, float],
+                      stats_24hr: Optional[List[Dict[str, Any]]] = None,
+                      best_prices: Optional[List[Dict[str, Any]]] = None):
+        """One monitoring pass: scan, alert and redraw the frame"""
+        # Clear in-band with ANSI home+erase: no fork/exec of an external
+        # command per tick, and far less flicker (Windows consoles without
+        # ANSI support still get the external cls)
+        if os.name == 'nt':
+            os.system('cls')
+            clear = ''
+        else:
+            clear = '\x1b[H\x1b[2J'
+        
+        sys.stdout.write(f"{clear}ASTER MARKET MONITOR\n{'=' * 50}\n"
+                         f"Last Update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        
+        # Perform scan; alerts come out of the same fused pass instead
+        # of a second traversal of every result category
+        results = self.comprehensive_scan(stats_24hr=stats_24hr, best_prices=best_prices,
+                                          alert_thresholds=alert_thresholds)
+        alerts = results.pop('alerts', [])
+        self.alert_history.extend(alerts)
+        
+        # Display results
+        self.display_scan_results(results)
+        
+        # Display alerts (buffered like the results frame)
+        lines = []
+        if alerts:
+            lines.append(f"\nALERTS ({len(alerts)})")
+            lines.append("-" * 40)
+            lines.extend(f"{'🔴' if alert['priority'] == 'HIGH' else '🟡'} {alert['message']}"
+                         for alert in alerts[-5:])  # Show last 5 alerts
+        
+        lines.append(f"\nNext scan in {interval} seconds...")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
+    async def _amonitor(self, interval: int, alert_thresholds: Dict[str, float]):
+        """
+        Async monitoring loop
+        
+        Both endpoint payloads are fetched concurrently over one httpx
+        connection pool; scanning and display stay synchronous since
+        they are pure CPU work.
+        """
+        async with httpx.AsyncClient(base_url=self.info.base_url, timeout=30.0,
+                                     headers={'Accept-Encoding': 'gzip'}) as client:
+            while True:
+                stats_resp, book_resp = await asyncio.gather(
+                    client.get('/fapi/v1/ticker/24hr'),
+                    client.get('/fapi/v1/ticker/bookTicker'),
+                )
+                self._monitor_tick(interval, alert_thresholds,
+                                   stats_24hr=stats_resp.json(),
+                                   best_prices=book_resp.json())
+                await asyncio.sleep(interval)
+
+
+def main():
+    """Main function for market scanner demo"""
+    print("ASTER SDK - MARKET SCANNER")
+    print("=" * 40)
+    
+    try:
+        scanner = MarketScanner()
+        
+        while True:
+            print("\nMarket Scanner Options:")
+            print("1. Scan volume spikes")
+            print("2. Scan price breakouts")
+            print("3. Scan oversold/overbought")
+            print("4. Scan momentum")
+            print("5. Scan arbitrage opportunities")
+            print("6. Comprehensive scan")
+            print("7. Monitor market (continuous)")
+            print("8. Export last scan results")
+            print("0. Exit")
+            
+            choice = input("\nEnter your choice (0-8): ").strip()
+            
+            if choice == "0":
+                print("Goodbye!")
+                break
+            elif choice == "1":
+                # Volume spikes
+                results = scanner.scan_volume_spikes()
+                scanner.display_scan_results({'volume_spikes': results, 'scan_time': datetime.now().isoformat()})
+                
+            elif choice == "2":
+                # Price breakouts
+                results = scanner.scan_price_breakouts()
+                scanner.display_scan_results({'price_breakouts': results, 'scan_time': datetime.now().isoformat()})
+                
+            elif choice == "3":
+                # Oversold/overbought
+                results = scanner.scan_oversold_overbought()
+                scanner.display_scan_results({'oversold_overbought': results, 'scan_time': datetime.now().isoformat()})
+                
+            elif choice == "4":
+                # Momentum
+                results = scanner.scan_momentum()
+                scanner.display_scan_results({'momentum': results, 'scan_time': datetime.now().isoformat()})
+                
+            elif choice == "5":
+                # Arbitrage
+                results = scanner.scan_arbitrage_opportunities()
+                scanner.display_scan_results({'arbitrage': results, 'scan_time': datetime.now().isoformat()})
+                
+            elif choice == "6":
+                # Comprehensive scan
+                results = scanner.comprehensive_scan()
+                scanner.display_scan_results(results)
+                
+            elif choice == "7":
+                # Monitor market
+                interval = input("Enter monitoring interval in seconds (default 300): ").strip()
+                interval = int(interval) if interval.isdigit() else 300
+                scanner.monitor_market(interval)
+                
+            elif choice == "8":
+                # Export results
+                if scanner.scan_results:
+                    scanner.export_scan_results(scanner.scan_results)
+                else:
+                    print("No scan results to export. Run a scan first.")
+                    
+            else:
+                print("Invalid choice. Please try again.")
+    
+    except Exception as e:
+        print(f"Error in market scanner: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,359 +1,556 @@
-"""
-Aster SDK - DCA (Dollar Cost Averaging) Trading Bot
-Automated DCA strategy implementation
-"""
-
-import sys
-import os
-import time
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
-from aster_auth import AsterAuthenticatedClient
-from aster_example_utils import format_price, save_data_to_file
-
-
-class DCABot:
-    """Dollar Cost Averaging Trading Bot"""
-    
-    def __init__(self, api_key: str, secret_key: str, config: Dict[str, Any]):
-        """
-        Initialize DCA bot
-        
-        Args:
-            api_key: Aster API key
-            secret_key: Aster secret key
-            config: Bot configuration
-        """
-        self.client = AsterAuthenticatedClient(api_key, secret_key)
-        self.config = config
-        self.is_running = False
-        self.last_purchase_time = {}
-        self.purchase_history = []
-        
-        # Validate configuration
-        self._validate_config()
-    
-    def _validate_config(self):
-        """Validate bot configuration"""
-        required_fields = ['symbol', 'amount', 'interval_hours', 'max_purchases']
-        
-        for field in required_fields:
-            if field not in self.config:
-                raise ValueError(f"Missing required configuration field: {field}")
-        
-        if self.config['amount'] <= 0:
-            raise ValueError("Purchase amount must be positive")
-        
-        if self.config['interval_hours'] <= 0:
-            raise ValueError("Interval must be positive")
-        
-        if self.config['max_purchases'] <= 0:
-            raise ValueError("Max purchases must be positive")
-    
-    def get_account_balance(self) -> float:
-        """Get USDT balance"""
-        try:
-            balance = self.client.get_balance()
-            if balance.get('status') == 'ok':
-                balances = balance.get('data', [])
-                for bal in balances:
-                    if bal.get('asset') == 'USDT':
-                        return float(bal.get('free', 0))
-            return 0.0
-        except Exception as e:
-            print(f"Error getting balance: {e}")
-            return 0.0
-    
-    def get_current_price(self, symbol: str) -> float:
-        """Get current price for symbol"""
-        try:
-            # This would need to be implemented with the actual API
-            # For now, we'll simulate a price
-            import random
-            base_price = 100.0  # Base price
-            variation = random.uniform(-0.05, 0.05)  # 5% variation
-            return base_price * (1 + variation)
-        except Exception as e:
-            print(f"Error getting price: {e}")
-            return 0.0
-    
-    def place_buy_order(self, symbol: str, amount: float) -> Dict[str, Any]:
-        """
-        Place a buy order
-        
-        Args:
-            symbol: Trading symbol
-            amount: Amount in USDT
-            
-        Returns:
-            Order result
-        """
-        try:
-            current_price = self.get_current_price(symbol)
-            if current_price <= 0:
-                return {'status': 'error', 'message': 'Invalid price'}
-            
-            # Calculate quantity
-            quantity = amount / current_price
-            
-            print(f"Placing DCA buy order: {amount} USDT for {quantity:.6f} {symbol}")
-            
-            # Place market buy order
-            result = self.client.place_order(
-                symbol=symbol,
-                side='BUY',
-                order_type='MARKET',
-                quantity=quantity
-            )
-            
-            if result.get('status') == 'ok':
-                # Record purchase
-                purchase_record = {
-                    'timestamp': datetime.now().isoformat(),
-                    'symbol': symbol,
-                    'amount_usdt': amount,
-                    'quantity': quantity,
-                    'price': current_price,
-                    'order_id': result.get('response', {}).get('data', {}).get('statuses', [{}])[0].get('resting', {}).get('oid')
-                }
-                
-                self.purchase_history.append(purchase_record)
-                self.last_purchase_time[symbol] = datetime.now()
-                
-                print(f"DCA purchase successful: {quantity:.6f} {symbol} at {format_price(current_price)}")
-                
-                return {'status': 'success', 'purchase': purchase_record}
-            else:
-                print(f"DCA purchase failed: {result}")
-                return {'status': 'error', 'message': result.get('message', 'Unknown error')}
-                
-        except Exception as e:
-            print(f"Error placing DCA order: {e}")
-            return {'status': 'error', 'message': str(e)}
-    
-    def should_purchase(self, symbol: str) -> bool:
-        """
-        Check if it's time to make a DCA purchase
-        
-        Args:
-            symbol: Trading symbol
-            
-        Returns:
-            True if should purchase
-        """
-        # Check if we've reached max purchases
-        symbol_purchases = [p for p in self.purchase_history if p['symbol'] == symbol]
-        if len(symbol_purchases) >= self.config['max_purchases']:
-            return False
-        
-        # Check interval
-        if symbol in self.last_purchase_time:
-            time_since_last = datetime.now() - self.last_purchase_time[symbol]
-            if time_since_last.total_seconds() < (self.config['interval_hours'] * 3600):
-                return False
-        
-        # Check balance
-        balance = self.get_account_balance()
-        if balance < self.config['amount']:
-            print(f"Insufficient balance: {balance} USDT < {self.config['amount']} USDT")
-            return False
-        
-        return True
-    
-    def run_dca_cycle(self):
-        """Run one DCA cycle"""
-        symbol = self.config['symbol']
-        
-        if self.should_purchase(symbol):
-            result = self.place_buy_order(symbol, self.config['amount'])
-            
-            if result['status'] == 'success':
-                print(f"DCA cycle completed for {symbol}")
-            else:
-                print(f"DCA cycle failed for {symbol}: {result.get('message', 'Unknown error')}")
-        else:
-            print(f"DCA cycle skipped for {symbol} (conditions not met)")
-    
-    def start_bot(self):
-        """Start the DCA bot"""
-        print("Starting DCA Bot...")
-        print(f"Symbol: {self.config['symbol']}")
-        print(f"Amount: {self.config['amount']} USDT")
-        print(f"Interval: {self.config['interval_hours']} hours")
-        print(f"Max Purchases: {self.config['max_purchases']}")
-        print("Press Ctrl+C to stop")
-        
-        self.is_running = True
-        
-        try:
-            while self.is_running:
-                self.run_dca_cycle()
-                
-                # Wait for next cycle
-                wait_time = self.config['interval_hours'] * 3600
-                print(f"Waiting {self.config['interval_hours']} hours until next DCA cycle...")
-                
-                # Check every minute if we should stop
-                for _ in range(int(wait_time / 60)):
-                    if not self.is_running:
-                        break
-                    time.sleep(60)
-                
-        except KeyboardInterrupt:
-            print("\nDCA Bot stopped by user")
-            self.stop_bot()
-    
-    def stop_bot(self):
-        """Stop the DCA bot"""
-        self.is_running = False
-        print("DCA Bot stopped")
-    
-    def get_bot_status(self) -> Dict[str, Any]:
-        """Get bot status and statistics"""
-        symbol = self.config['symbol']
-        symbol_purchases = [p for p in self.purchase_history if p['symbol'] == symbol]
-        
-        total_invested = sum(p['amount_usdt'] for p in symbol_purchases)
-        total_quantity = sum(p['quantity'] for p in symbol_purchases)
-        avg_price = total_invested / total_quantity if total_quantity > 0 else 0
-        
-        current_price = self.get_current_price(symbol)
-        current_value = total_quantity * current_price
-        unrealized_pnl = current_value - total_invested
-        pnl_percentage = (unrealized_pnl / total_invested * 100) if total_invested > 0 else 0
-        
-        return {
-            'symbol': symbol,
-            'is_running': self.is_running,
-            'total_purchases': len(symbol_purchases),
-            'max_purchases': self.config['max_purchases'],
-            'total_invested': total_invested,
-            'total_quantity': total_quantity,
-            'average_price': avg_price,
-            'current_price': current_price,
-            'current_value': current_value,
-            'unrealized_pnl': unrealized_pnl,
-            'pnl_percentage': pnl_percentage,
-            'last_purchase': symbol_purchases[-1] if symbol_purchases else None,
-            'next_purchase_time': self._get_next_purchase_time(symbol)
-        }
-    
-    def _get_next_purchase_time(self, symbol: str) -> Optional[str]:
-        """Get next purchase time"""
-        if symbol not in self.last_purchase_time:
-            return datetime.now().isoformat()
-        
-        next_time = self.last_purchase_time[symbol] + timedelta(hours=self.config['interval_hours'])
-        return next_time.isoformat()
-    
-    def display_status(self):
-        """Display bot status"""
-        status = self.get_bot_status()
-        
-        print("\nDCA BOT STATUS")
-        print("=" * 50)
-        print(f"Symbol: {status['symbol']}")
-        print(f"Running: {'Yes' if status['is_running'] else 'No'}")
-        print(f"Purchases: {status['total_purchases']}/{status['max_purchases']}")
-        print(f"Total Invested: {format_price(status['total_invested'])}")
-        print(f"Total Quantity: {status['total_quantity']:.6f}")
-        print(f"Average Price: {format_price(status['average_price'])}")
-        print(f"Current Price: {format_price(status['current_price'])}")
-        print(f"Current Value: {format_price(status['current_value'])}")
-        print(f"Unrealized P&L: {format_price(status['unrealized_pnl'])} ({status['pnl_percentage']:+.2f}%)")
-        
-        if status['last_purchase']:
-            print(f"Last Purchase: {status['last_purchase']['timestamp']}")
-        
-        if status['next_purchase_time']:
-            print(f"Next Purchase: {status['next_purchase_time']}")
-    
-    def export_history(self, filename: Optional[str] = None):
-        """Export purchase history"""
-        if filename is None:
-            filename = f"dca_bot_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        data = {
-            'config': self.config,
-            'purchase_history': self.purchase_history,
-            'export_time': datetime.now().isoformat()
-        }
-        
-        save_data_to_file(data, filename)
-        print(f"DCA bot history exported to {filename}")
-
-
-def main():
-    """Main function for DCA bot demo"""
-    print("ASTER SDK - DCA TRADING BOT")
-    print("=" * 40)
-    
-    # You would need to provide actual API credentials
-    api_key = "your_api_key_here"
-    secret_key = "your_secret_key_here"
-    
-    if api_key == "your_api_key_here":
-        print("Please set your actual API credentials to use the DCA bot")
-        print("You can edit the main() function with your credentials")
-        return
-    
-    # DCA Bot Configuration
-    config = {
-        'symbol': 'BTCUSDT',
-        'amount': 100.0,  # USDT amount per purchase
-        'interval_hours': 24,  # Hours between purchases
-        'max_purchases': 10  # Maximum number of purchases
-    }
-    
-    try:
-        # Initialize DCA bot
-        bot = DCABot(api_key, secret_key, config)
-        
-        while True:
-            print("\nDCA Bot Options:")
-            print("1. Start bot")
-            print("2. Stop bot")
-            print("3. View status")
-            print("4. Run single cycle")
-            print("5. Export history")
-            print("0. Exit")
-            
-            choice = input("\nEnter your choice (0-5): ").strip()
-            
-            if choice == "0":
-                print("Goodbye!")
-                break
-            elif choice == "1":
-                # Start bot
-                bot.start_bot()
-                
-            elif choice == "2":
-                # Stop bot
-                bot.stop_bot()
-                
-            elif choice == "3":
-                # View status
-                bot.display_status()
-                
-            elif choice == "4":
-                # Run single cycle
-                bot.run_dca_cycle()
-                
-            elif choice == "5":
-                # Export history
-                bot.export_history()
-                
-            else:
-                print("Invalid choice. Please try again.")
-    
-    except Exception as e:
-        print(f"Error in DCA bot: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    main()
+"""
+Aster SDK - DCA (Dollar Cost Averaging) Trading Bot
+Automated DCA strategy implementation
+"""
+
+import sys
+import os
+import time
+import json
+import queue
+import logging
+import threading
+import numpy as np
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+try:
+    import websocket
+except ImportError:  # price stream degrades to per-call fetches
+    websocket = None
+
+from aster_auth import AsterAuthenticatedClient
+from aster_example_utils import format_price, save_data_to_file
+from aster_sdk.utils.constants import MAINNET_WS_URL
+
+
+class _RateLimitFilter(logging.Filter):
+    """Drop records beyond a per-second budget
+    
+    Keeps an error storm (network flap, exchange outage) from flooding
+    stderr and burning CPU on formatting; one summary line notes how
+    many records were suppressed once the storm passes.
+    """
+    
+    def __init__(self, max_per_sec: int = 5):
+        super().__init__()
+        self.max_per_sec = max_per_sec
+        self._window = 0
+        self._count = 0
+        self._dropped = 0
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        window = int(record.created)
+        if window != self._window:
+            if self._dropped:
+                record.msg = f"{record.msg} ({self._dropped} similar messages suppressed)"
+                self._dropped = 0
+            self._window = window
+            self._count = 0
+        self._count += 1
+        if self._count > self.max_per_sec:
+            self._dropped += 1
+            return False
+        return True
+
+
+logger = logging.getLogger('dca_bot')
+logger.addFilter(_RateLimitFilter())
+
+
+class DCABot:
+    """Dollar Cost Averaging Trading Bot"""
+    
+    def __init__(self, api_key: str, secret_key: str, config: Dict[str, Any]):
+        """
+        Initialize DCA bot
+        
+        Args:
+            api_key: Aster API key
+            secret_key: Aster secret key
+            config: Bot configuration
+        """
+        self.client = AsterAuthenticatedClient(api_key, secret_key)
+        self.config = config
+        self.is_running = False
+        # Interval gating runs on monotonic floats — no timedelta churn
+        # and immune to wall-clock jumps; the datetime twin exists only
+        # for display of the next purchase time
+        self.last_purchase_time: Dict[str, float] = {}
+        self._last_wall_time: Dict[str, datetime] = {}
+        self.purchase_history = []
+        # Per-symbol view of the history, maintained on append, so the
+        # hot checks never rescan the full list
+        self._by_symbol: Dict[str, List[dict]] = defaultdict(list)
+        
+        # Latest prices pushed by the mark-price stream; get_current_price
+        # reads these instead of paying an HTTP round-trip per lookup
+        self._latest_price: Dict[str, float] = {}
+        self._price_updated_at: Dict[str, float] = {}
+        self._price_lock = threading.Lock()
+        self._price_stale_after = 10.0  # seconds without a push -> fall back
+        
+        # Balance changes only when we buy, so short bursts of status
+        # checks share one fetch within the TTL window
+        self._balance_cache: Optional[tuple] = None  # (monotonic ts, value)
+        self._balance_ttl = float(config.get('balance_ttl_sec', 10.0))
+        
+        # Set by stop_bot; the cycle loop blocks on it instead of polling
+        self._stop_event = threading.Event()
+        
+        # Backtest mode: one vectorized draw replaces a scalar RNG call
+        # per price lookup, so simulation loops index a ready array
+        if config.get('simulate'):
+            rng = np.random.default_rng(config.get('simulate_seed'))
+            base_price = 100.0
+            self._sim_prices = base_price * (1 + rng.uniform(-0.05, 0.05, 4096))
+            self._sim_idx = 0
+        else:
+            self._sim_prices = None
+        
+        # Purchases are appended to a JSONL log by a background thread,
+        # keeping disk I/O off the trading path; export_history still
+        # writes the consolidated JSON on demand
+        self._history_queue: queue.Queue = queue.Queue()
+        self._history_log = config.get('history_log', 'dca_bot_history.jsonl')
+        threading.Thread(target=self._history_writer, daemon=True,
+                         name='dca-history-writer').start()
+        
+        # Validate configuration
+        self._validate_config()
+        
+        if websocket is not None:
+            self._start_price_stream(self.config['symbol'])
+    
+    def _validate_config(self):
+        """Validate bot configuration"""
+        required_fields = ['symbol', 'amount', 'interval_hours', 'max_purchases']
+        
+        for field in required_fields:
+            if field not in self.config:
+                raise ValueError(f"Missing required configuration field: {field}")
+        
+        if self.config['amount'] <= 0:
+            raise ValueError("Purchase amount must be positive")
+        
+        if self.config['interval_hours'] <= 0:
+            raise ValueError("Interval must be positive")
+        
+        if self.config['max_purchases'] <= 0:
+            raise ValueError("Max purchases must be positive")
+        
+        # Derived scalars the per-cycle checks reuse without re-deriving
+        self._interval_seconds = float(self.config['interval_hours']) * 3600
+        self._max_purchases = int(self.config['max_purchases'])
+    
+    def get_account_balance(self) -> float:
+        """Get USDT balance
+        
+        Cached for config['balance_ttl_sec'] seconds (default 10) so
+        back-to-back calls within a cycle cost one request; the cache
+        is dropped after every successful purchase.
+        """
+        cached = self._balance_cache
+        if cached is not None and time.monotonic() - cached[0] < self._balance_ttl:
+            return cached[1]
+        try:
+            balance = self.client.get_balance()
+            if balance.get('status') == 'ok':
+                balances = balance.get('data', [])
+                for bal in balances:
+                    if bal.get('asset') == 'USDT':
+                        value = float(bal.get('free', 0))
+                        self._balance_cache = (time.monotonic(), value)
+                        return value
+            return 0.0
+        except Exception as e:
+            logger.error("Error getting balance: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+            return 0.0
+    
+    def _start_price_stream(self, symbol: str):
+        """Subscribe to the symbol's mark-price stream in a daemon thread
+        
+        One long-lived connection replaces an HTTP round-trip per price
+        lookup; each push is written to self._latest_price under a lock
+        so get_current_price becomes a memory read.
+        """
+        def on_message(ws, message):
+            try:
+                payload = json.loads(message)
+                price = float(payload['p'])
+            except (ValueError, KeyError, TypeError):
+                return
+            with self._price_lock:
+                self._latest_price[symbol] = price
+                self._price_updated_at[symbol] = time.monotonic()
+        
+        def run():
+            backoff = 1.0
+            url = f"{MAINNET_WS_URL}/{symbol.lower()}@markPrice"
+            while True:
+                ws = websocket.WebSocketApp(url, on_message=on_message)
+                ws.run_forever()
+                # Connection dropped: reconnect with capped backoff
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60.0)
+        
+        thread = threading.Thread(target=run, daemon=True, name=f"dca-price-{symbol}")
+        thread.start()
+    
+    def get_current_price(self, symbol: str) -> float:
+        """Get current price for symbol
+        
+        Served from the streamed price when a recent push exists; only
+        falls back to a direct fetch when the stream is stale or absent.
+        """
+        with self._price_lock:
+            price = self._latest_price.get(symbol)
+            updated_at = self._price_updated_at.get(symbol, 0.0)
+        if price is not None and time.monotonic() - updated_at < self._price_stale_after:
+            return price
+        
+        if self._sim_prices is not None:
+            value = float(self._sim_prices[self._sim_idx % self._sim_prices.size])
+            self._sim_idx += 1
+            return value
+        
+        try:
+            # This would need to be implemented with the actual API
+            # For now, we'll simulate a price
+            import random
+            base_price = 100.0  # Base price
+            variation = random.uniform(-0.05, 0.05)  # 5% variation
+            return base_price * (1 + variation)
+        except Exception as e:
+            logger.error("Error getting price: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+            return 0.0
+    
+    def place_buy_order(self, symbol: str, amount: float,
+                        current_price: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Place a buy order
+        
+        Args:
+            symbol: Trading symbol
+            amount: Amount in USDT
+            current_price: Price snapshot from the caller's decision; only
+                re-fetched here when absent, so quantity is computed from
+                the same tick the decision saw
+            
+        Returns:
+            Order result
+        """
+        try:
+            if current_price is None or current_price <= 0:
+                current_price = self.get_current_price(symbol)
+            if current_price <= 0:
+                return {'status': 'error', 'message': 'Invalid price'}
+            
+            # Calculate quantity
+            quantity = amount / current_price
+            
+            print(f"Placing DCA buy order: {amount} USDT for {quantity:.6f} {symbol}")
+            
+            # Place market buy order
+            result = self.client.place_order(
+                symbol=symbol,
+                side='BUY',
+                order_type='MARKET',
+                quantity=quantity
+            )
+            
+            if result.get('status') == 'ok':
+                # Record purchase
+                # Integer nanoseconds: one clock read, 8 bytes per record,
+                # rendered to ISO only when displayed or exported
+                purchase_record = {
+                    'ts_ns': time.time_ns(),
+                    'symbol': symbol,
+                    'amount_usdt': amount,
+                    'quantity': quantity,
+                    'price': current_price,
+                    'order_id': result.get('response', {}).get('data', {}).get('statuses', [{}])[0].get('resting', {}).get('oid')
+                }
+                
+                self.purchase_history.append(purchase_record)
+                self._by_symbol[symbol].append(purchase_record)
+                self._history_queue.put(purchase_record)
+                self.last_purchase_time[symbol] = time.monotonic()
+                self._last_wall_time[symbol] = datetime.now()
+                # The buy just debited USDT; force a fresh fetch next check
+                self._balance_cache = None
+                
+                print(f"DCA purchase successful: {quantity:.6f} {symbol} at {format_price(current_price)}")
+                
+                return {'status': 'success', 'purchase': purchase_record}
+            else:
+                print(f"DCA purchase failed: {result}")
+                return {'status': 'error', 'message': result.get('message', 'Unknown error')}
+                
+        except Exception as e:
+            logger.error("Error placing DCA order: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+            return {'status': 'error', 'message': str(e)}
+    
+    def should_purchase(self, symbol: str) -> bool:
+        """
+        Check if it's time to make a DCA purchase
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            True if should purchase
+        """
+        # Check if we've reached max purchases
+        if len(self._by_symbol[symbol]) >= self._max_purchases:
+            return False
+        
+        # Check interval
+        last = self.last_purchase_time.get(symbol)
+        if last is not None and time.monotonic() - last < self._interval_seconds:
+            return False
+        
+        # Check balance
+        balance = self.get_account_balance()
+        if balance < self.config['amount']:
+            print(f"Insufficient balance: {balance} USDT < {self.config['amount']} USDT")
+            return False
+        
+        return True
+    
+    def run_dca_cycle(self):
+        """Run one DCA cycle"""
+        symbol = self.config['symbol']
+        
+        if self.should_purchase(symbol):
+            # One snapshot serves both the decision and the order quantity
+            current_price = self.get_current_price(symbol)
+            result = self.place_buy_order(symbol, self.config['amount'], current_price)
+            
+            if result['status'] == 'success':
+                print(f"DCA cycle completed for {symbol}")
+            else:
+                print(f"DCA cycle failed for {symbol}: {result.get('message', 'Unknown error')}")
+        else:
+            print(f"DCA cycle skipped for {symbol} (conditions not met)")
+    
+    def start_bot(self):
+        """Start the DCA bot"""
+        print("Starting DCA Bot...")
+        print(f"Symbol: {self.config['symbol']}")
+        print(f"Amount: {self.config['amount']} USDT")
+        print(f"Interval: {self.config['interval_hours']} hours")
+        print(f"Max Purchases: {self.config['max_purchases']}")
+        print("Press Ctrl+C to stop")
+        
+        self.is_running = True
+        self._stop_event.clear()
+        
+        try:
+            while self.is_running:
+                self.run_dca_cycle()
+                
+                # Wait for next cycle
+                wait_time = self.config['interval_hours'] * 3600
+                print(f"Waiting {self.config['interval_hours']} hours until next DCA cycle...")
+                
+                # Block until the interval elapses or stop_bot fires —
+                # no minutely wakeups, and stop takes effect immediately
+                if self._stop_event.wait(timeout=wait_time):
+                    break
+                
+        except KeyboardInterrupt:
+            print("\nDCA Bot stopped by user")
+            self.stop_bot()
+    
+    def stop_bot(self):
+        """Stop the DCA bot"""
+        self.is_running = False
+        self._stop_event.set()
+        print("DCA Bot stopped")
+    
+    def get_bot_status(self) -> Dict[str, Any]:
+        """Get bot status and statistics"""
+        symbol = self.config['symbol']
+        symbol_purchases = self._by_symbol[symbol]
+        
+        # One pass accumulates both totals instead of two generator sweeps
+        total_invested = total_quantity = 0.0
+        for p in symbol_purchases:
+            total_invested += p['amount_usdt']
+            total_quantity += p['quantity']
+        avg_price = total_invested / total_quantity if total_quantity > 0 else 0
+        
+        current_price = self.get_current_price(symbol)
+        current_value = total_quantity * current_price
+        unrealized_pnl = current_value - total_invested
+        pnl_percentage = (unrealized_pnl / total_invested * 100) if total_invested > 0 else 0
+        
+        return {
+            'symbol': symbol,
+            'is_running': self.is_running,
+            'total_purchases': len(symbol_purchases),
+            'max_purchases': self._max_purchases,
+            'total_invested': total_invested,
+            'total_quantity': total_quantity,
+            'average_price': avg_price,
+            'current_price': current_price,
+            'current_value': current_value,
+            'unrealized_pnl': unrealized_pnl,
+            'pnl_percentage': pnl_percentage,
+            'last_purchase': symbol_purchases[-1] if symbol_purchases else None,
+            # The wall-clock stamp is already at hand here; skip the
+            # per-symbol lookup the public helper would repeat
+            'next_purchase_time': self._next_purchase_time_from(self._last_wall_time.get(symbol))
+        }
+    
+    def _get_next_purchase_time(self, symbol: str) -> Optional[str]:
+        """Get next purchase time"""
+        return self._next_purchase_time_from(self._last_wall_time.get(symbol))
+    
+    def _next_purchase_time_from(self, last_wall: Optional[datetime]) -> Optional[str]:
+        """Next purchase time derived from a known last-purchase stamp"""
+        if last_wall is None:
+            return datetime.now().isoformat()
+        
+        next_time = last_wall + timedelta(seconds=self._interval_seconds)
+        return next_time.isoformat()
+    
+    def display_status(self):
+        """Display bot status"""
+        status = self.get_bot_status()
+        
+        print("\nDCA BOT STATUS")
+        print("=" * 50)
+        print(f"Symbol: {status['symbol']}")
+        print(f"Running: {'Yes' if status['is_running'] else 'No'}")
+        print(f"Purchases: {status['total_purchases']}/{status['max_purchases']}")
+        print(f"Total Invested: {format_price(status['total_invested'])}")
+        print(f"Total Quantity: {status['total_quantity']:.6f}")
+        print(f"Average Price: {format_price(status['average_price'])}")
+        print(f"Current Price: {format_price(status['current_price'])}")
+        print(f"Current Value: {format_price(status['current_value'])}")
+        print(f"Unrealized P&L: {format_price(status['unrealized_pnl'])} ({status['pnl_percentage']:+.2f}%)")
+        
+        if status['last_purchase']:
+            last_iso = datetime.fromtimestamp(status['last_purchase']['ts_ns'] / 1e9).isoformat()
+            print(f"Last Purchase: {last_iso}")
+        
+        if status['next_purchase_time']:
+            print(f"Next Purchase: {status['next_purchase_time']}")
+    
+    def _history_writer(self):
+        """Drain the history queue into the append-only JSONL log
+        
+        One line per record keeps the per-purchase disk cost constant
+        instead of rewriting the whole history file, and the daemon
+        thread absorbs the write so the trading loop never blocks on it.
+        """
+        while True:
+            record = self._history_queue.get()
+            try:
+                with open(self._history_log, 'a') as f:
+                    f.write(json.dumps(record) + '\n')
+            except OSError as e:
+                logger.error("Error appending purchase log: %s", e)
+            finally:
+                self._history_queue.task_done()
+    
+    def export_history(self, filename: Optional[str] = None):
+        """Export purchase history"""
+        if filename is None:
+            filename = f"dca_bot_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        
+        # Render the stored nanosecond stamps to ISO for the export file
+        history = [
+            dict(record, timestamp=datetime.fromtimestamp(record['ts_ns'] / 1e9).isoformat())
+            for record in self.purchase_history
+        ]
+        data = {
+            'config': self.config,
+            'purchase_history': history,
+            'export_time': datetime.now().isoformat()
+        }
+        
+        save_data_to_file(data, filename)
+        print(f"DCA bot history exported to {filename}")
+
+
+def main():
+    """Main function for DCA bot demo"""
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(name)s: %(message)s')
+    print("ASTER SDK - DCA TRADING BOT")
+    print("=" * 40)
+    
+    # You would need to provide actual API credentials
+    api_key = "your_api_key_here"
+    secret_key = "your_secret_key_here"
+    
+    if api_key == "your_api_key_here":
+        print("Please set your actual API credentials to use the DCA bot")
+        print("You can edit the main() function with your credentials")
+        return
+    
+    # DCA Bot Configuration
+    config = {
+        'symbol': 'BTCUSDT',
+        'amount': 100.0,  # USDT amount per purchase
+        'interval_hours': 24,  # Hours between purchases
+        'max_purchases': 10  # Maximum number of purchases
+    }
+    
+    try:
+        # Initialize DCA bot
+        bot = DCABot(api_key, secret_key, config)
+        
+        while True:
+            print("\nDCA Bot Options:")
+            print("1. Start bot")
+            print("2. Stop bot")
+            print("3. View status")
+            print("4. Run single cycle")
+            print("5. Export history")
+            print("0. Exit")
+            
+            choice = input("\nEnter your choice (0-5): ").strip()
+            
+            if choice == "0":
+                print("Goodbye!")
+                break
+            elif choice == "1":
+                # Start bot
+                bot.start_bot()
+                
+            elif choice == "2":
+                # Stop bot
+                bot.stop_bot()
+                
+            elif choice == "3":
+                # View status
+                bot.display_status()
+                
+            elif choice == "4":
+                # Run single cycle
+                bot.run_dca_cycle()
+                
+            elif choice == "5":
+                # Export history
+                bot.export_history()
+                
+            else:
+                print("Invalid choice. Please try again.")
+    
+    except Exception as e:
+        # Full traceback only when debug logging is on; the rate-limit
+        # filter bounds the cost if this ever lands inside a retry loop
+        logger.error("Error in DCA bot: %s", e,
+                     exc_info=logger.isEnabledFor(logging.DEBUG))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,285 +1,397 @@
-"""
-Aster SDK - Advanced Trading Example
-"""
-
-import json
-import time
-from typing import Optional
-
-from aster_sdk import Info, Exchange
-from aster_sdk.utils.constants import MAINNET_API_URL
-from aster_sdk.utils.types import Cloid
-from eth_account import Account
-
-
-class AsterTrader:
-    """Example trading class for Aster DEX"""
-    
-    def __init__(self, private_key: str, base_url: Optional[str] = None):
-        """
-        Initialize trader
-        
-        Args:
-            private_key: Private key for wallet
-            base_url: Base URL for API (defaults to mainnet)
-        """
-        self.wallet = Account.from_key(private_key)
-        self.exchange = Exchange(self.wallet, base_url or MAINNET_API_URL)
-        self.info = Info(base_url or MAINNET_API_URL, skip_ws=True)
-        
-        print(f"Trader initialized with address: {self.wallet.address}")
-    
-    def get_account_info(self) -> dict:
-        """Get account information"""
-        return self.info.user_state(self.wallet.address)
-    
-    def get_open_orders(self) -> list:
-        """Get open orders"""
-        return self.info.open_orders(self.wallet.address)
-    
-    def get_positions(self) -> list:
-        """Get current positions"""
-        account_info = self.get_account_info()
-        return account_info.get("assetPositions", [])
-    
-    def place_limit_order(
-        self,
-        symbol: str,
-        side: str,
-        size: float,
-        price: float,
-        client_order_id: Optional[str] = None
-    ) -> dict:
-        """
-        Place a limit order
-        
-        Args:
-            symbol: Trading symbol (e.g., "BTC")
-            side: "buy" or "sell"
-            size: Order size
-            price: Limit price
-            client_order_id: Optional client order ID
-            
-        Returns:
-            Order response
-        """
-        is_buy = side.lower() == "buy"
-        cloid = Cloid(client_order_id) if client_order_id else None
-        
-        order_response = self.exchange.order(
-            name=symbol,
-            is_buy=is_buy,
-            sz=size,
-            limit_px=price,
-            order_type={"limit": {"tif": "Gtc"}},
-            reduce_only=False,
-            cloid=cloid
-        )
-        
-        print(f"Placed {side} order for {size} {symbol} at {price}")
-        return order_response
-    
-    def place_market_order(
-        self,
-        symbol: str,
-        side: str,
-        size: float,
-        slippage: float = 0.05
-    ) -> dict:
-        """
-        Place a market order
-        
-        Args:
-            symbol: Trading symbol
-            side: "buy" or "sell"
-            size: Order size
-            slippage: Slippage tolerance (default 5%)
-            
-        Returns:
-            Order response
-        """
-        is_buy = side.lower() == "buy"
-        
-        order_response = self.exchange.market_open(
-            name=symbol,
-            is_buy=is_buy,
-            sz=size,
-            slippage=slippage
-        )
-        
-        print(f"Placed market {side} order for {size} {symbol}")
-        return order_response
-    
-    def cancel_order(self, symbol: str, order_id: int) -> dict:
-        """
-        Cancel an order by order ID
-        
-        Args:
-            symbol: Trading symbol
-            order_id: Order ID to cancel
-            
-        Returns:
-            Cancel response
-        """
-        cancel_response = self.exchange.cancel(symbol, order_id)
-        print(f"Cancelled order {order_id} for {symbol}")
-        return cancel_response
-    
-    def cancel_order_by_cloid(self, symbol: str, client_order_id: str) -> dict:
-        """
-        Cancel an order by client order ID
-        
-        Args:
-            symbol: Trading symbol
-            client_order_id: Client order ID to cancel
-            
-        Returns:
-            Cancel response
-        """
-        cloid = Cloid(client_order_id)
-        cancel_response = self.exchange.cancel_by_cloid(symbol, cloid)
-        print(f"Cancelled order with client ID {client_order_id} for {symbol}")
-        return cancel_response
-    
-    def cancel_all_orders(self, symbol: Optional[str] = None) -> dict:
-        """
-        Cancel all orders for a symbol or all symbols
-        
-        Args:
-            symbol: Optional symbol to cancel orders for
-            
-        Returns:
-            Cancel response
-        """
-        open_orders = self.get_open_orders()
-        
-        if symbol:
-            # Cancel orders for specific symbol
-            orders_to_cancel = [order for order in open_orders if order["coin"] == symbol]
-        else:
-            # Cancel all orders
-            orders_to_cancel = open_orders
-        
-        if not orders_to_cancel:
-            print("No orders to cancel")
-            return {}
-        
-        cancel_requests = [
-            {"coin": order["coin"], "oid": order["oid"]}
-            for order in orders_to_cancel
-        ]
-        
-        cancel_response = self.exchange.bulk_cancel(cancel_requests)
-        print(f"Cancelled {len(cancel_requests)} orders")
-        return cancel_response
-    
-    def close_position(self, symbol: str, slippage: float = 0.05) -> dict:
-        """
-        Close a position for a symbol
-        
-        Args:
-            symbol: Trading symbol
-            slippage: Slippage tolerance
-            
-        Returns:
-            Close position response
-        """
-        close_response = self.exchange.market_close(symbol, slippage=slippage)
-        print(f"Closed position for {symbol}")
-        return close_response
-    
-    def update_leverage(self, symbol: str, leverage: int, is_cross: bool = True) -> dict:
-        """
-        Update leverage for a position
-        
-        Args:
-            symbol: Trading symbol
-            leverage: New leverage value
-            is_cross: Whether to use cross margin
-            
-        Returns:
-            Update leverage response
-        """
-        leverage_response = self.exchange.update_leverage(symbol, leverage, is_cross)
-        print(f"Updated leverage for {symbol} to {leverage}x")
-        return leverage_response
-    
-    def get_portfolio_summary(self) -> dict:
-        """Get portfolio summary"""
-        account_info = self.get_account_info()
-        
-        summary = {
-            "account_value": float(account_info.get("marginSummary", {}).get("accountValue", 0)),
-            "total_margin_used": float(account_info.get("marginSummary", {}).get("totalMarginUsed", 0)),
-            "withdrawable": float(account_info.get("withdrawable", 0)),
-            "positions": []
-        }
-        
-        for position in account_info.get("assetPositions", []):
-            pos = position["position"]
-            summary["positions"].append({
-                "coin": pos["coin"],
-                "size": float(pos["szi"]),
-                "entry_price": float(pos.get("entryPx", 0)) if pos.get("entryPx") else None,
-                "unrealized_pnl": float(pos["unrealizedPnl"]),
-                "position_value": float(pos["positionValue"]),
-                "margin_used": float(pos["marginUsed"])
-            })
-        
-        return summary
-    
-    def print_portfolio(self):
-        """Print portfolio summary"""
-        summary = self.get_portfolio_summary()
-        
-        print("\n=== Portfolio Summary ===")
-        print(f"Account Value: ${summary['account_value']:,.2f}")
-        print(f"Total Margin Used: ${summary['total_margin_used']:,.2f}")
-        print(f"Withdrawable: ${summary['withdrawable']:,.2f}")
-        
-        if summary["positions"]:
-            print("\nPositions:")
-            for pos in summary["positions"]:
-                print(f"  {pos['coin']}: {pos['size']:,.4f} @ ${pos['entry_price'] or 'N/A'}")
-                print(f"    PnL: ${pos['unrealized_pnl']:,.2f} | Value: ${pos['position_value']:,.2f}")
-        else:
-            print("\nNo open positions")
-
-
-def main():
-    """Main trading example"""
-    print("Aster SDK - Advanced Trading Example")
-    print("=" * 50)
-    
-    # Note: This is a demonstration. In practice, you would load a real wallet
-    print("WARNING: This example requires a real wallet with funds!")
-    print("For demonstration purposes, we'll show the structure")
-    
-    # Example usage (commented out for safety)
-    # private_key = "your_private_key_here"
-    # trader = AsterTrader(private_key)
-    
-    # # Get portfolio information
-    # trader.print_portfolio()
-    
-    # # Place a limit order
-    # order_response = trader.place_limit_order(
-    #     symbol="BTC",
-    #     side="buy",
-    #     size=0.001,
-    #     price=45000.0,
-    #     client_order_id="my_order_1"
-    # )
-    
-    # # Get open orders
-    # open_orders = trader.get_open_orders()
-    # print(f"Open orders: {len(open_orders)}")
-    
-    # # Cancel order by client ID
-    # trader.cancel_order_by_cloid("BTC", "my_order_1")
-    
-    print("Trading example structure shown (requires real wallet)")
-
-
-if __name__ == "__main__":
-    main()
+"""
+Aster SDK - Advanced Trading Example
+"""
+
+import json
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+import numpy as np
+
+from aster_sdk import Info, Exchange
+from aster_sdk.utils.constants import MAINNET_API_URL
+from aster_sdk.utils.types import Cloid
+from eth_account import Account
+
+
+class AsterTrader:
+    """Example trading class for Aster DEX"""
+    
+    # Structured row per open position; aggregations over the parsed
+    # columns become single C-level reductions
+    _POSITION_DTYPE = np.dtype([
+        ('coin', 'U16'), ('size', 'f8'), ('entry_price', 'f8'),
+        ('unrealized_pnl', 'f8'), ('position_value', 'f8'), ('margin_used', 'f8'),
+    ])
+    
+    # Shared order-type constants: treat as frozen. They travel into the
+    # signed action, so hoisting avoids a dict allocation per order
+    _LIMIT_GTC_ORDER_TYPE = {"limit": {"tif": "Gtc"}}
+    _LIMIT_IOC_ORDER_TYPE = {"limit": {"tif": "Ioc"}}
+    
+    def __init__(self, private_key: str, base_url: Optional[str] = None):
+        """
+        Initialize trader
+        
+        Args:
+            private_key: Private key for wallet
+            base_url: Base URL for API (defaults to mainnet)
+        """
+        self.wallet = Account.from_key(private_key)
+        self.exchange = Exchange(self.wallet, base_url or MAINNET_API_URL)
+        self.info = Info(base_url or MAINNET_API_URL, skip_ws=True)
+        
+        # Local mirror of open order ids per symbol, kept in sync by the
+        # place/cancel methods below. While it is complete, symbol-scoped
+        # cancel-all skips the full open-orders fetch. It starts
+        # incomplete — orders may rest from a previous session or another
+        # client — so the first cancel-all resyncs via REST
+        self._open_by_symbol: Dict[str, Set[int]] = defaultdict(set)
+        self._mirror_complete = False
+        
+        # Read-only bursts (status screens, repeated cancel-alls) share
+        # one open-orders fetch within this short TTL; any mutation
+        # drops the cache so callers see their own writes immediately
+        self._open_orders_cache = None  # (monotonic ts, orders)
+        self._open_orders_ttl = 0.25
+        
+        # Cloid objects built at placement, reused at cancel so each
+        # client order id is parsed and validated once per lifetime
+        self._cloid_cache: Dict[str, Cloid] = {}
+        
+        print(f"Trader initialized with address: {self.wallet.address}")
+    
+    def get_account_info(self) -> dict:
+        """Get account information"""
+        return self.info.user_state(self.wallet.address)
+    
+    def get_open_orders(self) -> list:
+        """Get open orders"""
+        cached = self._open_orders_cache
+        if cached is not None and time.monotonic() - cached[0] < self._open_orders_ttl:
+            return cached[1]
+        orders = self.info.open_orders(self.wallet.address)
+        self._open_orders_cache = (time.monotonic(), orders)
+        return orders
+    
+    def get_positions(self) -> list:
+        """Get current positions"""
+        account_info = self.get_account_info()
+        return account_info.get("assetPositions", [])
+    
+    def place_limit_order(
+        self,
+        symbol: str,
+        side: str,
+        size: float,
+        price: float,
+        client_order_id: Optional[str] = None
+    ) -> dict:
+        """
+        Place a limit order
+        
+        Args:
+            symbol: Trading symbol (e.g., "BTC")
+            side: "buy" or "sell"
+            size: Order size
+            price: Limit price
+            client_order_id: Optional client order ID
+            
+        Returns:
+            Order response
+        """
+        is_buy = side.lower() == "buy"
+        cloid = None
+        if client_order_id:
+            cloid = Cloid(client_order_id)
+            self._cloid_cache[client_order_id] = cloid
+        
+        order_response = self.exchange.order(
+            name=symbol,
+            is_buy=is_buy,
+            sz=size,
+            limit_px=price,
+            order_type=self._LIMIT_GTC_ORDER_TYPE,
+            reduce_only=False,
+            cloid=cloid
+        )
+        
+        self._track_placement(symbol, order_response)
+        self._open_orders_cache = None
+        
+        print(f"Placed {side} order for {size} {symbol} at {price}")
+        return order_response
+    
+    def _track_placement(self, symbol: str, order_response: dict) -> None:
+        """Record a resting order id in the per-symbol mirror
+        
+        If the response carries no resting oid (filled immediately,
+        rejected, unexpected shape) the mirror is marked incomplete and
+        cancel_all_orders falls back to the REST fetch.
+        """
+        try:
+            statuses = order_response["response"]["data"]["statuses"]
+            oid = statuses[0]["resting"]["oid"]
+        except (KeyError, IndexError, TypeError):
+            self._mirror_complete = False
+            return
+        self._open_by_symbol[symbol].add(oid)
+    
+    def place_market_order(
+        self,
+        symbol: str,
+        side: str,
+        size: float,
+        slippage: float = 0.05
+    ) -> dict:
+        """
+        Place a market order
+        
+        Args:
+            symbol: Trading symbol
+            side: "buy" or "sell"
+            size: Order size
+            slippage: Slippage tolerance (default 5%)
+            
+        Returns:
+            Order response
+        """
+        is_buy = side.lower() == "buy"
+        
+        order_response = self.exchange.market_open(
+            name=symbol,
+            is_buy=is_buy,
+            sz=size,
+            slippage=slippage
+        )
+        
+        self._open_orders_cache = None
+        print(f"Placed market {side} order for {size} {symbol}")
+        return order_response
+    
+    def cancel_order(self, symbol: str, order_id: int) -> dict:
+        """
+        Cancel an order by order ID
+        
+        Args:
+            symbol: Trading symbol
+            order_id: Order ID to cancel
+            
+        Returns:
+            Cancel response
+        """
+        cancel_response = self.exchange.cancel(symbol, order_id)
+        self._open_by_symbol[symbol].discard(order_id)
+        self._open_orders_cache = None
+        print(f"Cancelled order {order_id} for {symbol}")
+        return cancel_response
+    
+    def cancel_order_by_cloid(self, symbol: str, client_order_id: str) -> dict:
+        """
+        Cancel an order by client order ID
+        
+        Args:
+            symbol: Trading symbol
+            client_order_id: Client order ID to cancel
+            
+        Returns:
+            Cancel response
+        """
+        # Reuse (and retire) the Cloid built at placement when we have it
+        cloid = self._cloid_cache.pop(client_order_id, None) or Cloid(client_order_id)
+        cancel_response = self.exchange.cancel_by_cloid(symbol, cloid)
+        # The mirror tracks oids, not cloids; a cancel it cannot apply
+        # leaves it incomplete until the next REST resync
+        self._mirror_complete = False
+        self._open_orders_cache = None
+        print(f"Cancelled order with client ID {client_order_id} for {symbol}")
+        return cancel_response
+    
+    def cancel_all_orders(self, symbol: Optional[str] = None) -> dict:
+        """
+        Cancel all orders for a symbol or all symbols
+        
+        Args:
+            symbol: Optional symbol to cancel orders for
+            
+        Returns:
+            Cancel response
+        """
+        if symbol and self._mirror_complete:
+            # The mirror is authoritative: build the batch from local
+            # state and skip fetching every open order across all coins
+            oids = self._open_by_symbol.get(symbol)
+            if not oids:
+                print("No orders to cancel")
+                return {}
+            cancel_requests = [{"coin": symbol, "oid": oid} for oid in oids]
+        else:
+            open_orders = self.get_open_orders()
+            
+            # Resync the mirror from the authoritative snapshot
+            self._open_by_symbol.clear()
+            for order in open_orders:
+                self._open_by_symbol[order["coin"]].add(order["oid"])
+            self._mirror_complete = True
+            
+            if symbol:
+                # Cancel orders for specific symbol
+                orders_to_cancel = [order for order in open_orders if order["coin"] == symbol]
+            else:
+                # Cancel all orders
+                orders_to_cancel = open_orders
+            
+            if not orders_to_cancel:
+                print("No orders to cancel")
+                return {}
+            
+            cancel_requests = [
+                {"coin": order["coin"], "oid": order["oid"]}
+                for order in orders_to_cancel
+            ]
+        
+        try:
+            cancel_response = self.exchange.bulk_cancel(cancel_requests)
+        except Exception:
+            # The server may have applied part of the batch before
+            # failing; the mirror can no longer be trusted
+            self._mirror_complete = False
+            self._open_orders_cache = None
+            raise
+        # Remove from the mirror only once the batch is acknowledged
+        for request in cancel_requests:
+            self._open_by_symbol[request["coin"]].discard(request["oid"])
+        self._open_orders_cache = None
+        print(f"Cancelled {len(cancel_requests)} orders")
+        return cancel_response
+    
+    def close_position(self, symbol: str, slippage: float = 0.05) -> dict:
+        """
+        Close a position for a symbol
+        
+        Args:
+            symbol: Trading symbol
+            slippage: Slippage tolerance
+            
+        Returns:
+            Close position response
+        """
+        close_response = self.exchange.market_close(symbol, slippage=slippage)
+        print(f"Closed position for {symbol}")
+        return close_response
+    
+    def update_leverage(self, symbol: str, leverage: int, is_cross: bool = True) -> dict:
+        """
+        Update leverage for a position
+        
+        Args:
+            symbol: Trading symbol
+            leverage: New leverage value
+            is_cross: Whether to use cross margin
+            
+        Returns:
+            Update leverage response
+        """
+        leverage_response = self.exchange.update_leverage(symbol, leverage, is_cross)
+        print(f"Updated leverage for {symbol} to {leverage}x")
+        return leverage_response
+    
+    def get_portfolio_summary(self) -> dict:
+        """Get portfolio summary"""
+        account_info = self.get_account_info()
+        
+        summary = {
+            "account_value": float(account_info.get("marginSummary", {}).get("accountValue", 0)),
+            "total_margin_used": float(account_info.get("marginSummary", {}).get("totalMarginUsed", 0)),
+            "withdrawable": float(account_info.get("withdrawable", 0)),
+            "positions": [],
+            "total_unrealized_pnl": 0.0,
+            "total_position_value": 0.0,
+        }
+        
+        raw = [position["position"] for position in account_info.get("assetPositions", [])]
+        if raw:
+            # One structured array holds every parsed field; the totals
+            # below are vectorized sums over its columns (missing entry
+            # prices become NaN in the array, None in the output dicts)
+            arr = np.array(
+                [(pos["coin"], float(pos["szi"]),
+                  float(pos["entryPx"]) if pos.get("entryPx") else np.nan,
+                  float(pos["unrealizedPnl"]), float(pos["positionValue"]),
+                  float(pos["marginUsed"]))
+                 for pos in raw],
+                dtype=self._POSITION_DTYPE)
+            
+            summary["total_unrealized_pnl"] = float(arr['unrealized_pnl'].sum())
+            summary["total_position_value"] = float(arr['position_value'].sum())
+            summary["positions"] = [
+                {
+                    "coin": row['coin'],
+                    "size": float(row['size']),
+                    "entry_price": None if np.isnan(row['entry_price']) else float(row['entry_price']),
+                    "unrealized_pnl": float(row['unrealized_pnl']),
+                    "position_value": float(row['position_value']),
+                    "margin_used": float(row['margin_used'])
+                }
+                for row in arr
+            ]
+        
+        return summary
+    
+    def print_portfolio(self):
+        """Print portfolio summary"""
+        summary = self.get_portfolio_summary()
+        
+        print("\n=== Portfolio Summary ===")
+        print(f"Account Value: ${summary['account_value']:,.2f}")
+        print(f"Total Margin Used: ${summary['total_margin_used']:,.2f}")
+        print(f"Withdrawable: ${summary['withdrawable']:,.2f}")
+        
+        if summary["positions"]:
+            print(f"Total Unrealized PnL: ${summary['total_unrealized_pnl']:,.2f}")
+            print("\nPositions:")
+            for pos in summary["positions"]:
+                print(f"  {pos['coin']}: {pos['size']:,.4f} @ ${pos['entry_price'] or 'N/A'}")
+                print(f"    PnL: ${pos['unrealized_pnl']:,.2f} | Value: ${pos['position_value']:,.2f}")
+        else:
+            print("\nNo open positions")
+
+
+def main():
+    """Main trading example"""
+    print("Aster SDK - Advanced Trading Example")
+    print("=" * 50)
+    
+    # Note: This is a demonstration. In practice, you would load a real wallet
+    print("WARNING: This example requires a real wallet with funds!")
+    print("For demonstration purposes, we'll show the structure")
+    
+    # Example usage (commented out for safety)
+    # private_key = "your_private_key_here"
+    # trader = AsterTrader(private_key)
+    
+    # # Get portfolio information
+    # trader.print_portfolio()
+    
+    # # Place a limit order
+    # order_response = trader.place_limit_order(
+    #     symbol="BTC",
+    #     side="buy",
+    #     size=0.001,
+    #     price=45000.0,
+    #     client_order_id="my_order_1"
+    # )
+    
+    # # Get open orders
+    # open_orders = trader.get_open_orders()
+    # print(f"Open orders: {len(open_orders)}")
+    
+    # # Cancel order by client ID
+    # trader.cancel_order_by_cloid("BTC", "my_order_1")
+    
+    print("Trading example structure shown (requires real wallet)")
+
+
+if __name__ == "__main__":
+    main()
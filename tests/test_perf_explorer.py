@@ -0,0 +1,73 @@
+"""
+Aster SDK - Explorer end-to-end timing guards
+
+Runs the market explorer's full pipeline against canned responses,
+wrapped in the perf timeout from conftest. A regression on the hot
+paths (or an accidental live HTTP call sneaking into the pipeline)
+aborts via SIGALRM instead of hanging the runner; repeat offenders
+are parked in tests/skipfile.txt.
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools import market_data_explorer
+
+
+def _synthetic_exchange_info(n=500):
+    """An exchange_info payload shaped like the live one"""
+    symbols = [
+        {
+            'symbol': f'SYM{i:04d}USDT',
+            'baseAsset': f'SYM{i % 50:04d}',
+            'quoteAsset': 'USDT' if i % 3 else 'BTC',
+            'status': 'TRADING',
+            'contractType': 'PERPETUAL',
+            'filters': [
+                {'filterType': 'PRICE_FILTER', 'minPrice': '0.01',
+                 'maxPrice': '100000', 'tickSize': '0.01'},
+                {'filterType': 'LOT_SIZE', 'minQty': '0.001',
+                 'maxQty': '1000', 'stepSize': '0.001'},
+            ],
+        }
+        for i in range(n)
+    ]
+    rate_limits = [{'rateLimitType': 'REQUEST_WEIGHT', 'interval': 'MINUTE',
+                    'limit': 2400}]
+    return {'symbols': symbols, 'rateLimits': rate_limits}
+
+
+@pytest.fixture
+def explorer(monkeypatch, tmp_path):
+    """Explorer wired to canned data; exports and caches land in tmp"""
+    monkeypatch.chdir(tmp_path)
+    data = _synthetic_exchange_info()
+    ex = object.__new__(market_data_explorer.AsterMarketExplorer)
+    ex.info = types.SimpleNamespace(exchange_info=lambda: data)
+    ex.exchange_data = None
+    ex._search_index = None
+    return ex
+
+
+@pytest.mark.perf(timeout=30)
+def test_full_exploration_completes(explorer, capsys):
+    """Load, group, detail, rate-limit and export in one bounded run"""
+    explorer.run_full_exploration()
+    out = capsys.readouterr().out
+    assert 'Exploration complete' in out
+    assert os.path.exists('aster_symbols.json')
+
+
+@pytest.mark.perf(timeout=10)
+def test_batch_search_resolves_all_queries(explorer):
+    """Multi-query search stays bounded on a full-size index"""
+    explorer.load_exchange_data()
+    results = explorer.batch_search(['SYM0001', 'USDT', 'NOSUCH'])
+    assert len(results['SYM0001']) >= 1
+    assert len(results['USDT']) > 100
+    assert results['NOSUCH'] == []
@@ -0,0 +1,70 @@
+"""
+Aster SDK - Parse/group microbenchmarks
+
+Guards the hot path exercised by the exploration tools: payload bytes
+-> loads -> base-asset grouping. Requires pytest-benchmark (and orjson
+for the comparison case); the whole module skips when either is absent
+so the regular suite is unaffected. Run with --benchmark-only to get
+timings, or --benchmark-json for a CI artifact.
+"""
+
+import json
+from collections import defaultdict
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+orjson = pytest.importorskip("orjson")
+
+
+def _group_by_base(symbols):
+    """The grouping loop the explorers run per invocation"""
+    base_assets = defaultdict(list)
+    for symbol in symbols:
+        base_assets[symbol.get('baseAsset', 'Unknown')].append(symbol)
+    return base_assets
+
+
+@pytest.fixture(scope="session")
+def raw_bytes():
+    """A representative exchange_info payload, built once per session"""
+    symbols = [
+        {
+            'symbol': f'SYM{i:04d}USDT',
+            'baseAsset': f'SYM{i % 200:04d}',
+            'quoteAsset': 'USDT' if i % 3 else 'BTC',
+            'status': 'TRADING',
+            'contractType': 'PERPETUAL',
+            'filters': [
+                {'filterType': 'PRICE_FILTER', 'minPrice': '0.01',
+                 'maxPrice': '100000', 'tickSize': '0.01'},
+                {'filterType': 'LOT_SIZE', 'minQty': '0.001',
+                 'maxQty': '1000', 'stepSize': '0.001'},
+            ],
+        }
+        for i in range(2000)
+    ]
+    return json.dumps({'symbols': symbols, 'rateLimits': []}).encode('utf-8')
+
+
+@pytest.fixture(scope="session")
+def parsed(raw_bytes):
+    return json.loads(raw_bytes)
+
+
+def test_parse_stdlib(benchmark, raw_bytes):
+    """Baseline: stdlib json.loads on the full payload"""
+    result = benchmark(json.loads, raw_bytes)
+    assert len(result['symbols']) == 2000
+
+
+def test_parse_orjson(benchmark, raw_bytes):
+    """The parser the SDK prefers when orjson is installed"""
+    result = benchmark(orjson.loads, raw_bytes)
+    assert len(result['symbols']) == 2000
+
+
+def test_group_by_base(benchmark, parsed):
+    """Base-asset grouping as run by explore_symbols"""
+    groups = benchmark(_group_by_base, parsed['symbols'])
+    assert len(groups) == 200
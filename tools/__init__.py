@@ -0,0 +1,21 @@
+"""
+Tool package bootstrap
+
+The scripts in this directory import the SDK packages that live at the
+repository root. _ensure_sdk_path puts the root on sys.path exactly
+once, so every tool shares one cached import of aster_sdk_fixed instead
+of each script growing sys.path and re-triggering the path search.
+"""
+
+import os
+import sys
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _ensure_sdk_path():
+    """Make the SDK packages importable; idempotent across tools"""
+    if 'aster_sdk_fixed' in sys.modules:
+        return
+    if _REPO_ROOT not in sys.path:
+        sys.path.insert(0, _REPO_ROOT)
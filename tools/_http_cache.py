@@ -0,0 +1,80 @@
+"""
+Optional on-disk cache for the exploration tools' HTTP fetches
+
+When the ASTER_CACHE_DIR environment variable is set, install() wraps an
+Info client's fetch methods so each response is persisted under a key
+derived from the method and its arguments. Repeated CLI runs within the
+TTL then skip the network round-trip and the JSON parse entirely;
+without the env var the client is returned untouched.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+try:
+    import orjson
+except ImportError:  # keep the dependency optional
+    orjson = None
+
+# Cached entries older than this many seconds are refetched
+DEFAULT_TTL = float(os.environ.get('ASTER_CACHE_TTL', 60.0))
+
+
+def _key(name, args, kwargs):
+    blob = json.dumps([name, args, sorted(kwargs.items())],
+                      sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode('utf-8')).hexdigest()
+
+
+def _load(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _store(path, response):
+    if orjson is not None:
+        data = orjson.dumps(response)
+    else:
+        data = json.dumps(response).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def install(info, ttl=DEFAULT_TTL):
+    """Wrap the client's fetch methods with the disk cache when enabled
+
+    Returns the client either way, so call sites can stay one-liners:
+    ``self.info = install(Info(MAINNET_API_URL))``. exchange_info is
+    wrapped directly because it fetches through the session rather than
+    the generic get path.
+    """
+    cache_dir = os.environ.get('ASTER_CACHE_DIR')
+    if not cache_dir:
+        return info
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    def cached(fn, name):
+        def wrapper(*args, **kwargs):
+            path = os.path.join(cache_dir, _key(name, args, kwargs) + '.json')
+            try:
+                if time.time() - os.stat(path).st_mtime < ttl:
+                    return _load(path)
+            except (OSError, ValueError):
+                pass  # missing, expired or unreadable entry: refetch
+            response = fn(*args, **kwargs)
+            try:
+                _store(path, response)
+            except OSError:
+                pass  # cache is best-effort; the response still flows
+            return response
+        return wrapper
+
+    for name in ('get', 'post', 'exchange_info'):
+        method = getattr(info, name, None)
+        if method is not None:
+            setattr(info, name, cached(method, name))
+    return info
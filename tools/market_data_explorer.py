@@ -1,201 +1,344 @@
-"""
-Aster Market Data Explorer
-Explore available trading pairs, market data, and API capabilities
-"""
-
-import sys
-import os
-import json
-from datetime import datetime
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'aster_sdk_fixed'))
-
-from aster_sdk_fixed.info import Info
-from aster_sdk.utils.constants import MAINNET_API_URL
-
-class AsterMarketExplorer:
-    def __init__(self):
-        self.info = Info(MAINNET_API_URL)
-        self.exchange_data = None
-        
-    def load_exchange_data(self):
-        """Load and cache exchange information"""
-        print("Loading exchange data...")
-        self.exchange_data = self.info.exchange_info()
-        print(f"✅ Loaded data for {len(self.exchange_data.get('symbols', []))} symbols")
-        return self.exchange_data
-    
-    def explore_symbols(self):
-        """Explore available trading symbols"""
-        if not self.exchange_data:
-            self.load_exchange_data()
-            
-        symbols = self.exchange_data.get('symbols', [])
-        print(f"\n📊 MARKET OVERVIEW")
-        print("=" * 50)
-        print(f"Total Symbols: {len(symbols)}")
-        
-        # Group by base asset
-        base_assets = {}
-        for symbol in symbols:
-            base = symbol.get('baseAsset', 'Unknown')
-            if base not in base_assets:
-                base_assets[base] = []
-            base_assets[base].append(symbol)
-        
-        print(f"Base Assets: {len(base_assets)}")
-        print("\nTop Base Assets:")
-        for base, symbol_list in sorted(base_assets.items(), key=lambda x: len(x[1]), reverse=True)[:10]:
-            print(f"  {base}: {len(symbol_list)} pairs")
-        
-        return symbols, base_assets
-    
-    def show_symbol_details(self, limit=10):
-        """Show detailed information about symbols"""
-        if not self.exchange_data:
-            self.load_exchange_data()
-            
-        symbols = self.exchange_data.get('symbols', [])
-        print(f"\n🔍 SYMBOL DETAILS (showing first {limit})")
-        print("=" * 80)
-        
-        for i, symbol in enumerate(symbols[:limit]):
-            print(f"\n{i+1}. {symbol.get('symbol', 'N/A')}")
-            print(f"   Base: {symbol.get('baseAsset', 'N/A')}")
-            print(f"   Quote: {symbol.get('quoteAsset', 'N/A')}")
-            print(f"   Status: {symbol.get('status', 'N/A')}")
-            print(f"   Type: {symbol.get('contractType', 'N/A')}")
-            
-            # Show filters if available
-            filters = symbol.get('filters', [])
-            for filter_info in filters:
-                if filter_info.get('filterType') == 'PRICE_FILTER':
-                    print(f"   Min Price: {filter_info.get('minPrice', 'N/A')}")
-                    print(f"   Max Price: {filter_info.get('maxPrice', 'N/A')}")
-                    print(f"   Tick Size: {filter_info.get('tickSize', 'N/A')}")
-                elif filter_info.get('filterType') == 'LOT_SIZE':
-                    print(f"   Min Qty: {filter_info.get('minQty', 'N/A')}")
-                    print(f"   Max Qty: {filter_info.get('maxQty', 'N/A')}")
-                    print(f"   Step Size: {filter_info.get('stepSize', 'N/A')}")
-    
-    def show_rate_limits(self):
-        """Show API rate limits"""
-        if not self.exchange_data:
-            self.load_exchange_data()
-            
-        rate_limits = self.exchange_data.get('rateLimits', [])
-        print(f"\n⏱️  RATE LIMITS")
-        print("=" * 50)
-        
-        for limit in rate_limits:
-            print(f"Type: {limit.get('rateLimitType', 'N/A')}")
-            print(f"Interval: {limit.get('interval', 'N/A')}")
-            print(f"Limit: {limit.get('limit', 'N/A')}")
-            print()
-    
-    def search_symbols(self, query):
-        """Search for symbols containing the query"""
-        if not self.exchange_data:
-            self.load_exchange_data()
-            
-        symbols = self.exchange_data.get('symbols', [])
-        matches = []
-        
-        for symbol in symbols:
-            symbol_name = symbol.get('symbol', '').upper()
-            base_asset = symbol.get('baseAsset', '').upper()
-            quote_asset = symbol.get('quoteAsset', '').upper()
-            
-            if (query.upper() in symbol_name or 
-                query.upper() in base_asset or 
-                query.upper() in quote_asset):
-                matches.append(symbol)
-        
-        print(f"\n🔍 SEARCH RESULTS for '{query}'")
-        print("=" * 50)
-        print(f"Found {len(matches)} matches:")
-        
-        for symbol in matches:
-            print(f"  {symbol.get('symbol', 'N/A')} ({symbol.get('baseAsset', 'N/A')}/{symbol.get('quoteAsset', 'N/A')})")
-        
-        return matches
-    
-    def export_symbols_to_json(self, filename="aster_symbols.json"):
-        """Export all symbol data to JSON file"""
-        if not self.exchange_data:
-            self.load_exchange_data()
-            
-        with open(filename, 'w') as f:
-            json.dump(self.exchange_data, f, indent=2)
-        print(f"✅ Exported symbol data to {filename}")
-    
-    def run_full_exploration(self):
-        """Run complete market exploration"""
-        print("🚀 ASTER MARKET DATA EXPLORER")
-        print("=" * 50)
-        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        try:
-            # Load data
-            self.load_exchange_data()
-            
-            # Explore symbols
-            symbols, base_assets = self.explore_symbols()
-            
-            # Show details
-            self.show_symbol_details(limit=5)
-            
-            # Show rate limits
-            self.show_rate_limits()
-            
-            # Export data
-            self.export_symbols_to_json()
-            
-            print(f"\n✅ Exploration complete!")
-            print(f"📁 Data exported to aster_symbols.json")
-            
-        except Exception as e:
-            print(f"❌ Error during exploration: {e}")
-
-def main():
-    explorer = AsterMarketExplorer()
-    
-    while True:
-        print("\n" + "="*60)
-        print("ASTER MARKET DATA EXPLORER")
-        print("="*60)
-        print("1. Full exploration")
-        print("2. Show symbol overview")
-        print("3. Show symbol details")
-        print("4. Search symbols")
-        print("5. Show rate limits")
-        print("6. Export to JSON")
-        print("0. Exit")
-        
-        choice = input("\nEnter your choice (0-6): ").strip()
-        
-        if choice == "0":
-            print("Goodbye!")
-            break
-        elif choice == "1":
-            explorer.run_full_exploration()
-        elif choice == "2":
-            explorer.explore_symbols()
-        elif choice == "3":
-            limit = input("How many symbols to show? (default 10): ").strip()
-            limit = int(limit) if limit.isdigit() else 10
-            explorer.show_symbol_details(limit)
-        elif choice == "4":
-            query = input("Enter search query: ").strip()
-            if query:
-                explorer.search_symbols(query)
-        elif choice == "5":
-            explorer.show_rate_limits()
-        elif choice == "6":
-            filename = input("Enter filename (default: aster_symbols.json): ").strip()
-            filename = filename if filename else "aster_symbols.json"
-            explorer.export_symbols_to_json(filename)
-        else:
-            print("Invalid choice. Please try again.")
-
-if __name__ == "__main__":
-    main()
+"""
+Aster Market Data Explorer
+Explore available trading pairs, market data, and API capabilities
+"""
+
+import sys
+import os
+import json
+import mmap
+import time
+import pathlib
+from collections import Counter, defaultdict
+from datetime import datetime
+
+try:
+    from tools import _ensure_sdk_path
+except ImportError:  # run as a plain script rather than via -m
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tools import _ensure_sdk_path
+_ensure_sdk_path()
+
+try:
+    import orjson
+except ImportError:  # keep the dependency optional
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # sidecar cache degrades to plain fetches
+    msgpack = None
+
+try:
+    import ahocorasick
+except ImportError:  # batch search degrades to per-query scans
+    ahocorasick = None
+
+from aster_sdk_fixed.info import Info
+from aster_sdk.utils.constants import MAINNET_API_URL
+from tools._http_cache import install as _install_http_cache
+
+class AsterMarketExplorer:
+    def __init__(self):
+        # With ASTER_CACHE_DIR set, repeat runs read fetches from disk
+        self.info = _install_http_cache(Info(MAINNET_API_URL))
+        self.exchange_data = None
+        self._search_index = None
+        
+    # Sidecar cache for the parsed exchange_info dict; msgpack decode of
+    # the binary blob beats re-fetching and re-parsing the JSON on every
+    # CLI run. Set ASTER_CACHE_TTL=0 to disable.
+    _SIDECAR = pathlib.Path('.aster_cache/exchange_info.mp')
+    _SIDECAR_TTL = float(os.environ.get('ASTER_CACHE_TTL', 60.0))
+
+    def _load_sidecar(self):
+        """Return the cached exchange_info dict, or None when stale"""
+        if msgpack is None or self._SIDECAR_TTL <= 0:
+            return None
+        try:
+            if time.time() - self._SIDECAR.stat().st_mtime >= self._SIDECAR_TTL:
+                return None
+            with self._SIDECAR.open('rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return msgpack.unpackb(mm, raw=False)
+        except (OSError, ValueError):
+            return None  # missing or unreadable cache: refetch
+
+    def _store_sidecar(self, data):
+        if msgpack is None or self._SIDECAR_TTL <= 0:
+            return
+        try:
+            self._SIDECAR.parent.mkdir(exist_ok=True)
+            self._SIDECAR.write_bytes(msgpack.packb(data, use_bin_type=True))
+        except (OSError, TypeError):
+            pass  # cache is best-effort; the fetched data still flows
+
+    def load_exchange_data(self):
+        """Load and cache exchange information"""
+        print("Loading exchange data...")
+        cached = self._load_sidecar()
+        if cached is not None:
+            self.exchange_data = cached
+        else:
+            self.exchange_data = self.info.exchange_info()
+            self._store_sidecar(self.exchange_data)
+        # Case-fold each symbol's searchable fields once; every query
+        # then does a single substring check per symbol instead of
+        # three upper() calls and three scans
+        self._search_index = [
+            (s, (s.get('symbol', '') + '|' + s.get('baseAsset', '') + '|'
+                 + s.get('quoteAsset', '')).upper())
+            for s in self.exchange_data.get('symbols', [])
+        ]
+        print(f"✅ Loaded data for {len(self.exchange_data.get('symbols', []))} symbols")
+        return self.exchange_data
+    
+    def _resolve_data(self, data):
+        """Injected dict if given, else the (lazily loaded) cached one
+
+        Lets run_full_exploration load once and hand the same dict to
+        every section instead of each section re-checking the cache.
+        """
+        if data is not None:
+            return data
+        if not self.exchange_data:
+            self.load_exchange_data()
+        return self.exchange_data
+
+    @staticmethod
+    def _partition_filters(symbols):
+        """Split each symbol's filter list into a type-keyed dict once"""
+        return {
+            s.get('symbol', 'N/A'): {f.get('filterType'): f
+                                     for f in s.get('filters', [])}
+            for s in symbols
+        }
+
+    def explore_symbols(self, data=None, return_full=False):
+        """Explore available trading symbols
+
+        Returns (symbols, base_counts) where base_counts is a Counter;
+        the overview only ever needs the pair count per base, so the
+        full symbol dicts are not duplicated into per-base lists. Pass
+        return_full=True to get the old {base: [symbol, ...]} grouping.
+        """
+        symbols = self._resolve_data(data).get('symbols', [])
+        print(f"\n📊 MARKET OVERVIEW")
+        print("=" * 50)
+        print(f"Total Symbols: {len(symbols)}")
+        
+        base_counts = Counter(s.get('baseAsset', 'Unknown') for s in symbols)
+        
+        print(f"Base Assets: {len(base_counts)}")
+        print("\nTop Base Assets:")
+        for base, count in base_counts.most_common(10):
+            print(f"  {base}: {count} pairs")
+        
+        if return_full:
+            base_assets = defaultdict(list)
+            for symbol in symbols:
+                base_assets[symbol.get('baseAsset', 'Unknown')].append(symbol)
+            return symbols, base_assets
+        return symbols, base_counts
+    
+    def show_symbol_details(self, limit=10, data=None, filter_index=None):
+        """Show detailed information about symbols"""
+        symbols = self._resolve_data(data).get('symbols', [])
+        if filter_index is None:
+            filter_index = self._partition_filters(symbols[:limit])
+        print(f"\n🔍 SYMBOL DETAILS (showing first {limit})")
+        print("=" * 80)
+        
+        # Build the whole batch in memory and emit it with one write:
+        # 8+ prints per symbol each take the stdio lock and can flush,
+        # which dominates when detailing large limits
+        lines = []
+        for i, symbol in enumerate(symbols[:limit]):
+            name = symbol.get('symbol', 'N/A')
+            lines.append(f"\n{i+1}. {name}")
+            lines.append(f"   Base: {symbol.get('baseAsset', 'N/A')}")
+            lines.append(f"   Quote: {symbol.get('quoteAsset', 'N/A')}")
+            lines.append(f"   Status: {symbol.get('status', 'N/A')}")
+            lines.append(f"   Type: {symbol.get('contractType', 'N/A')}")
+            
+            # Show filters if available (pre-partitioned by type, so no
+            # rescan of the filter list per symbol)
+            filters_by_type = filter_index.get(name, {})
+            price_filter = filters_by_type.get('PRICE_FILTER')
+            if price_filter is not None:
+                lines.append(f"   Min Price: {price_filter.get('minPrice', 'N/A')}")
+                lines.append(f"   Max Price: {price_filter.get('maxPrice', 'N/A')}")
+                lines.append(f"   Tick Size: {price_filter.get('tickSize', 'N/A')}")
+            lot_size = filters_by_type.get('LOT_SIZE')
+            if lot_size is not None:
+                lines.append(f"   Min Qty: {lot_size.get('minQty', 'N/A')}")
+                lines.append(f"   Max Qty: {lot_size.get('maxQty', 'N/A')}")
+                lines.append(f"   Step Size: {lot_size.get('stepSize', 'N/A')}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
+    def show_rate_limits(self, data=None):
+        """Show API rate limits"""
+        rate_limits = self._resolve_data(data).get('rateLimits', [])
+        print(f"\n⏱️  RATE LIMITS")
+        print("=" * 50)
+        
+        for limit in rate_limits:
+            print(f"Type: {limit.get('rateLimitType', 'N/A')}")
+            print(f"Interval: {limit.get('interval', 'N/A')}")
+            print(f"Limit: {limit.get('limit', 'N/A')}")
+            print()
+    
+    def search_symbols(self, query):
+        """Search for symbols containing the query"""
+        if not self.exchange_data:
+            self.load_exchange_data()
+            
+        q = query.upper()
+        matches = [symbol for symbol, blob in self._search_index if q in blob]
+        
+        print(f"\n🔍 SEARCH RESULTS for '{query}'")
+        print("=" * 50)
+        print(f"Found {len(matches)} matches:")
+        
+        for symbol in matches:
+            print(f"  {symbol.get('symbol', 'N/A')} ({symbol.get('baseAsset', 'N/A')}/{symbol.get('quoteAsset', 'N/A')})")
+        
+        return matches
+    
+    def batch_search(self, queries):
+        """Resolve several search queries in one pass over the index
+
+        With pyahocorasick installed, all queries are compiled into one
+        automaton and each symbol blob is streamed through it once, so
+        Q queries cost O(blob_len + matches) instead of Q substring
+        scans per symbol. Without it, falls back to one scan per query.
+        Returns {query: [matching symbol dicts]}.
+        """
+        if not self.exchange_data:
+            self.load_exchange_data()
+        
+        results = {query: [] for query in queries}
+        if not queries:
+            return results
+        
+        if ahocorasick is not None and len(queries) > 1:
+            automaton = ahocorasick.Automaton()
+            for query in queries:
+                automaton.add_word(query.upper(), query)
+            automaton.make_automaton()
+            for symbol, blob in self._search_index:
+                seen = set()
+                for _, query in automaton.iter(blob):
+                    # An automaton hit per occurrence; record each
+                    # query at most once per symbol
+                    if query not in seen:
+                        seen.add(query)
+                        results[query].append(symbol)
+        else:
+            for query in queries:
+                q = query.upper()
+                results[query] = [symbol for symbol, blob in self._search_index
+                                  if q in blob]
+        return results
+    
+    def export_symbols_to_json(self, filename="aster_symbols.json", data=None):
+        """Export all symbol data to JSON file"""
+        data = self._resolve_data(data)
+        if orjson is not None:
+            # C-level encode straight to bytes — no pure-Python indenting
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
+        print(f"✅ Exported symbol data to {filename}")
+    
+    def run_full_exploration(self):
+        """Run complete market exploration"""
+        print("🚀 ASTER MARKET DATA EXPLORER")
+        print("=" * 50)
+        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        try:
+            # Load once; every section below gets the same dict injected
+            # instead of re-checking the cache on entry
+            data = self.load_exchange_data()
+            filter_index = self._partition_filters(data.get('symbols', []))
+            
+            # Explore symbols
+            symbols, base_counts = self.explore_symbols(data)
+            
+            # Show details
+            self.show_symbol_details(limit=5, data=data, filter_index=filter_index)
+            
+            # Show rate limits
+            self.show_rate_limits(data)
+            
+            # Export data
+            self.export_symbols_to_json(data=data)
+            
+            print(f"\n✅ Exploration complete!")
+            print(f"📁 Data exported to aster_symbols.json")
+            
+        except Exception as e:
+            print(f"❌ Error during exploration: {e}")
+
+# Rendered once at import: the loop issues a single print per iteration
+# instead of rebuilding nine lines of menu text
+MENU = "\n" + "=" * 60 + """
+ASTER MARKET DATA EXPLORER
+""" + "=" * 60 + """
+1. Full exploration
+2. Show symbol overview
+3. Show symbol details
+4. Search symbols
+5. Show rate limits
+6. Export to JSON
+0. Exit"""
+
+
+def main():
+    explorer = AsterMarketExplorer()
+    
+    # Parameterized choices wrap their prompt in a closure so dispatch
+    # stays a single dict lookup
+    def show_details():
+        limit = input("How many symbols to show? (default 10): ").strip()
+        explorer.show_symbol_details(int(limit) if limit.isdigit() else 10)
+    
+    def search():
+        query = input("Enter search query: ").strip()
+        if query:
+            explorer.search_symbols(query)
+    
+    def export():
+        filename = input("Enter filename (default: aster_symbols.json): ").strip()
+        explorer.export_symbols_to_json(filename if filename else "aster_symbols.json")
+    
+    handlers = {
+        "1": explorer.run_full_exploration,
+        "2": explorer.explore_symbols,
+        "3": show_details,
+        "4": search,
+        "5": explorer.show_rate_limits,
+        "6": export,
+    }
+    
+    while True:
+        print(MENU)
+        choice = input("\nEnter your choice (0-6): ").strip()
+        
+        if choice == "0":
+            print("Goodbye!")
+            break
+        
+        handler = handlers.get(choice)
+        if handler is not None:
+            handler()
+        else:
+            print("Invalid choice. Please try again.")
+
+if __name__ == "__main__":
+    main()
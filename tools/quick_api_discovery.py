@@ -1,195 +1,268 @@
-"""
-Quick Aster API Endpoint Discovery (Non-interactive)
-"""
-
-import requests
-import json
-from datetime import datetime
-
-def quick_api_discovery():
-    """Run quick API endpoint discovery"""
-    print("QUICK ASTER API ENDPOINT DISCOVERY")
-    print("=" * 50)
-    print(f"Base URL: https://fapi.asterdex.com")
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    base_url = "https://fapi.asterdex.com"
-    discovered_endpoints = {
-        'working': [],
-        'auth_required': [],
-        'not_found': [],
-        'other_errors': []
-    }
-    
-    # Test trading endpoints
-    trading_endpoints = [
-        # Account endpoints
-        "/fapi/v1/account",
-        "/fapi/v1/balance", 
-        "/fapi/v1/positions",
-        "/fapi/v1/positionRisk",
-        
-        # Order endpoints
-        "/fapi/v1/order",
-        "/fapi/v1/openOrders",
-        "/fapi/v1/allOrders",
-        "/fapi/v1/orderBook",
-        "/fapi/v1/trades",
-        
-        # Market data endpoints
-        "/fapi/v1/ticker/24hr",
-        "/fapi/v1/ticker/price",
-        "/fapi/v1/ticker/bookTicker",
-        "/fapi/v1/klines",
-        "/fapi/v1/depth",
-        
-        # Other endpoints
-        "/fapi/v1/leverage",
-        "/fapi/v1/marginType",
-        "/fapi/v1/commissionRate",
-        "/fapi/v1/fundingRate",
-    ]
-    
-    print(f"\nTesting {len(trading_endpoints)} trading endpoints...")
-    print("-" * 50)
-    
-    for endpoint in trading_endpoints:
-        url = base_url + endpoint
-        print(f"Testing: {endpoint}")
-        
-        try:
-            response = requests.get(url, timeout=10)
-            status = response.status_code
-            
-            result = {
-                'endpoint': endpoint,
-                'status': status,
-                'url': url,
-                'content_type': response.headers.get('content-type', ''),
-                'response_size': len(response.content)
-            }
-            
-            # Try to parse JSON
-            try:
-                if 'application/json' in result['content_type']:
-                    result['json_response'] = response.json()
-                else:
-                    result['text_response'] = response.text[:100]
-            except:
-                result['text_response'] = response.text[:100]
-            
-            if status == 200:
-                print(f"  OK {status} - Working")
-                discovered_endpoints['working'].append(result)
-            elif status == 401 or status == 403:
-                print(f"  AUTH {status} - Authentication required")
-                discovered_endpoints['auth_required'].append(result)
-            elif status == 404:
-                print(f"  NOT_FOUND {status} - Not found")
-                discovered_endpoints['not_found'].append(result)
-            else:
-                print(f"  ERROR {status} - Other error")
-                discovered_endpoints['other_errors'].append(result)
-                
-        except Exception as e:
-            print(f"  EXCEPTION - {str(e)[:50]}")
-            discovered_endpoints['other_errors'].append({
-                'endpoint': endpoint,
-                'error': str(e),
-                'url': url
-            })
-    
-    # Test alternative patterns
-    print(f"\nTesting alternative endpoint patterns...")
-    print("-" * 50)
-    
-    alt_endpoints = [
-        "/api/v1/ping",
-        "/api/v2/ping",
-        "/v1/ping",
-        "/ws",
-        "/stream",
-        "/health",
-        "/status",
-        "/version"
-    ]
-    
-    for endpoint in alt_endpoints:
-        url = base_url + endpoint
-        print(f"Testing: {endpoint}")
-        
-        try:
-            response = requests.get(url, timeout=10)
-            status = response.status_code
-            
-            result = {
-                'endpoint': endpoint,
-                'status': status,
-                'url': url,
-                'content_type': response.headers.get('content-type', ''),
-                'response_size': len(response.content)
-            }
-            
-            if status == 200:
-                print(f"  OK {status} - Working")
-                discovered_endpoints['working'].append(result)
-            elif status == 401 or status == 403:
-                print(f"  AUTH {status} - Authentication required")
-                discovered_endpoints['auth_required'].append(result)
-            elif status == 404:
-                print(f"  NOT_FOUND {status} - Not found")
-                discovered_endpoints['not_found'].append(result)
-            else:
-                print(f"  ERROR {status} - Other error")
-                discovered_endpoints['other_errors'].append(result)
-                
-        except Exception as e:
-            print(f"  EXCEPTION - {str(e)[:50]}")
-    
-    # Analyze results
-    print(f"\nDISCOVERY ANALYSIS")
-    print("=" * 50)
-    
-    total_tested = (len(discovered_endpoints['working']) + 
-                   len(discovered_endpoints['auth_required']) + 
-                   len(discovered_endpoints['not_found']) + 
-                   len(discovered_endpoints['other_errors']))
-    
-    print(f"Total endpoints tested: {total_tested}")
-    print(f"Working endpoints: {len(discovered_endpoints['working'])}")
-    print(f"Auth required: {len(discovered_endpoints['auth_required'])}")
-    print(f"Not found (404): {len(discovered_endpoints['not_found'])}")
-    print(f"Other errors: {len(discovered_endpoints['other_errors'])}")
-    
-    # Show working endpoints
-    if discovered_endpoints['working']:
-        print(f"\nWORKING ENDPOINTS:")
-        for endpoint in discovered_endpoints['working']:
-            print(f"  GET {endpoint['endpoint']}")
-            if 'json_response' in endpoint:
-                response_preview = str(endpoint['json_response'])[:80]
-                print(f"    Response: {response_preview}...")
-    
-    # Show auth required endpoints
-    if discovered_endpoints['auth_required']:
-        print(f"\nAUTH REQUIRED ENDPOINTS:")
-        for endpoint in discovered_endpoints['auth_required']:
-            print(f"  GET {endpoint['endpoint']} (Status: {endpoint['status']})")
-    
-    # Export results
-    results = {
-        'timestamp': datetime.now().isoformat(),
-        'base_url': base_url,
-        'discovery_results': discovered_endpoints
-    }
-    
-    filename = "aster_api_discovery.json"
-    with open(filename, 'w') as f:
-        json.dump(results, f, indent=2)
-    print(f"\nOK Discovery results exported to {filename}")
-    
-    print(f"\nDiscovery complete!")
-    return discovered_endpoints
-
-if __name__ == "__main__":
-    quick_api_discovery()
+"""
+Quick Aster API Endpoint Discovery (Non-interactive)
+"""
+
+import requests
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # keep the dependency optional
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # async probing degrades to the thread pool
+    httpx = None
+
+# Status-code -> result bucket; anything unlisted is an 'other' error
+_STATUS_BUCKET = {
+    200: 'working',
+    401: 'auth_required',
+    403: 'auth_required',
+    404: 'not_found',
+}
+
+# Bucket -> report label printed next to the status
+_BUCKET_LABEL = {
+    'working': 'OK',
+    'auth_required': 'AUTH',
+    'not_found': 'NOT_FOUND',
+    'other_errors': 'ERROR',
+}
+
+
+def _classify(status):
+    """Map an HTTP status (or None for a transport error) to a bucket"""
+    if status is None:
+        return 'other_errors'
+    return _STATUS_BUCKET.get(status, 'other_errors')
+
+
+def _build_result(endpoint, url, status_code, headers, preview):
+    """Assemble one probe record from a bounded body preview"""
+    try:
+        size = int(headers.get('content-length', ''))
+    except ValueError:
+        size = len(preview)
+    
+    result = {
+        'endpoint': endpoint,
+        'status': status_code,
+        'url': url,
+        'content_type': headers.get('content-type', ''),
+        'response_size': size
+    }
+    
+    # Try to parse JSON (may fail on a truncated preview)
+    parsed = None
+    if 'application/json' in result['content_type']:
+        try:
+            parsed = (orjson.loads(preview) if orjson is not None
+                      else json.loads(preview))
+        except Exception:
+            parsed = None
+    if parsed is not None:
+        result['json_response'] = parsed
+    else:
+        result['text_response'] = preview[:100].decode('utf-8', 'replace')
+    
+    return result
+
+
+def _probe_all_async(base_url, endpoints):
+    """Fan every probe out through one async httpx client
+
+    With the h2 extra installed the client negotiates HTTP/2, so all
+    probes multiplex over a single TCP+TLS connection — no per-request
+    handshake or slow-start. Without h2 the probes still run
+    concurrently over a keep-alive HTTP/1.1 pool.
+    """
+    async def probe(client, endpoint):
+        url = base_url + endpoint
+        try:
+            # Stream so the preview reads at most ~4KB, matching the
+            # threaded path
+            async with client.stream('GET', url, timeout=10) as response:
+                preview = b''
+                async for chunk in response.aiter_bytes(4096):
+                    preview += chunk
+                    if len(preview) >= 4096:
+                        break
+        except Exception as e:
+            return {'endpoint': endpoint, 'error': str(e), 'url': url}, None
+        return (_build_result(endpoint, url, response.status_code,
+                              response.headers, preview),
+                response.status_code)
+    
+    async def run():
+        try:
+            client = httpx.AsyncClient(http2=True)
+        except ImportError:  # h2 extra not installed
+            client = httpx.AsyncClient()
+        async with client:
+            return await asyncio.gather(*(probe(client, e) for e in endpoints))
+    
+    return asyncio.run(run())
+
+
+def quick_api_discovery():
+    """Run quick API endpoint discovery"""
+    print("QUICK ASTER API ENDPOINT DISCOVERY")
+    print("=" * 50)
+    print(f"Base URL: https://fapi.asterdex.com")
+    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    base_url = "https://fapi.asterdex.com"
+    discovered_endpoints = {
+        'working': [],
+        'auth_required': [],
+        'not_found': [],
+        'other_errors': []
+    }
+    
+    # Test trading endpoints
+    trading_endpoints = [
+        # Account endpoints
+        "/fapi/v1/account",
+        "/fapi/v1/balance", 
+        "/fapi/v1/positions",
+        "/fapi/v1/positionRisk",
+        
+        # Order endpoints
+        "/fapi/v1/order",
+        "/fapi/v1/openOrders",
+        "/fapi/v1/allOrders",
+        "/fapi/v1/orderBook",
+        "/fapi/v1/trades",
+        
+        # Market data endpoints
+        "/fapi/v1/ticker/24hr",
+        "/fapi/v1/ticker/price",
+        "/fapi/v1/ticker/bookTicker",
+        "/fapi/v1/klines",
+        "/fapi/v1/depth",
+        
+        # Other endpoints
+        "/fapi/v1/leverage",
+        "/fapi/v1/marginType",
+        "/fapi/v1/commissionRate",
+        "/fapi/v1/fundingRate",
+    ]
+    
+    alt_endpoints = [
+        "/api/v1/ping",
+        "/api/v2/ping",
+        "/v1/ping",
+        "/ws",
+        "/stream",
+        "/health",
+        "/status",
+        "/version"
+    ]
+    
+    # One pooled session shared by every probe amortizes TCP+TLS across
+    # the whole sweep; the probes are pure I/O waits, so a thread pool
+    # turns 26 serial round-trips into a few batches
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                          max_retries=0))
+    
+    def probe(endpoint):
+        url = base_url + endpoint
+        try:
+            # Stream so the preview reads at most 4KB; .text would
+            # decode the entire body (exchangeInfo is megabytes) just
+            # to keep a 100-character slice
+            response = session.get(url, timeout=10, stream=True)
+            preview = response.raw.read(4096, decode_content=True)
+            response.close()
+        except Exception as e:
+            return {'endpoint': endpoint, 'error': str(e), 'url': url}, None
+        
+        return (_build_result(endpoint, url, response.status_code,
+                              response.headers, preview),
+                response.status_code)
+    
+    all_endpoints = trading_endpoints + alt_endpoints
+    print(f"\nTesting {len(all_endpoints)} endpoints "
+          f"({len(trading_endpoints)} trading + {len(alt_endpoints)} alternative)...")
+    print("-" * 50)
+    
+    if httpx is not None:
+        probed = _probe_all_async(base_url, all_endpoints)
+    else:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            probed = list(executor.map(probe, all_endpoints))
+    
+    # Bucket and report after the fan-out so output stays in list order
+    for result, status in probed:
+        print(f"Testing: {result['endpoint']}")
+        bucket = _classify(status)
+        if status is None:
+            print(f"  EXCEPTION - {result['error'][:50]}")
+        else:
+            print(f"  {_BUCKET_LABEL[bucket]} {status}")
+        discovered_endpoints[bucket].append(result)
+    
+    # Analyze results
+    print(f"\nDISCOVERY ANALYSIS")
+    print("=" * 50)
+    
+    total_tested = (len(discovered_endpoints['working']) + 
+                   len(discovered_endpoints['auth_required']) + 
+                   len(discovered_endpoints['not_found']) + 
+                   len(discovered_endpoints['other_errors']))
+    
+    print(f"Total endpoints tested: {total_tested}")
+    print(f"Working endpoints: {len(discovered_endpoints['working'])}")
+    print(f"Auth required: {len(discovered_endpoints['auth_required'])}")
+    print(f"Not found (404): {len(discovered_endpoints['not_found'])}")
+    print(f"Other errors: {len(discovered_endpoints['other_errors'])}")
+    
+    # Show working endpoints
+    if discovered_endpoints['working']:
+        print(f"\nWORKING ENDPOINTS:")
+        for endpoint in discovered_endpoints['working']:
+            print(f"  GET {endpoint['endpoint']}")
+            if 'json_response' in endpoint:
+                response_preview = str(endpoint['json_response'])[:80]
+                print(f"    Response: {response_preview}...")
+    
+    # Show auth required endpoints
+    if discovered_endpoints['auth_required']:
+        print(f"\nAUTH REQUIRED ENDPOINTS:")
+        for endpoint in discovered_endpoints['auth_required']:
+            print(f"  GET {endpoint['endpoint']} (Status: {endpoint['status']})")
+    
+    # Export as NDJSON: a header line plus one compact record per
+    # endpoint. Compact dumps stay on the C encoder path (the stdlib
+    # indent formatter is pure Python) and consumers can stream it with
+    # pandas.read_json(..., lines=True)
+    header = {'timestamp': datetime.now().isoformat(), 'base_url': base_url}
+    records = [{'bucket': bucket, **entry}
+               for bucket, entries in discovered_endpoints.items()
+               for entry in entries]
+    
+    filename = "aster_api_discovery.ndjson"
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE))
+            for record in records:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+    else:
+        with open(filename, 'w') as f:
+            f.write(json.dumps(header, separators=(',', ':')) + '\n')
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+    print(f"\nOK Discovery results exported to {filename}")
+    
+    print(f"\nDiscovery complete!")
+    return discovered_endpoints
+
+if __name__ == "__main__":
+    quick_api_discovery()